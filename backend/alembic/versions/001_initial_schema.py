@@ -15,8 +15,9 @@ This migration creates the complete database schema for Spanner CRM including:
 from typing import Sequence, Union
 from pathlib import Path
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
+from sqlalchemy.util import await_only
 
 
 # revision identifiers, used by Alembic
@@ -36,9 +37,19 @@ def upgrade() -> None:
     with open(sql_file_path, 'r', encoding='utf-8') as f:
         sql_statements = f.read()
 
-    # Execute the SQL
-    # We use execute with text() to handle the raw SQL properly
-    op.execute(sa.text(sql_statements))
+    if context.is_offline_mode():
+        op.execute(sql_statements)
+        return
+
+    # Hand the script straight to the driver: text() would scan the whole file for
+    # bind parameters, and asyncpg prepares every statement, which rejects
+    # multi-statement scripts. asyncpg's execute() without arguments uses the
+    # simple query protocol and runs the whole script in one round-trip.
+    bind = op.get_bind()
+    if bind.dialect.driver == "asyncpg":
+        await_only(bind.connection.driver_connection.execute(sql_statements))
+    else:
+        bind.exec_driver_sql(sql_statements)
 
 
 def downgrade() -> None:
@@ -3,6 +3,11 @@
 -- Uses UUID v4 for primary keys, TIMESTAMPTZ for all timestamps
 -- All FK columns have explicit indexes (PostgreSQL does NOT auto-index FKs)
 
+-- Migration-only tuning (scoped to this transaction): skip WAL flush waits and
+-- give index builds more memory
+SET LOCAL synchronous_commit = off;
+SET LOCAL maintenance_work_mem = '512MB';
+
 -- ============================================================================
 -- EXTENSIONS
 -- ============================================================================
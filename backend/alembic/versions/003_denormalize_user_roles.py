@@ -0,0 +1,81 @@
+"""Denormalize user roles onto users.roles
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+Adds:
+- users.roles (user_role[] NOT NULL DEFAULT '{}'), backfilled from user_roles
+- sync_user_roles_array() trigger on user_roles keeping users.roles in sync
+
+The authenticated-user lookup becomes a primary-key read of users instead of
+a LEFT JOIN + json_agg + GROUP BY over user_roles on every request.
+user_roles remains the source of truth for role assignment.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text("""
+        ALTER TABLE users
+        ADD COLUMN roles user_role[] NOT NULL DEFAULT '{}'
+    """))
+
+    # Backfill from the junction table
+    op.execute(sa.text("""
+        UPDATE users u
+        SET roles = COALESCE(
+            (SELECT array_agg(ur.role ORDER BY ur.role) FROM user_roles ur WHERE ur.user_id = u.id),
+            '{}'
+        )
+    """))
+
+    # Keep users.roles in sync with user_roles
+    op.execute(sa.text("""
+        CREATE OR REPLACE FUNCTION sync_user_roles_array()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE users
+                SET roles = COALESCE(
+                    (SELECT array_agg(role ORDER BY role) FROM user_roles WHERE user_id = OLD.user_id),
+                    '{}'
+                )
+                WHERE id = OLD.user_id;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE users
+                SET roles = COALESCE(
+                    (SELECT array_agg(role ORDER BY role) FROM user_roles WHERE user_id = NEW.user_id),
+                    '{}'
+                )
+                WHERE id = NEW.user_id;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """))
+    op.execute(sa.text("""
+        CREATE TRIGGER sync_user_roles_array
+            AFTER INSERT OR UPDATE OR DELETE ON user_roles
+            FOR EACH ROW
+            EXECUTE FUNCTION sync_user_roles_array()
+    """))
+
+
+def downgrade() -> None:
+    op.execute(sa.text('DROP TRIGGER IF EXISTS sync_user_roles_array ON user_roles'))
+    op.execute(sa.text('DROP FUNCTION IF EXISTS sync_user_roles_array'))
+    op.drop_column('users', 'roles')
@@ -0,0 +1,42 @@
+"""Replace the assignments.created_at btree with a BRIN index
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+assignments is append-only, so created_at is physically correlated with
+insertion order. A BRIN index answers time-range scans at a fraction of the
+size and insert cost of the btree. Lookups by user or entity are served by
+their own indexes.
+
+audit_logs.created_at keeps its btree: the audit list is paginated with
+ORDER BY created_at DESC LIMIT, which a BRIN index cannot serve.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text('DROP INDEX IF EXISTS idx_assignments_created_at'))
+    op.execute(sa.text('DROP INDEX IF EXISTS ix_assignments_created_at'))
+    op.create_index(
+        'ix_assignments_created_at_brin',
+        'assignments',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_assignments_created_at_brin', table_name='assignments')
+    op.execute(sa.text('CREATE INDEX idx_assignments_created_at ON assignments(created_at DESC)'))
@@ -0,0 +1,40 @@
+"""Add a covering index for the authenticated-user lookup
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+get_current_user reads id, email, name, status and roles of one user by id.
+The primary key index only holds id, so every lookup also visits the heap.
+ix_users_auth_covering INCLUDEs the remaining columns so Postgres can answer
+the query with an index-only scan once the visibility map is current.
+
+The index is built CONCURRENTLY to avoid locking users against writes, which
+requires running outside the migration transaction.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_auth_covering
+            ON users (id) INCLUDE (email, name, status, roles)
+        """))
+        # Refresh the visibility map so index-only scans kick in right away
+        op.execute(sa.text('VACUUM ANALYZE users'))
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_users_auth_covering'))
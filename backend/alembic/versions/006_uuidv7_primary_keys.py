@@ -0,0 +1,75 @@
+"""Generate time-ordered UUIDv7 primary keys
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+Adds a uuid_generate_v7() SQL function and makes it the id default of every
+UUID-keyed table. UUIDv7 keys start with a millisecond timestamp, so inserts
+append to the right edge of the primary key btree instead of splitting random
+leaf pages. That keeps the hot pages in shared_buffers and cuts full-page
+images in WAL, most visibly on append-heavy tables such as audit_logs and
+assignments.
+
+Forward-only in effect: existing rows keep their v4 ids.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UUID_TABLES = (
+    'users',
+    'segments',
+    'offerings',
+    'companies',
+    'contacts',
+    'assignments',
+    'upload_batches',
+    'audit_logs',
+    'user_preferences',
+    'notifications',
+    'marketing_collateral',
+)
+
+
+def upgrade() -> None:
+    # Overlay a 48-bit millisecond timestamp onto a v4 UUID and flip the
+    # version nibble from 4 (0100) to 7 (0111); the variant bits carry over.
+    op.execute(sa.text("""
+        CREATE OR REPLACE FUNCTION uuid_generate_v7()
+        RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+    """))
+
+    for table in UUID_TABLES:
+        op.execute(sa.text(f'ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuid_generate_v7()'))
+
+
+def downgrade() -> None:
+    for table in UUID_TABLES:
+        op.execute(sa.text(f'ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()'))
+
+    op.execute(sa.text('DROP FUNCTION IF EXISTS uuid_generate_v7()'))
@@ -0,0 +1,35 @@
+"""Add a partial index for granted role permissions
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+Permission checks read the granted (role, action) pairs only. A partial
+index on (action, role) WHERE granted holds exactly those rows, so loading
+the grants map, or probing a single action for a set of roles, is an
+index-only scan that stops at the first match.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_role_grants_lookup',
+        'role_grants',
+        ['action', 'role'],
+        postgresql_where=sa.text('granted')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_role_grants_lookup', table_name='role_grants')
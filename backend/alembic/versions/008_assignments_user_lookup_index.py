@@ -0,0 +1,44 @@
+"""Add a covering index for per-user assignment listings
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+/assignments/user/{id} and /assignments/me filter by assigned_to (and
+optionally entity_type) and page by created_at DESC. ix_assignments_user_lookup
+matches that shape and INCLUDEs the remaining selected columns, so the page is
+read with an index-only scan instead of random heap fetches.
+
+The new index has assigned_to as its leading column, so it replaces
+idx_assignments_assigned_to. Both changes run CONCURRENTLY, outside the
+migration transaction.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_assignments_user_lookup
+            ON assignments (assigned_to, entity_type, created_at DESC)
+            INCLUDE (entity_id, assigned_by, id)
+        """))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS idx_assignments_assigned_to'))
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_assignments_assigned_to ON assignments(assigned_to)'
+        ))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_assignments_user_lookup'))
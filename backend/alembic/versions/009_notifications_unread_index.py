@@ -0,0 +1,51 @@
+"""Add a partial index for the unread notification feed
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+The dominant notification query is "this user's unread notifications,
+newest first" (and its count for the badge). ix_notifications_unread indexes
+(user_id, created_at DESC) over unread rows only, so it stays small and
+serves both without a sort.
+
+It supersedes idx_notifications_user_unread (user_id, is_read WHERE unread)
+and the low-selectivity idx_notifications_is_read, which are dropped to save
+a btree update per insert. All changes run CONCURRENTLY, outside the
+migration transaction.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_unread
+            ON notifications (user_id, created_at DESC)
+            WHERE is_read = false
+        """))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS idx_notifications_user_unread'))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS idx_notifications_is_read'))
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_notifications_is_read ON notifications(is_read)'
+        ))
+        op.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_notifications_user_unread
+            ON notifications(user_id, is_read)
+            WHERE is_read = false
+        """))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_notifications_unread'))
@@ -0,0 +1,38 @@
+"""Add a functional index for case-insensitive user email lookups
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+
+Login and get_user_by_email match on lower(email), which a plain btree on
+email cannot serve. ix_users_email_lower indexes the lowered value.
+
+idx_users_email is dropped: equality lookups on the raw column are already
+served by the index backing the users_email_key unique constraint. Both
+changes run CONCURRENTLY, outside the migration transaction.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_lower ON users (lower(email))'
+        ))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS idx_users_email'))
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_email ON users(email)'))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower'))
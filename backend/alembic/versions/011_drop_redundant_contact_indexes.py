@@ -0,0 +1,50 @@
+"""Drop redundant single-column indexes on contacts
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+
+Every contact insert maintains every index on the table. These four serve no
+query that another index does not already serve:
+
+- idx_contacts_email: unique_contact_per_company (email, company_id) leads with email
+- idx_contacts_segment_id: idx_contacts_segment_status (segment_id, status) leads with segment_id
+- idx_contacts_batch_id: nothing queries contacts by upload batch
+- idx_contacts_is_duplicate: a boolean is too unselective for the planner to use
+
+company_id keeps its index: the unique constraint leads with email, so it
+cannot serve company_id lookups.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DROPPED_INDEXES = {
+    'idx_contacts_email': 'email',
+    'idx_contacts_segment_id': 'segment_id',
+    'idx_contacts_batch_id': 'batch_id',
+    'idx_contacts_is_duplicate': 'is_duplicate',
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in DROPPED_INDEXES:
+            op.execute(sa.text(f'DROP INDEX CONCURRENTLY IF EXISTS {index_name}'))
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, column in DROPPED_INDEXES.items():
+            op.execute(sa.text(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON contacts({column})'
+            ))
@@ -0,0 +1,71 @@
+"""Store low-churn status enums as CHECK-constrained TEXT
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+Native enum types need ALTER TYPE (and, for removals, a full type swap) to
+change their values, and every driver round trip has to resolve the type
+OID. These columns are converted to TEXT with a CHECK constraint listing the
+same values, so a value change is a constraint swap.
+
+Left as native enums: companies.status (referenced by the
+rejection_reason_required CHECK), users.roles (user_role[] is maintained by
+the user_roles trigger), assignments.entity_type and upload_batches.upload_type.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, enum type, allowed values, column default)
+CONVERTED_COLUMNS = [
+    ('users', 'status', 'user_status', ('active', 'deactivated'), 'active'),
+    ('segments', 'status', 'segment_status', ('active', 'archived'), 'active'),
+    ('offerings', 'status', 'offering_status', ('active', 'inactive'), 'active'),
+    ('contacts', 'status', 'contact_status',
+     ('uploaded', 'approved', 'assigned_to_sdr', 'meeting_scheduled'), 'uploaded'),
+    ('upload_batches', 'status', 'batch_status', ('processing', 'completed', 'failed'), 'processing'),
+    ('notifications', 'type', 'notification_type',
+     ('assignment', 'approval_required', 'status_change', 'upload_completed', 'system'), None),
+]
+
+
+def _quoted(values: tuple[str, ...]) -> str:
+    return ', '.join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    for table, column, type_name, values, default in CONVERTED_COLUMNS:
+        if default is not None:
+            op.execute(sa.text(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT'))
+        op.execute(sa.text(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE TEXT USING {column}::text'
+        ))
+        if default is not None:
+            op.execute(sa.text(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"))
+        op.execute(sa.text(
+            f'ALTER TABLE {table} ADD CONSTRAINT {type_name}_check CHECK ({column} IN ({_quoted(values)}))'
+        ))
+        op.execute(sa.text(f'DROP TYPE {type_name}'))
+
+
+def downgrade() -> None:
+    for table, column, type_name, values, default in reversed(CONVERTED_COLUMNS):
+        op.execute(sa.text(f'ALTER TABLE {table} DROP CONSTRAINT {type_name}_check'))
+        op.execute(sa.text(f'CREATE TYPE {type_name} AS ENUM ({_quoted(values)})'))
+        if default is not None:
+            op.execute(sa.text(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT'))
+        op.execute(sa.text(
+            f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}'
+        ))
+        if default is not None:
+            op.execute(sa.text(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"))
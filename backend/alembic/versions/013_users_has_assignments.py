@@ -0,0 +1,94 @@
+"""Track whether a user has any assignments on users.has_assignments
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+Adds:
+- users.has_assignments (BOOLEAN NOT NULL DEFAULT false), backfilled from assignments
+- sync_user_has_assignments() trigger on assignments keeping the flag in sync
+- has_assignments in the INCLUDE list of ix_users_auth_covering
+
+The flag is loaded with the authenticated user, so /assignments/me can answer
+users without assignments without querying assignments at all. The trigger
+only writes users when the flag actually flips.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text("""
+        ALTER TABLE users
+        ADD COLUMN has_assignments BOOLEAN NOT NULL DEFAULT false
+    """))
+
+    # Backfill from existing assignments
+    op.execute(sa.text("""
+        UPDATE users u
+        SET has_assignments = true
+        WHERE EXISTS (SELECT 1 FROM assignments a WHERE a.assigned_to = u.id)
+    """))
+
+    op.execute(sa.text("""
+        CREATE OR REPLACE FUNCTION sync_user_has_assignments()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE users
+                SET has_assignments = false
+                WHERE id = OLD.assigned_to
+                  AND has_assignments
+                  AND NOT EXISTS (SELECT 1 FROM assignments WHERE assigned_to = OLD.assigned_to);
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE users
+                SET has_assignments = true
+                WHERE id = NEW.assigned_to
+                  AND NOT has_assignments;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """))
+    op.execute(sa.text("""
+        CREATE TRIGGER sync_user_has_assignments
+            AFTER INSERT OR UPDATE OF assigned_to OR DELETE ON assignments
+            FOR EACH ROW
+            EXECUTE FUNCTION sync_user_has_assignments()
+    """))
+
+    # Keep the authenticated-user lookup an index-only scan
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_auth_covering_new
+            ON users (id) INCLUDE (email, name, status, roles, has_assignments)
+        """))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_users_auth_covering'))
+        op.execute(sa.text('ALTER INDEX ix_users_auth_covering_new RENAME TO ix_users_auth_covering'))
+        op.execute(sa.text('VACUUM ANALYZE users'))
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_auth_covering_old
+            ON users (id) INCLUDE (email, name, status, roles)
+        """))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_users_auth_covering'))
+        op.execute(sa.text('ALTER INDEX ix_users_auth_covering_old RENAME TO ix_users_auth_covering'))
+
+    op.execute(sa.text('DROP TRIGGER IF EXISTS sync_user_has_assignments ON assignments'))
+    op.execute(sa.text('DROP FUNCTION IF EXISTS sync_user_has_assignments'))
+    op.drop_column('users', 'has_assignments')
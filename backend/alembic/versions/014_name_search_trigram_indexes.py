@@ -0,0 +1,46 @@
+"""Add trigram indexes for segment and offering name search
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15
+
+list_segments, count_segments and list_offerings filter on name ILIKE
+'%term%'. A leading wildcard cannot use a btree, so every search was a
+sequential scan. A pg_trgm GIN index on the raw name column serves ILIKE
+directly (trigram matching is case-insensitive for ILIKE), so no lower()
+wrapping is needed on either side.
+
+The indexes are built CONCURRENTLY, outside the migration transaction.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+
+    with op.get_context().autocommit_block():
+        op.execute(sa.text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_segments_name_trgm '
+            'ON segments USING gin (name gin_trgm_ops)'
+        ))
+        op.execute(sa.text(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_offerings_name_trgm '
+            'ON offerings USING gin (name gin_trgm_ops)'
+        ))
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_offerings_name_trgm'))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_segments_name_trgm'))
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,53 @@
+"""Add full-text search vectors to segments and offerings
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-15
+
+Multi-word searches match words in any order across name and description,
+which a trigram ILIKE on name cannot express. search_vector is a stored
+generated tsvector over name and description, indexed with GIN and queried
+with plainto_tsquery. The 'simple' configuration is used because segment
+and offering names are mostly product terms and proper nouns, which
+language stemming and stop words would mangle.
+
+Adding a stored generated column rewrites the table; both tables are small
+reference data. The indexes are built CONCURRENTLY.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))"
+
+
+def upgrade() -> None:
+    for table in ("segments", "offerings"):
+        op.execute(sa.text(
+            f'ALTER TABLE {table} ADD COLUMN search_vector tsvector '
+            f'GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED'
+        ))
+
+    with op.get_context().autocommit_block():
+        for table in ("segments", "offerings"):
+            op.execute(sa.text(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_vector '
+                f'ON {table} USING gin (search_vector)'
+            ))
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in ("offerings", "segments"):
+            op.execute(sa.text(f'DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_search_vector'))
+
+    for table in ("offerings", "segments"):
+        op.execute(sa.text(f'ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector'))
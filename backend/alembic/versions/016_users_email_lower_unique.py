@@ -0,0 +1,45 @@
+"""Make the lower(email) index on users unique
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+
+Logins match on lower(email), so two accounts whose addresses differ only
+in case would make the lookup ambiguous; users_email_key only rejects exact
+duplicates. ix_users_email_lower becomes a unique index, which still serves
+the case-insensitive lookups.
+
+The unique index is built CONCURRENTLY under a temporary name and swapped
+in, so lookups stay indexed throughout. The build fails if case-variant
+duplicates already exist; those accounts must be merged first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _swap_index(unique: bool) -> None:
+    """Rebuild ix_users_email_lower concurrently, unique or not."""
+    with op.get_context().autocommit_block():
+        op.execute(sa.text(
+            f'CREATE {"UNIQUE " if unique else ""}INDEX CONCURRENTLY IF NOT EXISTS '
+            'ix_users_email_lower_new ON users (lower(email))'
+        ))
+        op.execute(sa.text('DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower'))
+        op.execute(sa.text('ALTER INDEX ix_users_email_lower_new RENAME TO ix_users_email_lower'))
+
+
+def upgrade() -> None:
+    _swap_index(unique=True)
+
+
+def downgrade() -> None:
+    _swap_index(unique=False)
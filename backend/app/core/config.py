@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,12 +8,25 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Optional read replica for read-only auth lookups; falls back to DATABASE_URL when unset
+    DATABASE_URL_REPLICA: str | None = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    # Connecting through PgBouncer (transaction pooling): PgBouncer owns the pool and
+    # server-side prepared statements can't be reused across its backends
+    DB_PGBOUNCER: bool = False
 
     # Security
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     ALGORITHM: str = "HS256"
+    # Roles that pass every require_permission check without consulting role_grants.
+    # Keep role_grants for these roles consistent with this shortcut.
+    SUPERUSER_ROLES: frozenset[str] = frozenset({"admin"})
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
@@ -28,14 +43,29 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
-        extra="ignore"
+        extra="ignore",
+        defer_build=True,
     )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins from comma-separated string."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build the settings on first use and reuse the same instance afterwards.
+
+    Call it where a setting is used. Only objects that must exist at import
+    resolve it then: the engines in app.core.database and the app in app.main.
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Keep `from app.core.config import settings` working without building settings at import."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
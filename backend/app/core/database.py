@@ -1,8 +1,45 @@
+import asyncio
+from uuid import uuid4
+from sqlalchemy import event, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from sqlalchemy.pool import NullPool
+from typing import Any, AsyncGenerator, Callable
 
-from app.core.config import settings
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Queue-pool sizing only applies to server databases (SQLite, used in tests, has no such pool)
+pool_options: dict[str, Any] = {}
+if settings.DB_PGBOUNCER:
+    # PgBouncer already pools server connections; holding a second pool here only pins them
+    pool_options = {"poolclass": NullPool}
+elif not settings.DATABASE_URL.startswith("sqlite"):
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        # Reuse the most recently returned connection so a small hot set keeps its
+        # prepared statements warm and idle overflow connections can age out
+        "pool_use_lifo": True,
+    }
+
+# Keep prepared statements for the hot, fixed-shape queries (auth lookup, grants)
+# on each pooled asyncpg connection so Postgres doesn't re-parse/plan them per request
+# (disabled behind PgBouncer, where consecutive transactions may land on different backends)
+if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    statement_cache_size = 0 if settings.DB_PGBOUNCER else settings.DB_STATEMENT_CACHE_SIZE
+    pool_options["connect_args"] = {
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": statement_cache_size,
+    }
+    if settings.DB_PGBOUNCER:
+        # asyncpg still prepares each statement under a per-connection counter name,
+        # which collides once PgBouncer hands the server connection to another client
+        pool_options["connect_args"]["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
 
 # Create async engine
 engine = create_async_engine(
@@ -10,8 +47,7 @@ engine = create_async_engine(
     echo=settings.ENVIRONMENT == "development",
     future=True,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    **pool_options,
 )
 
 # Create async session factory
@@ -23,9 +59,65 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only engine for auth lookups, routed to the replica when one is configured
+# (accepts bounded replication lag; user and grant data are cached briefly anyway)
+if settings.DATABASE_URL_REPLICA:
+    read_engine = create_async_engine(
+        settings.DATABASE_URL_REPLICA,
+        echo=settings.ENVIRONMENT == "development",
+        future=True,
+        pool_pre_ping=True,
+        **pool_options,
+    )
+else:
+    read_engine = engine
+
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 # Create declarative base
 Base = declarative_base()
 
+# SQLSTATE for unique_violation
+UNIQUE_VIOLATION = "23505"
+
+
+def unique_violation_constraint(error: IntegrityError) -> str | None:
+    """
+    Return the constraint behind a unique violation, read from the driver's error fields.
+
+    Args:
+        error: IntegrityError raised by SQLAlchemy
+
+    Returns:
+        Constraint name if the error is a unique violation reported by asyncpg, None otherwise
+    """
+    if getattr(error.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+        return None
+
+    # SQLAlchemy's asyncpg adapter chains the original asyncpg exception, which carries the name
+    return getattr(error.orig.__cause__, "constraint_name", None)
+
+
+def after_commit(db: AsyncSession, callback: Callable[..., None], *args: Any) -> None:
+    """
+    Run a callback once the session's transaction commits.
+
+    Used for dropping in-process cache entries: doing so before the commit
+    lets a concurrent request refill the cache from the pre-change rows.
+
+    Args:
+        db: Session whose commit to wait for
+        callback: Function to call after the commit
+        *args: Arguments for callback
+    """
+    event.listen(db.sync_session, "after_commit", lambda session: callback(*args), once=True)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -43,3 +135,57 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_db_read() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting read-only async database sessions.
+
+    Uses the read replica when DATABASE_URL_REPLICA is set, otherwise the
+    primary. Nothing is committed; the transaction is always rolled back.
+
+    Yields:
+        AsyncSession: Database session
+    """
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+
+async def warm_pool() -> None:
+    """
+    Open the steady-state number of pooled connections up front.
+
+    Checks out DB_POOL_SIZE connections concurrently (each running SELECT 1) and
+    returns them to the pool, so the first requests after startup don't pay the
+    connection handshake. The replica pool, when configured, is warmed as well,
+    since every authenticated request starts with a read session.
+    """
+    if not pool_options or settings.DB_PGBOUNCER:
+        return
+
+    engines = [engine] if read_engine is engine else [engine, read_engine]
+    connections = await asyncio.gather(
+        *(pool_engine.connect().start() for pool_engine in engines for _ in range(settings.DB_POOL_SIZE))
+    )
+    try:
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in connections))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in connections))
+
+
+def pool_status() -> dict[str, str]:
+    """
+    Describe the current state of the connection pools.
+
+    Returns:
+        Mapping of pool name ("primary", and "replica" when configured) to
+        SQLAlchemy's pool status line (size, checked in/out, overflow)
+    """
+    status = {"primary": engine.pool.status()}
+    if read_engine is not engine:
+        status["replica"] = read_engine.pool.status()
+    return status
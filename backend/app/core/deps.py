@@ -2,17 +2,18 @@
 FastAPI dependency injection utilities for authentication and authorization.
 """
 
+from functools import cache
 from typing import Callable
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text
 
-from app.core.database import get_db
-from app.core.security import decode_token
+from app.core import rbac, user_cache
+from app.core.config import get_settings
+from app.core.database import get_db_read
+from app.core.security import JWTError, decode_token_cached_async
 
 # OAuth2 scheme for token extraction from Authorization header
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/v1/auth/login")
@@ -20,20 +21,22 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/v1/auth/login")
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ) -> dict:
     """
-    Extract and validate current user from JWT token.
+    Extract and validate current user from JWT token, and verify the user is active.
 
     Args:
         token: JWT access token from Authorization header
         db: Database session
 
     Returns:
-        User dictionary with id, email, name, status, and roles
+        User dictionary with id (already parsed to UUID), email, name, status, roles,
+        and has_assignments
 
     Raises:
-        HTTPException: 401 if token is invalid or user not found
+        HTTPException: 401 if token is invalid or user not found,
+            403 if user is deactivated
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -42,7 +45,7 @@ async def get_current_user(
     )
 
     try:
-        payload = decode_token(token)
+        payload = await decode_token_cached_async(token)
         user_id_str: str | None = payload.get("sub")
 
         if user_id_str is None:
@@ -66,61 +69,35 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    # Fetch user from database with roles
-    query = text("""
-        SELECT
-            u.id,
-            u.email,
-            u.name,
-            u.status,
-            COALESCE(
-                json_agg(ur.role) FILTER (WHERE ur.role IS NOT NULL),
-                '[]'::json
-            ) as roles
-        FROM users u
-        LEFT JOIN user_roles ur ON u.id = ur.user_id
-        WHERE u.id = :user_id
-        GROUP BY u.id, u.email, u.name, u.status
-    """)
-
-    result = await db.execute(query, {"user_id": user_id})
-    user_row = result.fetchone()
-
-    if user_row is None:
+    # Fetch user with roles (cached for a few seconds per user)
+    user = await user_cache.get_user(db, user_id)
+    # Hand the read connection back before the endpoint's own session checks one
+    # out (without a replica both come from the same pool)
+    await db.close()
+
+    if user is None:
         raise credentials_exception
 
-    user = {
-        "id": str(user_row[0]),
-        "email": user_row[1],
-        "name": user_row[2],
-        "status": user_row[3],
-        "roles": user_row[4] if user_row[4] else []
-    }
+    if user["status"] != "active":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is deactivated"
+        )
 
     return user
 
 
-async def get_current_active_user(
-    current_user: dict = Depends(get_current_user)
-) -> dict:
-    """
-    Verify that current user is active (not deactivated).
+# Backwards-compatible name: get_current_user already rejects deactivated users
+get_current_active_user = get_current_user
 
-    Args:
-        current_user: User dictionary from get_current_user dependency
 
-    Returns:
-        User dictionary if active
-
-    Raises:
-        HTTPException: 403 if user is deactivated
-    """
-    if current_user["status"] != "active":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="User account is deactivated"
-        )
-    return current_user
+def _user_role_set(current_user: dict) -> frozenset[str]:
+    """Return the user's roles as a frozenset, memoized on the user dict for this request."""
+    role_set = current_user.get("_roles_set")
+    if role_set is None:
+        role_set = frozenset(current_user.get("roles", ()))
+        current_user["_roles_set"] = role_set
+    return role_set
 
 
 def require_roles(*required_roles: str) -> Callable:
@@ -138,14 +115,26 @@ def require_roles(*required_roles: str) -> Callable:
         async def admin_endpoint():
             pass
     """
-    async def role_checker(current_user: dict = Depends(get_current_active_user)) -> dict:
-        user_roles = current_user.get("roles", [])
+    return _role_checker(frozenset(required_roles))
+
 
+@cache
+def _role_checker(required: frozenset[str]) -> Callable:
+    """
+    Build the dependency for require_roles, once per distinct set of roles.
+
+    Returning the same callable for the same roles (in any order) lets FastAPI's
+    per-request dependency cache run the check once even when it is declared
+    on both a router and its endpoints.
+    """
+    detail = f"Insufficient permissions. Required roles: {', '.join(sorted(required))}"
+
+    async def role_checker(current_user: dict = Depends(get_current_user)) -> dict:
         # Check if user has at least one of the required roles
-        if not any(role in user_roles for role in required_roles):
+        if required.isdisjoint(_user_role_set(current_user)):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions. Required roles: {', '.join(required_roles)}"
+                detail=detail
             )
 
         return current_user
@@ -153,11 +142,16 @@ def require_roles(*required_roles: str) -> Callable:
     return role_checker
 
 
+@cache
 def require_permission(action: str) -> Callable:
     """
     Factory function that creates a dependency to check if user's roles have a specific permission.
 
-    Checks the role_grants table to verify the user has at least one role with the required action granted.
+    Returns the same dependency for the same action, so FastAPI runs it once per request.
+
+    Checks the cached role_grants map to verify the user has at least one role with the required action granted.
+    Users holding any of settings.SUPERUSER_ROLES (default: admin) are allowed without a lookup, so
+    role_grants for those roles must be kept consistent with this shortcut.
 
     Args:
         action: Permission action string (e.g., 'approve_company', 'manage_users')
@@ -171,10 +165,10 @@ def require_permission(action: str) -> Callable:
             pass
     """
     async def permission_checker(
-        current_user: dict = Depends(get_current_active_user),
-        db: AsyncSession = Depends(get_db)
+        current_user: dict = Depends(get_current_user),
+        db: AsyncSession = Depends(get_db_read)
     ) -> dict:
-        user_roles = current_user.get("roles", [])
+        user_roles = _user_role_set(current_user)
 
         if not user_roles:
             raise HTTPException(
@@ -182,19 +176,14 @@ def require_permission(action: str) -> Callable:
                 detail=f"Insufficient permissions. Required action: {action}"
             )
 
-        # Check if any of the user's roles have the required permission
-        query = text("""
-            SELECT COUNT(*)
-            FROM role_grants
-            WHERE role = ANY(:roles::user_role[])
-            AND action = :action
-            AND granted = true
-        """)
-
-        result = await db.execute(query, {"roles": user_roles, "action": action})
-        count = result.scalar()
+        # Superuser roles pass every permission check
+        if not user_roles.isdisjoint(get_settings().SUPERUSER_ROLES):
+            return current_user
 
-        if count == 0:
+        # Check the user's roles against the in-memory grants map (no per-request query)
+        allowed = await rbac.has_permission(db, user_roles, action)
+        await db.close()
+        if not allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. Required action: {action}"
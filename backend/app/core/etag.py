@@ -0,0 +1,70 @@
+"""
+HTTP conditional GET helpers (ETag / If-None-Match).
+
+Polling clients re-request the same resources repeatedly. Endpoints derive a
+cheap validator from data they already load (timestamps, counts); when it
+matches the client's If-None-Match, a bodyless 304 is returned and the
+response is never serialized.
+"""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a strong ETag from the values that determine a response.
+
+    Args:
+        *parts: Values identifying the response version (e.g. updated_at, counts)
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(),
+        digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+
+    Weak comparison is used, as RFC 9110 requires for If-None-Match.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def not_modified(etag: str, headers: dict[str, str] | None = None) -> Response:
+    """
+    Build a bodyless 304 response carrying the current ETag.
+
+    Args:
+        etag: Current ETag of the resource
+        headers: Extra headers the 200 response would carry (e.g. Cache-Control)
+
+    Returns:
+        304 Not Modified response
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={**(headers or {}), "ETag": etag}
+    )
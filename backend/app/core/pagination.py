@@ -0,0 +1,180 @@
+"""
+Keyset (cursor) pagination helpers.
+
+OFFSET pagination makes Postgres read and discard every skipped row, so deep
+pages get linearly slower. A keyset cursor records the (created_at, id) of
+the last row served; the next page seeks past it through the created_at
+index instead.
+"""
+
+import base64
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import ColumnElement, FunctionElement, Select, and_, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.base import ExecutableOption
+
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Query parameter description for endpoints accepting ?after=
+AFTER_DESCRIPTION = f"Keyset cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Encode the position of a row as an opaque cursor.
+
+    Args:
+        created_at: created_at of the last row served
+        row_id: id of the last row served
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous response
+
+    Returns:
+        Tuple of (created_at, id) of the last row served
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def parse_cursor_param(after: str | None) -> tuple[datetime, UUID] | None:
+    """
+    Decode an ?after= cursor query parameter.
+
+    Args:
+        after: Cursor string, or None when not given
+
+    Returns:
+        Decoded cursor (created_at, id), or None when not given
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    if after is None:
+        return None
+
+    try:
+        return decode_cursor(after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+def set_next_cursor(response: Response, rows: Sequence[Any], limit: int) -> None:
+    """
+    Advertise the cursor for the next page when this page is full.
+
+    Args:
+        response: Response to set the NEXT_CURSOR_HEADER header on
+        rows: Rows served in this page, in (created_at DESC, id DESC) order
+        limit: Page size that was requested
+    """
+    if len(rows) == limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+
+
+def before_cursor(
+    created_at_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: tuple[datetime, UUID]
+) -> ColumnElement[bool]:
+    """
+    Build the condition selecting rows after a cursor in (created_at DESC, id DESC) order.
+
+    Spelled out instead of a row-value comparison so a single-column
+    created_at index can still be used for the seek.
+
+    Args:
+        created_at_column: Model's created_at column
+        id_column: Model's id column
+        cursor: Decoded cursor (created_at, id)
+
+    Returns:
+        SQL boolean expression
+    """
+    created_at, row_id = cursor
+    return and_(
+        created_at_column <= created_at,
+        or_(created_at_column < created_at, id_column < row_id)
+    )
+
+
+async def paginate_with_total(
+    db: AsyncSession,
+    query: Select,
+    skip: int,
+    limit: int,
+    *aggregates: FunctionElement,
+    options: Sequence[ExecutableOption] = ()
+) -> tuple[list[Any], int, tuple]:
+    """
+    Fetch one OFFSET page of a query's entities together with the total match count.
+
+    The total (and any extra aggregates over all matches) is attached to every
+    row with window aggregates, so the page and the count come back in a
+    single query. Only a page past the end (which has no rows to carry them)
+    needs a separate aggregate query.
+
+    Args:
+        db: Database session
+        query: Filtered and ordered single-entity query, without pagination
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        *aggregates: Extra aggregates over all matches (e.g. func.max(Model.updated_at))
+        options: Loader options for the page's entities
+
+    Returns:
+        Tuple of (entities on the page, total count, aggregate values in
+        order, each None when nothing matches)
+    """
+    page = (
+        query
+        .add_columns(func.count().over(), *(aggregate.over() for aggregate in aggregates))
+        .options(*options)
+        .offset(skip)
+        .limit(limit)
+    )
+
+    result = await db.execute(page)
+    rows = result.all()
+
+    if rows:
+        return [row[0] for row in rows], rows[0][1], tuple(rows[0][2:])
+
+    if skip == 0:
+        return [], 0, (None,) * len(aggregates)
+
+    count_query = query.with_only_columns(
+        func.count(), *aggregates, maintain_column_froms=True
+    ).order_by(None)
+    result = await db.execute(count_query)
+    total, *values = result.one()
+    return [], total, tuple(values)
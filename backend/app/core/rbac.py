@@ -0,0 +1,101 @@
+"""
+In-process cache of role permission grants.
+
+The role_grants table changes rarely, so the granted actions per role are
+loaded once (at startup and then at most every REFRESH_SECONDS) instead of
+being queried on every permission check.
+"""
+
+import time
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# How long a loaded grants map is trusted before it is reloaded
+REFRESH_SECONDS = 60
+
+_GRANTS_QUERY = text("""
+    SELECT role, action
+    FROM role_grants
+    WHERE granted = true
+""")
+
+_role_perms: dict[str, frozenset[str]] = {}
+_loaded_at: float | None = None
+
+
+async def load_role_permissions(db: AsyncSession) -> dict[str, frozenset[str]]:
+    """
+    Load all granted actions per role from the database into the cache.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Mapping of role name to the frozenset of granted actions
+    """
+    global _role_perms, _loaded_at
+
+    result = await db.execute(_GRANTS_QUERY)
+
+    grants: dict[str, set[str]] = {}
+    for role, action in result.fetchall():
+        grants.setdefault(str(role), set()).add(action)
+
+    _role_perms = {role: frozenset(actions) for role, actions in grants.items()}
+    _loaded_at = time.monotonic()
+
+    return _role_perms
+
+
+async def get_role_permissions(db: AsyncSession) -> dict[str, frozenset[str]]:
+    """
+    Return the cached grants map, reloading it if it is missing or stale.
+
+    Args:
+        db: Database session (only used when a reload is needed)
+
+    Returns:
+        Mapping of role name to the frozenset of granted actions
+    """
+    if _loaded_at is None or time.monotonic() - _loaded_at > REFRESH_SECONDS:
+        return await load_role_permissions(db)
+    return _role_perms
+
+
+async def has_permission(db: AsyncSession, roles: Iterable[str], action: str) -> bool:
+    """
+    Check whether any of the given roles is granted an action.
+
+    Args:
+        db: Database session (only used when the grants map needs a reload)
+        roles: Role names held by the user
+        action: Permission action string
+
+    Returns:
+        True if at least one role has the action granted
+    """
+    role_perms = await get_role_permissions(db)
+    return any(action in role_perms.get(role, ()) for role in roles)
+
+
+async def permissions_for_roles(db: AsyncSession, roles: Iterable[str]) -> frozenset[str]:
+    """
+    Collect every action granted to any of the given roles.
+
+    Args:
+        db: Database session (only used when the grants map needs a reload)
+        roles: Role names held by the user
+
+    Returns:
+        Frozenset of granted action strings
+    """
+    role_perms = await get_role_permissions(db)
+    return frozenset().union(*(role_perms.get(role, ()) for role in roles))
+
+
+def invalidate() -> None:
+    """Force the next permission check to reload grants from the database."""
+    global _loaded_at
+    _loaded_at = None
@@ -2,43 +2,98 @@
 Security utilities for password hashing and JWT token management.
 """
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import threading
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
-from jose import JWTError, jwt
+from cachetools import TTLCache
+import jwt
+from jwt.exceptions import InvalidTokenError as JWTError
 from passlib.context import CryptContext
 
-from app.core.config import settings
+from app.core.config import get_settings
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: argon2id for new hashes, bcrypt still verified (and upgraded on login)
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+    argon2__parallelism=1,
+)
+
+# Recently successful password verifications, keyed by a keyed digest of (password, hash)
+_verify_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Verified token payloads keyed by a digest of the raw token (raw JWTs are never retained)
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_token_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _verify_cache_key() -> bytes:
+    """Derive the key for _verify_cache digests from SECRET_KEY, once."""
+    return hashlib.blake2b(get_settings().SECRET_KEY.encode(), digest_size=32).digest()
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a plain-text password using bcrypt.
+    Hash a plain-text password using argon2id.
 
     Args:
         password: Plain-text password to hash
 
     Returns:
-        Bcrypt password hash
+        Argon2id password hash
     """
     return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a plain-text password against a bcrypt hash.
+    Verify a plain-text password against an argon2id or bcrypt hash.
+
+    Successful verifications are memoized briefly so a burst of re-authentication
+    from one client does not rehash every time. Failures are never memoized.
 
     Args:
         plain_password: Plain-text password to verify
-        hashed_password: Bcrypt hash to verify against
+        hashed_password: Password hash to verify against
 
     Returns:
         True if password matches hash, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    key = hashlib.blake2b(
+        plain_password.encode() + b"\x00" + hashed_password.encode(),
+        key=_verify_cache_key(),
+        digest_size=16,
+    ).digest()
+
+    if key in _verify_cache:
+        return True
+
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False
+
+    _verify_cache[key] = True
+    return True
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash uses a deprecated scheme or outdated parameters.
+
+    Args:
+        hashed_password: Stored password hash
+
+    Returns:
+        True if the password should be rehashed with the current policy
+    """
+    return pwd_context.needs_update(hashed_password)
 
 
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
@@ -52,12 +107,14 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
     Returns:
         Encoded JWT token string
     """
+    settings = get_settings()
     to_encode = data.copy()
 
+    # "exp" is issued as an integer NumericDate
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
     to_encode.update({"exp": expire, "type": "access"})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
@@ -74,8 +131,9 @@ def create_refresh_token(data: dict[str, Any]) -> str:
     Returns:
         Encoded JWT refresh token string
     """
+    settings = get_settings()
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int(time.time()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
     to_encode.update({"exp": expire, "type": "refresh"})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
@@ -94,8 +152,110 @@ def decode_token(token: str) -> dict[str, Any]:
     Raises:
         JWTError: If token is invalid, expired, or malformed
     """
+    settings = get_settings()
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+            options={"require": ["exp", "sub", "type"]},
+        )
         return payload
     except JWTError as e:
         raise JWTError(f"Could not validate credentials: {str(e)}")
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Derive a compact cache key for a token without keeping the token itself."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _get_cached_payload(key: bytes) -> dict[str, Any] | None:
+    """Return a cached payload that has not yet expired, evicting it if it has."""
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+        if payload is not None and payload.get("exp", 0) <= time.time():
+            _token_cache.pop(key, None)
+            payload = None
+
+    return payload
+
+
+def _store_payload(key: bytes, payload: dict[str, Any]) -> None:
+    """Cache a successfully verified payload."""
+    with _token_cache_lock:
+        _token_cache[key] = payload
+
+
+def decode_token_cached(token: str) -> dict[str, Any]:
+    """
+    Decode and verify a JWT token, reusing recently verified payloads.
+
+    Repeated requests with the same bearer token skip signature verification
+    for up to a minute, but never beyond the token's own expiry.
+
+    Args:
+        token: JWT token string to decode
+
+    Returns:
+        Decoded token payload as dictionary
+
+    Raises:
+        JWTError: If token is invalid, expired, or malformed
+    """
+    key = _token_cache_key(token)
+
+    payload = _get_cached_payload(key)
+    if payload is not None:
+        return payload
+
+    # Failures are never cached; they raise straight through
+    payload = decode_token(token)
+    _store_payload(key, payload)
+
+    return payload
+
+
+async def decode_token_cached_async(token: str) -> dict[str, Any]:
+    """
+    Async variant of decode_token_cached for request handlers.
+
+    With an asymmetric ALGORITHM (RS*/ES*/PS*/EdDSA) a cache miss verifies the
+    signature in a worker thread so it does not stall the event loop. HMAC
+    verification takes microseconds, less than a thread hand-off, so it
+    stays inline.
+
+    Args:
+        token: JWT token string to decode
+
+    Returns:
+        Decoded token payload as dictionary
+
+    Raises:
+        JWTError: If token is invalid, expired, or malformed
+    """
+    key = _token_cache_key(token)
+
+    payload = _get_cached_payload(key)
+    if payload is not None:
+        return payload
+
+    # Asymmetric signature checks are slow enough to be worth moving off the event loop
+    if not get_settings().ALGORITHM.startswith("HS"):
+        payload = await asyncio.to_thread(decode_token, token)
+    else:
+        payload = decode_token(token)
+    _store_payload(key, payload)
+
+    return payload
+
+
+def drop_cached_token(token: str) -> None:
+    """
+    Evict a token from the verification cache (e.g. on logout).
+
+    Args:
+        token: JWT token string to evict
+    """
+    with _token_cache_lock:
+        _token_cache.pop(_token_cache_key(token), None)
@@ -0,0 +1,68 @@
+"""
+Short-lived cache of the authenticated user lookup.
+
+Every authenticated request resolves the user and their roles. Those rarely
+change, so the result is kept in-process for a few seconds and explicitly
+invalidated whenever a user's status or roles are mutated.
+"""
+
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# User dictionaries keyed by user_id
+_user_cache: TTLCache = TTLCache(maxsize=50_000, ttl=30)
+
+# users.roles is kept in sync with user_roles by trigger, so no join/aggregation is needed
+_USER_QUERY = text("""
+    SELECT id, email, name, status, roles, has_assignments
+    FROM users
+    WHERE id = :user_id
+""")
+
+
+async def get_user(db: AsyncSession, user_id: UUID) -> dict | None:
+    """
+    Fetch a user with roles, serving from cache when possible.
+
+    Args:
+        db: Database session (only used on a cache miss)
+        user_id: User UUID
+
+    Returns:
+        User dictionary with id (as UUID), email, name, status, roles, and has_assignments,
+        or None if not found
+    """
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return dict(user)
+
+    result = await db.execute(_USER_QUERY, {"user_id": user_id})
+    user_row = result.fetchone()
+
+    if user_row is None:
+        return None
+
+    user = {
+        "id": user_id,
+        "email": user_row[1],
+        "name": user_row[2],
+        "status": user_row[3],
+        "roles": list(user_row[4]) if user_row[4] else [],
+        "has_assignments": bool(user_row[5])
+    }
+    _user_cache[user_id] = user
+
+    return dict(user)
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """
+    Drop a cached user so the next request reloads it from the database.
+
+    Args:
+        user_id: User UUID
+    """
+    _user_cache.pop(user_id, None)
@@ -1,15 +1,20 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
-from app.core.config import settings
-from app.core.database import engine
+from app.core import rbac
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal, engine, pool_status, warm_pool
+from app.core.deps import require_roles
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.routers import api_router
 
+settings = get_settings()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO if settings.ENVIRONMENT == "development" else logging.WARNING,
@@ -24,10 +29,25 @@ async def lifespan(app: FastAPI):
     Lifespan context manager for startup and shutdown events.
     """
     # Startup
-    logger.info(f"Starting {settings.PROJECT_NAME} v{settings.VERSION}")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
+    logger.info("Starting %s v%s", settings.PROJECT_NAME, settings.VERSION)
+    logger.info("Environment: %s", settings.ENVIRONMENT)
     logger.info("Database connection pool created")
 
+    # Pre-open pooled connections; requests fall back to connecting on demand if this fails
+    try:
+        await warm_pool()
+        logger.info("Database connection pool warmed (%s connections)", settings.DB_POOL_SIZE)
+    except (SQLAlchemyError, OSError) as e:
+        logger.warning("Could not warm database connection pool: %s", e)
+
+    # Warm the role permission cache; permission checks reload it lazily if this fails
+    try:
+        async with AsyncSessionLocal() as session:
+            role_perms = await rbac.load_role_permissions(session)
+        logger.info("Loaded role grants for %s roles", len(role_perms))
+    except SQLAlchemyError as e:
+        logger.warning("Could not preload role grants: %s", e)
+
     yield
 
     # Shutdown
@@ -42,6 +62,7 @@ app = FastAPI(
     version=settings.VERSION,
     description="A comprehensive CRM system for managing business operations",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.ENVIRONMENT == "development" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT == "development" else None,
 )
@@ -53,6 +74,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 
@@ -60,7 +82,7 @@ app.add_middleware(
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors."""
-    logger.warning(f"Validation error: {exc.errors()}")
+    logger.warning("Validation error: %s", exc.errors())
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
@@ -73,7 +95,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(SQLAlchemyError)
 async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
     """Handle database errors."""
-    logger.error(f"Database error: {str(exc)}")
+    logger.error("Database error: %s", exc)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -86,7 +108,7 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions."""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -110,6 +132,16 @@ async def health_check():
     }
 
 
+@app.get("/api/health/pool", tags=["Health"], dependencies=[Depends(require_roles("admin"))])
+async def pool_health_check():
+    """
+    Report database connection pool usage (checked-out and overflow connections).
+
+    Requires admin role.
+    """
+    return pool_status()
+
+
 # Include API routers
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
@@ -3,15 +3,16 @@ import enum
 import uuid
 
 from sqlalchemy import (
-    Enum as SAEnum,
     ForeignKey,
+    Index,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, UUIDPKMixin
+from app.models.base import Base, UUIDPKMixin, pg_enum
 from datetime import datetime
 from sqlalchemy import DateTime
 
@@ -30,7 +31,7 @@ class Assignment(Base, UUIDPKMixin):
     __tablename__ = "assignments"
 
     entity_type: Mapped[EntityTypeEnum] = mapped_column(
-        SAEnum(EntityTypeEnum, name="entity_type", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        pg_enum(EntityTypeEnum, "entity_type"),
         nullable=False
     )
     # Note: entity_id has no FK constraint (polymorphic relationship)
@@ -41,8 +42,7 @@ class Assignment(Base, UUIDPKMixin):
     assigned_to: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     assigned_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -53,21 +53,22 @@ class Assignment(Base, UUIDPKMixin):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
-        server_default="now()",
-        index=True
+        server_default="now()"
     )
 
-    # Relationships
+    # Relationships (never lazy-loaded: list endpoints must eager-load them explicitly,
+    # so an accidental per-row SELECT fails loudly instead of becoming an N+1)
     assigned_to_user: Mapped["User"] = relationship(
         "User",
         back_populates="assignments_received",
-        foreign_keys=[assigned_to]
+        foreign_keys=[assigned_to],
+        lazy="raise_on_sql"
     )
     assigned_by_user: Mapped["User"] = relationship(
         "User",
         back_populates="assignments_made",
-        foreign_keys=[assigned_by]
+        foreign_keys=[assigned_by],
+        lazy="raise_on_sql"
     )
 
     __table_args__ = (
@@ -77,6 +78,21 @@ class Assignment(Base, UUIDPKMixin):
             "assigned_to",
             name="unique_assignment"
         ),
+        # Append-only, time-correlated column: BRIN is tiny and cheap to maintain for range scans
+        Index(
+            "ix_assignments_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+        # Serves the paginated per-user listing as an index-only scan (also covers assigned_to lookups)
+        Index(
+            "ix_assignments_user_lookup",
+            "assigned_to",
+            "entity_type",
+            text("created_at DESC"),
+            postgresql_include=["entity_id", "assigned_by", "id"]
+        ),
     )
 
     def __repr__(self) -> str:
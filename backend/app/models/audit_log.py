@@ -34,7 +34,6 @@ class AuditLog(Base, UUIDPKMixin):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
         server_default="now()",
         index=True
     )
@@ -1,9 +1,14 @@
 """Base model with common mixins and utilities."""
+import enum
+import os
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import CheckConstraint, Column, DateTime, Enum as SAEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase
 
@@ -14,6 +19,59 @@ from app.core.database import Base as _Base
 Base = _Base
 
 
+@lru_cache(maxsize=None)
+def _enum_values(enum_cls: type[enum.Enum]) -> list[str]:
+    """Return the member values of an enum class (computed once per class)."""
+    return [member.value for member in enum_cls]
+
+
+def pg_enum(enum_cls: type[enum.Enum], name: str) -> SAEnum:
+    """
+    Build a column type for an existing PostgreSQL enum.
+
+    Args:
+        enum_cls: Python enum whose values mirror the database enum labels
+        name: Name of the PostgreSQL enum type (created by migrations)
+
+    Returns:
+        SQLAlchemy Enum type persisting member values rather than names
+    """
+    return SAEnum(enum_cls, name=name, create_type=False, values_callable=_enum_values)
+
+
+def text_enum(enum_cls: type[enum.Enum]) -> SAEnum:
+    """
+    Build a column type for an enum stored as plain TEXT.
+
+    Values are validated by a CHECK constraint (see enum_check) instead of a
+    PostgreSQL enum type, so adding a value is a constraint swap rather than
+    ALTER TYPE. Rows still hydrate to enum members.
+
+    Args:
+        enum_cls: Python enum whose values are the allowed column values
+
+    Returns:
+        SQLAlchemy Enum type backed by a string column
+    """
+    return SAEnum(enum_cls, native_enum=False, create_constraint=False, values_callable=_enum_values)
+
+
+def enum_check(column: str, enum_cls: type[enum.Enum], name: str) -> CheckConstraint:
+    """
+    Build the CHECK constraint restricting a text_enum column to the enum's values.
+
+    Args:
+        column: Column name
+        enum_cls: Python enum whose values are allowed
+        name: Constraint name (matches the migration)
+
+    Returns:
+        CHECK constraint for __table_args__
+    """
+    allowed = ", ".join(f"'{value}'" for value in _enum_values(enum_cls))
+    return CheckConstraint(f"{column} IN ({allowed})", name=name)
+
+
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
 
@@ -32,14 +90,55 @@ class TimestampMixin:
     )
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so new keys
+    land at the right edge of the primary key btree instead of at random
+    leaf pages. Matches the uuid_generate_v7() server default.
+
+    Returns:
+        A new UUIDv7
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 68) << 64
+        | 0b10 << 62
+        | rand & ((1 << 62) - 1)
+    )
+    return uuid.UUID(int=value)
+
+
+def uuid7_sequence(count: int) -> list[uuid.UUID]:
+    """
+    Generate UUIDv7s that sort in the order they are generated.
+
+    All share one uuid7()'s timestamp and random bits, with the low 32 bits
+    of the random field replaced by a counter, so rows created together
+    (e.g. by one upload, which also share created_at) keep their order.
+
+    Args:
+        count: Number of ids (at most 2**32)
+
+    Returns:
+        List of count increasing UUIDv7s
+    """
+    first = uuid7().int & ~0xFFFF_FFFF
+    return [uuid.UUID(int=first + offset) for offset in range(count)]
+
+
 class UUIDPKMixin:
-    """Mixin for UUID primary key."""
+    """Mixin for time-ordered UUID primary key."""
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default="gen_random_uuid()"
+        default=uuid7,
+        server_default="uuid_generate_v7()"
     )
 
 
@@ -50,7 +149,25 @@ class BaseModel(Base, UUIDPKMixin, TimestampMixin):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert model to dictionary."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        names, getter = _column_getter(type(self))
+        return dict(zip(names, getter(self)))
+
+
+def _column_getter(cls: type) -> tuple[tuple[str, ...], Callable[[Any], tuple]]:
+    """
+    Return the column names of a mapped class and a getter fetching them all at once.
+
+    Built on first use per class (the table only exists once declarative
+    mapping has finished) and stored on the class itself.
+    """
+    cached = cls.__dict__.get("_column_getter_cache")
+    if cached is None:
+        names = tuple(column.name for column in cls.__table__.columns)
+        getter = attrgetter(*names)
+        if len(names) == 1:
+            # attrgetter with a single name returns a bare value rather than a tuple
+            single = getter
+            getter = lambda obj: (single(obj),)
+        cached = (names, getter)
+        cls._column_getter_cache = cached
+    return cached
@@ -6,7 +6,6 @@ from datetime import datetime
 from sqlalchemy import (
     Boolean,
     DateTime,
-    Enum as SAEnum,
     ForeignKey,
     Integer,
     Text,
@@ -15,7 +14,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, pg_enum
 
 
 class CompanyStatusEnum(str, enum.Enum):
@@ -60,7 +59,7 @@ class Company(BaseModel):
         index=True
     )
     status: Mapped[CompanyStatusEnum] = mapped_column(
-        SAEnum(CompanyStatusEnum, name="company_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        pg_enum(CompanyStatusEnum, "company_status"),
         nullable=False,
         default=CompanyStatusEnum.PENDING,
         server_default="pending",
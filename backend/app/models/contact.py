@@ -6,15 +6,15 @@ from datetime import datetime
 from sqlalchemy import (
     Boolean,
     DateTime,
-    Enum as SAEnum,
     ForeignKey,
+    Index,
     Text,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, enum_check, text_enum
 
 
 class ContactStatusEnum(str, enum.Enum):
@@ -34,7 +34,8 @@ class Contact(BaseModel):
     # Contact identity
     first_name: Mapped[str] = mapped_column(Text, nullable=False)
     last_name: Mapped[str] = mapped_column(Text, nullable=False)
-    email: Mapped[str] = mapped_column(Text, nullable=False, index=True)
+    # Email lookups use the unique_contact_per_company index, which leads with email
+    email: Mapped[str] = mapped_column(Text, nullable=False)
     mobile_phone: Mapped[str | None] = mapped_column(Text, nullable=True)
     job_title: Mapped[str | None] = mapped_column(Text, nullable=True)
     direct_phone_number: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -59,25 +60,28 @@ class Contact(BaseModel):
     data_requester_details: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Relationships and status
+    # Indexed: company contact lists/counts, duplicate detection, FK checks on company delete
     company_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("companies.id", ondelete="RESTRICT"),
         nullable=False,
         index=True
     )
+    # Segment lookups use idx_contacts_segment_status, which leads with segment_id
     segment_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("segments.id", ondelete="RESTRICT"),
-        nullable=False,
-        index=True
+        nullable=False
     )
+    # Indexed: status filter without a segment (list views, exports)
     status: Mapped[ContactStatusEnum] = mapped_column(
-        SAEnum(ContactStatusEnum, name="contact_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        text_enum(ContactStatusEnum),
         nullable=False,
         default=ContactStatusEnum.UPLOADED,
         server_default="uploaded",
         index=True
     )
+    # Indexed: "assigned to SDR" filter, FK checks on user delete
     assigned_sdr_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
@@ -88,14 +92,14 @@ class Contact(BaseModel):
         Boolean,
         nullable=False,
         default=False,
-        server_default="false",
-        index=True
+        server_default="false"
     )
+    # Not indexed: nothing queries contacts by upload batch
     batch_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
-        nullable=True,
-        index=True
+        nullable=True
     )
+    # Indexed: FK checks on user delete
     created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="RESTRICT"),
@@ -135,6 +139,9 @@ class Contact(BaseModel):
             "company_id",
             name="unique_contact_per_company"
         ),
+        enum_check("status", ContactStatusEnum, "contact_status_check"),
+        # Segment contact lists filtered by status, and segment contact counts
+        Index("idx_contacts_segment_status", "segment_id", "status"),
     )
 
     @property
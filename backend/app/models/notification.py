@@ -6,14 +6,15 @@ from datetime import datetime
 from sqlalchemy import (
     Boolean,
     DateTime,
-    Enum as SAEnum,
     ForeignKey,
+    Index,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, UUIDPKMixin
+from app.models.base import Base, UUIDPKMixin, enum_check, text_enum
 
 
 class NotificationTypeEnum(str, enum.Enum):
@@ -38,7 +39,7 @@ class Notification(Base, UUIDPKMixin):
         index=True
     )
     type: Mapped[NotificationTypeEnum] = mapped_column(
-        SAEnum(NotificationTypeEnum, name="notification_type", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        text_enum(NotificationTypeEnum),
         nullable=False
     )
     title: Mapped[str] = mapped_column(Text, nullable=False)
@@ -48,8 +49,7 @@ class Notification(Base, UUIDPKMixin):
         Boolean,
         nullable=False,
         default=False,
-        server_default="false",
-        index=True
+        server_default="false"
     )
     actor_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
@@ -64,7 +64,6 @@ class Notification(Base, UUIDPKMixin):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
         server_default="now()",
         index=True
     )
@@ -81,5 +80,16 @@ class Notification(Base, UUIDPKMixin):
         foreign_keys=[actor_id]
     )
 
+    __table_args__ = (
+        enum_check("type", NotificationTypeEnum, "notification_type_check"),
+        # Unread feed/badge: only unread rows are indexed, newest first per user
+        Index(
+            "ix_notifications_unread",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_read = false")
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Notification(id={self.id}, user_id={self.user_id}, type={self.type}, read={self.is_read})>"
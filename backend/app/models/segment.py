@@ -4,16 +4,21 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import (
+    Computed,
     DateTime,
-    Enum as SAEnum,
     ForeignKey,
+    Index,
     PrimaryKeyConstraint,
     Text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin, UUIDPKMixin
+from app.models.base import Base, TimestampMixin, UUIDPKMixin, enum_check, text_enum
+
+
+# Full-text document for multi-word search, generated by Postgres from name and description
+SEARCH_VECTOR_SQL = "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))"
 
 
 class SegmentStatusEnum(str, enum.Enum):
@@ -41,7 +46,7 @@ class Segment(Base, UUIDPKMixin, TimestampMixin):
         Text, nullable=False, server_default=""
     )
     status: Mapped[SegmentStatusEnum] = mapped_column(
-        SAEnum(SegmentStatusEnum, name="segment_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        text_enum(SegmentStatusEnum),
         nullable=False,
         default=SegmentStatusEnum.ACTIVE,
         server_default="active",
@@ -53,36 +58,60 @@ class Segment(Base, UUIDPKMixin, TimestampMixin):
         nullable=False,
         index=True
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True
+    )
 
     # Relationships
     created_by_user: Mapped["User"] = relationship(
         "User",
         back_populates="created_segments",
-        foreign_keys=[created_by]
+        foreign_keys=[created_by],
+        lazy="raise_on_sql"
     )
     companies: Mapped[list["Company"]] = relationship(
         "Company",
-        back_populates="segment"
+        back_populates="segment",
+        lazy="raise_on_sql"
     )
     contacts: Mapped[list["Contact"]] = relationship(
         "Contact",
-        back_populates="segment"
+        back_populates="segment",
+        lazy="raise_on_sql"
     )
     segment_offerings: Mapped[list["SegmentOffering"]] = relationship(
         "SegmentOffering",
         back_populates="segment",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql"
     )
     # Many-to-many relationship with offerings
     offerings: Mapped[list["Offering"]] = relationship(
         "Offering",
         secondary="segment_offerings",
         back_populates="segments",
-        viewonly=True
+        viewonly=True,
+        lazy="raise_on_sql"
     )
     marketing_collateral: Mapped[list["MarketingCollateral"]] = relationship(
         "MarketingCollateral",
-        back_populates="segment"
+        back_populates="segment",
+        lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        enum_check("status", SegmentStatusEnum, "segment_status_check"),
+        # Serves the name ILIKE '%term%' search
+        Index(
+            "ix_segments_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}
+        ),
+        # Serves multi-word full-text search
+        Index("ix_segments_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     @property
@@ -104,28 +133,49 @@ class Offering(Base, UUIDPKMixin, TimestampMixin):
     name: Mapped[str] = mapped_column(Text, unique=True, nullable=False, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[OfferingStatusEnum] = mapped_column(
-        SAEnum(OfferingStatusEnum, name="offering_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        text_enum(OfferingStatusEnum),
         nullable=False,
         default=OfferingStatusEnum.ACTIVE,
         server_default="active",
         index=True
     )
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True
+    )
 
     # Relationships
     segment_offerings: Mapped[list["SegmentOffering"]] = relationship(
         "SegmentOffering",
-        back_populates="offering"
+        back_populates="offering",
+        lazy="raise_on_sql"
     )
     # Many-to-many relationship with segments
     segments: Mapped[list["Segment"]] = relationship(
         "Segment",
         secondary="segment_offerings",
         back_populates="offerings",
-        viewonly=True
+        viewonly=True,
+        lazy="raise_on_sql"
     )
     marketing_collateral: Mapped[list["MarketingCollateral"]] = relationship(
         "MarketingCollateral",
-        back_populates="offering"
+        back_populates="offering",
+        lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        enum_check("status", OfferingStatusEnum, "offering_status_check"),
+        # Serves the name ILIKE '%term%' search
+        Index(
+            "ix_offerings_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}
+        ),
+        # Serves multi-word full-text search
+        Index("ix_offerings_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     def __repr__(self) -> str:
@@ -154,7 +204,6 @@ class SegmentOffering(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
         server_default="now()"
     )
 
@@ -5,7 +5,6 @@ from datetime import datetime
 
 from sqlalchemy import (
     DateTime,
-    Enum as SAEnum,
     ForeignKey,
     Integer,
     Text,
@@ -13,7 +12,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, UUIDPKMixin
+from app.models.base import Base, UUIDPKMixin, enum_check, pg_enum, text_enum
 
 
 class UploadTypeEnum(str, enum.Enum):
@@ -37,7 +36,7 @@ class UploadBatch(Base, UUIDPKMixin):
     __tablename__ = "upload_batches"
 
     upload_type: Mapped[UploadTypeEnum] = mapped_column(
-        SAEnum(UploadTypeEnum, name="upload_type", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        pg_enum(UploadTypeEnum, "upload_type"),
         nullable=False,
         index=True
     )
@@ -47,7 +46,7 @@ class UploadBatch(Base, UUIDPKMixin):
     valid_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     invalid_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     status: Mapped[BatchStatusEnum] = mapped_column(
-        SAEnum(BatchStatusEnum, name="batch_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        text_enum(BatchStatusEnum),
         nullable=False,
         default=BatchStatusEnum.PROCESSING,
         server_default="processing",
@@ -63,7 +62,6 @@ class UploadBatch(Base, UUIDPKMixin):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
         server_default="now()",
         index=True
     )
@@ -74,5 +72,9 @@ class UploadBatch(Base, UUIDPKMixin):
         back_populates="upload_batches"
     )
 
+    __table_args__ = (
+        enum_check("status", BatchStatusEnum, "batch_status_check"),
+    )
+
     def __repr__(self) -> str:
         return f"<UploadBatch(id={self.id}, type={self.upload_type}, status={self.status}, rows={self.total_rows})>"
@@ -9,18 +9,19 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
-    Enum as SAEnum,
     ForeignKey,
     Identity,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin, UUIDPKMixin
+from app.models.base import Base, TimestampMixin, UUIDPKMixin, enum_check, pg_enum, text_enum
 
 
 class UserRoleEnum(str, enum.Enum):
@@ -46,28 +47,59 @@ class User(Base, UUIDPKMixin, TimestampMixin):
 
     __tablename__ = "users"
 
-    email: Mapped[str] = mapped_column(Text, unique=True, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
     name: Mapped[str] = mapped_column(Text, nullable=False)
     password_hash: Mapped[str] = mapped_column(Text, nullable=False)
     status: Mapped[UserStatusEnum] = mapped_column(
-        SAEnum(UserStatusEnum, name="user_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        text_enum(UserStatusEnum),
         nullable=False,
         default=UserStatusEnum.ACTIVE,
         server_default="active",
         index=True
     )
+    # Denormalized copy of user_roles, maintained by the sync_user_roles_array trigger (read-only here)
+    roles: Mapped[list[UserRoleEnum]] = mapped_column(
+        ARRAY(pg_enum(UserRoleEnum, "user_role")),
+        nullable=False,
+        server_default="{}"
+    )
+    # True while the user has at least one assignment, maintained by the
+    # sync_user_has_assignments trigger (read-only here)
+    has_assignments: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false"
+    )
+
+    __table_args__ = (
+        enum_check("status", UserStatusEnum, "user_status_check"),
+        # Covers the authenticated-user lookup so it can be answered by an index-only scan
+        Index(
+            "ix_users_auth_covering",
+            "id",
+            postgresql_include=["email", "name", "status", "roles", "has_assignments"]
+        ),
+        # Case-insensitive email lookups (login, get_user_by_email); also keeps
+        # addresses differing only in case from becoming separate accounts
+        Index("ix_users_email_lower", text("lower(email)"), unique=True),
+    )
 
     # Relationships
+    # Small per-user data is loaded eagerly with the user (async sessions can't lazy-load);
+    # the larger collections below stay lazy
     user_roles: Mapped[list["UserRole"]] = relationship(
         "UserRole",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin"
     )
     preferences: Mapped[Optional["UserPreference"]] = relationship(
         "UserPreference",
         back_populates="user",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="joined"
     )
 
     # Reverse relationships (companies/segments created by this user, etc.)
@@ -145,7 +177,7 @@ class UserRole(Base, TimestampMixin):
         index=True
     )
     role: Mapped[UserRoleEnum] = mapped_column(
-        SAEnum(UserRoleEnum, name="user_role", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        pg_enum(UserRoleEnum, "user_role"),
         nullable=False,
         index=True
     )
@@ -172,7 +204,7 @@ class RoleGrant(Base, TimestampMixin):
         primary_key=True
     )
     role: Mapped[UserRoleEnum] = mapped_column(
-        SAEnum(UserRoleEnum, name="user_role", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        pg_enum(UserRoleEnum, "user_role"),
         nullable=False,
         index=True
     )
@@ -181,6 +213,13 @@ class RoleGrant(Base, TimestampMixin):
 
     __table_args__ = (
         UniqueConstraint("role", "action", name="unique_role_action"),
+        # Lets the grants map load (and any action/role probe) run as an index-only scan
+        Index(
+            "ix_role_grants_lookup",
+            "action",
+            "role",
+            postgresql_where=text("granted")
+        ),
     )
 
     def __repr__(self) -> str:
@@ -2,10 +2,13 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
-from app.core.database import get_db
+from app.core import user_cache
+from app.core.database import after_commit, get_db
 from app.core.deps import get_current_active_user, require_roles
 from app.models.assignment import EntityTypeEnum
 from app.schemas.assignment import (
@@ -14,10 +17,22 @@ from app.schemas.assignment import (
     AssignmentDelete,
     AssignmentResponse
 )
-from app.services import assignment_service
+from app.services import assignment_cache, assignment_service
 
 router = APIRouter()
 
+# Built once at import; list endpoints serialize through it instead of FastAPI's response_model handling
+_ASSIGNMENT_LIST = TypeAdapter(list[AssignmentResponse])
+_ASSIGNMENT_LIST_RESPONSES = {"model": list[AssignmentResponse]}
+
+
+def _serialize(assignments: list) -> list[dict]:
+    """Convert Assignment rows into JSON-ready AssignmentResponse dicts."""
+    return _ASSIGNMENT_LIST.dump_python(
+        _ASSIGNMENT_LIST.validate_python(assignments, from_attributes=True),
+        mode="json"
+    )
+
 
 @router.post("/", response_model=AssignmentResponse, status_code=status.HTTP_201_CREATED)
 async def create_assignment(
@@ -36,17 +51,31 @@ async def create_assignment(
             entity_type=data.entity_type,
             entity_id=data.entity_id,
             assigned_to=data.assigned_to,
-            assigned_by=UUID(current_user["id"])
+            assigned_by=current_user["id"]
         )
-        return assignment
     except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assigned user not found"
+        )
+
+    if assignment is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Assignment already exists for this entity and user"
         )
 
+    after_commit(db, assignment_cache.invalidate, data.entity_type, [data.entity_id], data.assigned_to)
+    # Reload the assignee's has_assignments flag on their next request to this worker
+    after_commit(db, user_cache.invalidate_user, data.assigned_to)
+    return assignment
+
 
-@router.post("/bulk", response_model=list[AssignmentResponse], status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: _ASSIGNMENT_LIST_RESPONSES}
+)
 async def create_bulk_assignments(
     data: AssignmentBulkCreate,
     db: AsyncSession = Depends(get_db),
@@ -55,6 +84,7 @@ async def create_bulk_assignments(
     """
     Create multiple assignments at once.
 
+    All entities must exist (404 listing the missing IDs otherwise).
     Requires admin, segment_owner, or approver role.
     """
     try:
@@ -63,15 +93,30 @@ async def create_bulk_assignments(
             entity_type=data.entity_type,
             entity_ids=data.entity_ids,
             assigned_to=data.assigned_to,
-            assigned_by=UUID(current_user["id"])
+            assigned_by=current_user["id"]
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
         )
-        return assignments
     except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assigned user not found"
+        )
+
+    # Conflicting rows are skipped by the insert; raising rolls back the rest
+    if len(assignments) != len(data.entity_ids):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="One or more assignments already exist"
         )
 
+    after_commit(db, assignment_cache.invalidate, data.entity_type, data.entity_ids, data.assigned_to)
+    after_commit(db, user_cache.invalidate_user, data.assigned_to)
+    return ORJSONResponse(_serialize(assignments), status_code=status.HTTP_201_CREATED)
+
 
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_assignment(
@@ -97,8 +142,11 @@ async def delete_assignment(
             detail="Assignment not found"
         )
 
+    after_commit(db, assignment_cache.invalidate, data.entity_type, [data.entity_id], data.assigned_to)
+    after_commit(db, user_cache.invalidate_user, data.assigned_to)
 
-@router.get("/entity/{entity_type}/{entity_id}", response_model=list[AssignmentResponse])
+
+@router.get("/entity/{entity_type}/{entity_id}", responses={status.HTTP_200_OK: _ASSIGNMENT_LIST_RESPONSES})
 async def get_assignments_for_entity(
     entity_type: EntityTypeEnum,
     entity_id: UUID,
@@ -108,17 +156,24 @@ async def get_assignments_for_entity(
     """
     Get all assignments for a specific entity.
 
-    Accessible to all authenticated users.
+    Accessible to all authenticated users. Responses are cached for a few seconds.
     """
+    scope = assignment_cache.entity_scope(entity_type, entity_id)
+    cached = assignment_cache.get(scope)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
     assignments = await assignment_service.get_assignments_for_entity(
         db=db,
         entity_type=entity_type,
         entity_id=entity_id
     )
-    return assignments
+    response = _serialize(assignments)
+    assignment_cache.put(scope, None, response)
+    return ORJSONResponse(response)
 
 
-@router.get("/user/{user_id}", response_model=list[AssignmentResponse])
+@router.get("/user/{user_id}", responses={status.HTTP_200_OK: _ASSIGNMENT_LIST_RESPONSES})
 async def get_assignments_for_user(
     user_id: UUID,
     entity_type: EntityTypeEnum | None = Query(None),
@@ -130,19 +185,12 @@ async def get_assignments_for_user(
     """
     Get assignments for a specific user.
 
-    Accessible to all authenticated users.
+    Accessible to all authenticated users. Responses are cached for a few seconds.
     """
-    assignments = await assignment_service.get_assignments_for_user(
-        db=db,
-        assigned_to=user_id,
-        entity_type=entity_type,
-        skip=skip,
-        limit=limit
-    )
-    return assignments
+    return await _list_user_assignments(db, user_id, entity_type, skip, limit)
 
 
-@router.get("/me", response_model=list[AssignmentResponse])
+@router.get("/me", responses={status.HTTP_200_OK: _ASSIGNMENT_LIST_RESPONSES})
 async def get_my_assignments(
     entity_type: EntityTypeEnum | None = Query(None),
     skip: int = Query(0, ge=0),
@@ -153,13 +201,40 @@ async def get_my_assignments(
     """
     Get assignments for the current user.
 
-    Accessible to all authenticated users.
+    Accessible to all authenticated users. Responses are cached for a few seconds.
+    Users without any assignments are answered from their has_assignments flag
+    without querying assignments.
     """
+    if not current_user.get("has_assignments", True):
+        # The cached flag may predate an assignment committed through another
+        # worker, so only a fresh False is answered with an empty list
+        if not await assignment_service.user_has_assignments(db, current_user["id"]):
+            return ORJSONResponse([])
+
+    return await _list_user_assignments(db, current_user["id"], entity_type, skip, limit)
+
+
+async def _list_user_assignments(
+    db: AsyncSession,
+    assigned_to: UUID,
+    entity_type: EntityTypeEnum | None,
+    skip: int,
+    limit: int
+) -> ORJSONResponse:
+    """Serve a page of a user's assignments from the response cache, loading it on a miss."""
+    scope = assignment_cache.user_scope(assigned_to)
+    params = (entity_type, skip, limit)
+    cached = assignment_cache.get(scope, params)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
     assignments = await assignment_service.get_assignments_for_user(
         db=db,
-        assigned_to=UUID(current_user["id"]),
+        assigned_to=assigned_to,
         entity_type=entity_type,
         skip=skip,
         limit=limit
     )
-    return assignments
+    response = _serialize(assignments)
+    assignment_cache.put(scope, params, response)
+    return ORJSONResponse(response)
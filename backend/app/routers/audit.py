@@ -2,21 +2,28 @@
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.deps import get_current_active_user, require_roles
+from app.core.etag import etag_matches, make_etag, not_modified
+from app.core.pagination import AFTER_DESCRIPTION, parse_cursor_param, set_next_cursor
 from app.schemas.audit_log import AuditLogResponse, AuditLogFilter
 from app.services import audit_service
 
 router = APIRouter()
 
+# Entity history is append-only; clients may reuse it briefly and revalidate with If-None-Match
+_HISTORY_CACHE_HEADERS = {"Cache-Control": "private, max-age=60"}
+
 
 @router.get("/", response_model=list[AuditLogResponse])
 async def list_audit_logs(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    after: str | None = Query(None, description=AFTER_DESCRIPTION),
     actor_id: UUID | None = Query(None),
     action: str | None = Query(None),
     entity_type: str | None = Query(None),
@@ -30,6 +37,8 @@ async def list_audit_logs(
     List audit logs with pagination and filters.
 
     Requires admin role. Supports filtering by actor, action, entity type/id, and date range.
+    Full pages carry an X-Next-Cursor header; pass it back as ?after= to fetch the next
+    page with an index seek instead of OFFSET.
     """
     filters = AuditLogFilter(
         actor_id=actor_id,
@@ -44,8 +53,10 @@ async def list_audit_logs(
         db=db,
         skip=skip,
         limit=limit,
-        filters=filters
+        filters=filters,
+        after=parse_cursor_param(after)
     )
+    set_next_cursor(response, logs, limit)
     return logs
 
 
@@ -53,21 +64,40 @@ async def list_audit_logs(
 async def get_entity_audit_history(
     entity_type: str,
     entity_id: UUID,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    after: str | None = Query(None, description=AFTER_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_active_user)
 ):
     """
     Get audit history for a specific entity.
 
-    Accessible to all authenticated users.
+    Accessible to all authenticated users. Supports the same ?after= cursor as the audit list.
+    Responses are cacheable privately for a minute and answer If-None-Match with 304
+    until a new entry is logged for the entity.
     """
+    cursor = parse_cursor_param(after)
+
+    count, latest = await audit_service.get_entity_history_version(
+        db=db,
+        entity_type=entity_type,
+        entity_id=entity_id
+    )
+    etag = make_etag(count, latest)
+    if etag_matches(request, etag):
+        return not_modified(etag, _HISTORY_CACHE_HEADERS)
+
     logs = await audit_service.get_entity_history(
         db=db,
         entity_type=entity_type,
         entity_id=entity_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        after=cursor
     )
+    set_next_cursor(response, logs, limit)
+    response.headers.update({**_HISTORY_CACHE_HEADERS, "ETag": etag})
     return logs
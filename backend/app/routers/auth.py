@@ -4,14 +4,15 @@ Authentication endpoints for login, token refresh, and password management.
 
 import logging
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import create_access_token, create_refresh_token, decode_token
+from app.core import user_cache
+from app.core.database import get_db, get_db_read
+from app.core.security import JWTError, create_access_token, create_refresh_token, decode_token_cached_async
 from app.core.deps import get_current_active_user
 from app.schemas.auth import (
     Token,
@@ -42,7 +43,7 @@ async def login(
     user = await auth_service.authenticate_user(db, form_data.username, form_data.password)
 
     if user is None:
-        logger.warning(f"Failed login attempt for email: {form_data.username}")
+        logger.warning("Failed login attempt for email: %s", form_data.username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -53,7 +54,7 @@ async def login(
     access_token = create_access_token(data={"sub": user["id"]})
     refresh_token = create_refresh_token(data={"sub": user["id"]})
 
-    logger.info(f"User logged in successfully: {user['email']} (ID: {user['id']})")
+    logger.info("User logged in successfully: %s (ID: %s)", user['email'], user['id'])
 
     return Token(
         access_token=access_token,
@@ -65,7 +66,7 @@ async def login(
 @router.post("/refresh", response_model=AccessToken, status_code=status.HTTP_200_OK)
 async def refresh_token(
     token_data: TokenRefresh,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """
     Exchange a valid refresh token for a new access token.
@@ -77,7 +78,7 @@ async def refresh_token(
     )
 
     try:
-        payload = decode_token(token_data.refresh_token)
+        payload = await decode_token_cached_async(token_data.refresh_token)
         user_id: str | None = payload.get("sub")
 
         if user_id is None:
@@ -93,21 +94,25 @@ async def refresh_token(
             )
 
     except JWTError as e:
-        logger.warning(f"Invalid refresh token: {str(e)}")
+        logger.warning("Invalid refresh token: %s", e)
+        raise credentials_exception
+
+    try:
+        user_uuid = UUID(user_id)
+    except ValueError:
         raise credentials_exception
 
-    # Verify user still exists and is active
-    from uuid import UUID
-    user = await auth_service.get_user_by_id(db, UUID(user_id))
+    # Verify user still exists and is active (cached for a few seconds per user)
+    user = await user_cache.get_user(db, user_uuid)
 
     if user is None or user["status"] != "active":
-        logger.warning(f"Refresh token for inactive/non-existent user: {user_id}")
+        logger.warning("Refresh token for inactive/non-existent user: %s", user_id)
         raise credentials_exception
 
     # Create new access token
     access_token = create_access_token(data={"sub": user_id})
 
-    logger.info(f"Access token refreshed for user: {user['email']} (ID: {user_id})")
+    logger.info("Access token refreshed for user: %s (ID: %s)", user['email'], user_id)
 
     return AccessToken(
         access_token=access_token,
@@ -136,7 +141,7 @@ async def get_current_user_info(
 @router.post("/forgot-password", response_model=MessageResponse, status_code=status.HTTP_200_OK)
 async def forgot_password(
     request_data: ForgotPasswordRequest,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_read)
 ):
     """
     Initiate password reset process for a user.
@@ -147,14 +152,13 @@ async def forgot_password(
     2. Store token with expiration in database
     3. Send password reset email to user
     """
-    # Check if user exists (but don't reveal this information to prevent email enumeration)
-    user = await auth_service.get_user_by_email(db, request_data.email)
-
-    if user:
-        logger.info(f"Password reset requested for user: {request_data.email}")
+    # Check if user exists (but don't reveal this information to prevent email enumeration).
+    # Cached, so repeated probes for the same address don't reach the database.
+    if await auth_service.user_email_exists(db, request_data.email):
+        logger.info("Password reset requested for user: %s", request_data.email)
         # TODO: Generate reset token and send email
     else:
-        logger.warning(f"Password reset requested for non-existent email: {request_data.email}")
+        logger.warning("Password reset requested for non-existent email: %s", request_data.email)
 
     # Always return success to prevent email enumeration attacks
     return MessageResponse(
@@ -178,7 +182,7 @@ async def reset_password(
     4. Invalidate the reset token
     """
     # TODO: Implement actual password reset logic with token validation
-    logger.info(f"Password reset attempted with token: {request_data.token[:10]}...")
+    logger.info("Password reset attempted with token: %s...", request_data.token[:10])
 
     # Placeholder response
     return MessageResponse(
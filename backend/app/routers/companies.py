@@ -1,12 +1,16 @@
 """Company router for CRUD and status workflow operations."""
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
-from app.core.database import get_db
+from app.core.database import after_commit, get_db, unique_violation_constraint
 from app.core.deps import get_current_active_user, require_roles
+from app.core.etag import etag_matches, make_etag, not_modified
 from app.schemas.company import (
     CompanyApproval,
     CompanyCreate,
@@ -14,13 +18,45 @@ from app.schemas.company import (
     CompanyUpdate,
     CompanyWithContacts,
 )
-from app.services import company_service
+from app.services import company_cache, company_service
 
 router = APIRouter()
 
+# Built once at import; list endpoints dump ORM rows to JSON-ready dicts in a single pass
+_COMPANY_LIST = TypeAdapter(list[CompanyResponse])
+
+
+def _page_body(companies: list, total: int, skip: int, limit: int) -> dict:
+    """Serialize a page of companies to a JSON-ready dict, bypassing FastAPI's jsonable_encoder."""
+    return {
+        "items": _COMPANY_LIST.dump_python(
+            _COMPANY_LIST.validate_python(companies, from_attributes=True),
+            mode="json"
+        ),
+        "total": total,
+        "skip": skip,
+        "limit": limit
+    }
+
+
+def _page_etag(companies: list, total: int, last_updated: datetime | None) -> str:
+    """
+    Build the ETag of a company list page.
+
+    updated_at only moves when a company row changes, so the joined user
+    names shown on the page are part of the validator too: renaming a
+    creator or approver must not leave clients on a stale 304.
+    """
+    return make_etag(
+        total,
+        last_updated,
+        *((company.id, company.created_by_name, company.approved_by_name) for company in companies)
+    )
+
 
 @router.get("/")
 async def list_companies(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records"),
     segment_id: UUID | None = Query(None, description="Filter by segment ID"),
@@ -34,8 +70,9 @@ async def list_companies(
     List companies with pagination and filters.
 
     Returns a paginated list of companies with total count.
+    Supports If-None-Match: answers 304 while no matching company has changed.
     """
-    companies = await company_service.list_companies(
+    companies, total, last_updated = await company_service.list_companies(
         db=db,
         skip=skip,
         limit=limit,
@@ -45,20 +82,11 @@ async def list_companies(
         is_duplicate=is_duplicate
     )
 
-    total = await company_service.count_companies(
-        db=db,
-        segment_id=segment_id,
-        status_filter=status,
-        search=search,
-        is_duplicate=is_duplicate
-    )
+    etag = _page_etag(companies, total, last_updated)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    return {
-        "items": [CompanyResponse.model_validate(c) for c in companies],
-        "total": total,
-        "skip": skip,
-        "limit": limit
-    }
+    return ORJSONResponse(_page_body(companies, total, skip, limit), headers={"ETag": etag})
 
 
 @router.post("/", response_model=CompanyResponse, status_code=status.HTTP_201_CREATED)
@@ -74,17 +102,18 @@ async def create_company(
     Company is created with pending status.
     """
     try:
-        user_id = UUID(current_user["id"])
+        user_id = current_user["id"]
         company = await company_service.create_company(
             db=db,
             data=data,
             created_by=user_id
         )
+        after_commit(db, company_cache.invalidate_pending)
         return company
 
     except IntegrityError as e:
         # Handle unique constraint violation
-        if "unique_company_per_segment" in str(e.orig):
+        if unique_violation_constraint(e) == "unique_company_per_segment":
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="A company with this name and website already exists in the segment"
@@ -95,9 +124,11 @@ async def create_company(
         )
 
 
-@router.get("/{company_id}", response_model=CompanyWithContacts)
+@router.get("/{company_id:uuid}", response_model=CompanyWithContacts)
 async def get_company(
     company_id: UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_active_user)
 ):
@@ -105,57 +136,33 @@ async def get_company(
     Get company details with contact count.
 
     Returns detailed company information including the number of contacts.
+    Supports If-None-Match: answers 304 while the company and its contact count are unchanged.
     """
-    company = await company_service.get_company(db=db, company_id=company_id)
+    found = await company_service.get_company_with_contact_count(db=db, company_id=company_id)
 
-    if company is None:
+    if found is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Company with id {company_id} not found"
         )
 
-    # Get contact count
-    contact_count = await company_service.get_company_contact_count(
-        db=db,
-        company_id=company_id
-    )
+    company, contact_count = found
 
-    # Convert to response model with contact count
-    company_dict = {
-        "id": company.id,
-        "company_name": company.company_name,
-        "company_website": company.company_website,
-        "company_phone": company.company_phone,
-        "company_description": company.company_description,
-        "company_linkedin_url": company.company_linkedin_url,
-        "company_industry": company.company_industry,
-        "company_sub_industry": company.company_sub_industry,
-        "street": company.street,
-        "city": company.city,
-        "state_province": company.state_province,
-        "country_region": company.country_region,
-        "zip_postal_code": company.zip_postal_code,
-        "founded_year": company.founded_year,
-        "revenue_range": company.revenue_range,
-        "employee_size_range": company.employee_size_range,
-        "segment_id": company.segment_id,
-        "status": company.status,
-        "rejection_reason": company.rejection_reason,
-        "is_duplicate": company.is_duplicate,
-        "batch_id": company.batch_id,
-        "created_by": company.created_by,
-        "created_by_name": company.created_by_name,
-        "approved_by_name": company.approved_by_name,
-        "approved_at": company.approved_at,
-        "created_at": company.created_at,
-        "updated_at": company.updated_at,
-        "contact_count": contact_count
-    }
+    etag = make_etag(
+        company.id, company.updated_at.isoformat(), contact_count,
+        company.created_by_name, company.approved_by_name
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
 
-    return CompanyWithContacts(**company_dict)
+    # Validate straight from the ORM object; contact_count is not a model attribute
+    company_response = CompanyWithContacts.model_validate(company)
+    company_response.contact_count = contact_count
+    return company_response
 
 
-@router.patch("/{company_id}", response_model=CompanyResponse)
+@router.patch("/{company_id:uuid}", response_model=CompanyResponse)
 async def update_company(
     company_id: UUID,
     data: CompanyUpdate,
@@ -173,6 +180,7 @@ async def update_company(
             company_id=company_id,
             data=data
         )
+        after_commit(db, company_cache.invalidate_pending)
         return company
 
     except ValueError as e:
@@ -182,7 +190,7 @@ async def update_company(
         )
     except IntegrityError as e:
         # Handle unique constraint violation
-        if "unique_company_per_segment" in str(e.orig):
+        if unique_violation_constraint(e) == "unique_company_per_segment":
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="A company with this name and website already exists in the segment"
@@ -193,7 +201,7 @@ async def update_company(
         )
 
 
-@router.post("/{company_id}/approve", response_model=CompanyResponse)
+@router.post("/{company_id:uuid}/approve", response_model=CompanyResponse)
 async def approve_company(
     company_id: UUID,
     approval: CompanyApproval,
@@ -208,13 +216,14 @@ async def approve_company(
     Rejection requires a rejection_reason.
     """
     try:
-        user_id = UUID(current_user["id"])
+        user_id = current_user["id"]
         company = await company_service.approve_company(
             db=db,
             company_id=company_id,
             approval=approval,
             approved_by=user_id
         )
+        after_commit(db, company_cache.invalidate_pending)
         return company
 
     except ValueError as e:
@@ -231,7 +240,7 @@ async def approve_company(
             )
 
 
-@router.post("/{company_id}/duplicate", response_model=CompanyResponse)
+@router.post("/{company_id:uuid}/duplicate", response_model=CompanyResponse)
 async def mark_duplicate(
     company_id: UUID,
     is_duplicate: bool,
@@ -249,6 +258,7 @@ async def mark_duplicate(
             company_id=company_id,
             is_duplicate=is_duplicate
         )
+        after_commit(db, company_cache.invalidate_pending)
         return company
 
     except ValueError as e:
@@ -260,6 +270,7 @@ async def mark_duplicate(
 
 @router.get("/pending/list")
 async def list_pending_companies(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records"),
     db: AsyncSession = Depends(get_db),
@@ -270,18 +281,21 @@ async def list_pending_companies(
 
     Requires approver or admin role.
     Returns companies in pending status ordered by creation date (oldest first).
+    Supports If-None-Match: answers 304 while no pending company has changed.
+    Pages are cached for a few seconds and dropped on any company write.
     """
-    companies = await company_service.get_pending_companies(
-        db=db,
-        skip=skip,
-        limit=limit
-    )
+    cached = company_cache.get_pending_page(skip, limit)
+    if cached is None:
+        companies, total, last_updated = await company_service.get_pending_companies(
+            db=db,
+            skip=skip,
+            limit=limit
+        )
+        cached = (_page_etag(companies, total, last_updated), _page_body(companies, total, skip, limit))
+        company_cache.put_pending_page(skip, limit, *cached)
 
-    total = await company_service.count_pending_companies(db=db)
+    etag, page = cached
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    return {
-        "items": [CompanyResponse.model_validate(c) for c in companies],
-        "total": total,
-        "skip": skip,
-        "limit": limit
-    }
+    return ORJSONResponse(page, headers={"ETag": etag})
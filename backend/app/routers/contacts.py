@@ -6,15 +6,17 @@ uploaded -> approved -> assigned_to_sdr -> meeting_scheduled
 """
 
 import logging
-import math
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.deps import get_current_active_user, require_roles
+from app.core.pagination import AFTER_DESCRIPTION, parse_cursor_param, set_next_cursor
 from app.schemas.contact import (
     ContactCreate,
     ContactUpdate,
@@ -58,6 +60,18 @@ class MessageResponse(BaseModel):
     message: str
 
 
+# Built once at import; list endpoints validate and dump all rows in one pydantic-core call
+_CONTACT_LIST = TypeAdapter(list[ContactResponse])
+
+
+def _serialize(contacts: list) -> list[dict]:
+    """Convert Contact rows into JSON-ready ContactResponse dicts."""
+    return _CONTACT_LIST.dump_python(
+        _CONTACT_LIST.validate_python(contacts, from_attributes=True),
+        mode="json"
+    )
+
+
 @router.get("", response_model=ContactListResponse, status_code=status.HTTP_200_OK)
 async def list_contacts(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
@@ -68,6 +82,8 @@ async def list_contacts(
     search: str | None = Query(None, description="Search by name or email"),
     assigned_sdr_id: UUID | None = Query(None, description="Filter by assigned SDR"),
     is_duplicate: bool | None = Query(None, description="Filter by duplicate flag"),
+    with_total: bool = Query(True, description="Count all matching contacts (set false on later pages)"),
+    after: str | None = Query(None, description=AFTER_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_active_user)
 ):
@@ -76,11 +92,20 @@ async def list_contacts(
 
     Supports filtering by company, segment, status, assigned SDR, and duplicate flag.
     Also supports searching by first name, last name, or email.
+
+    Counting every match is the expensive part of a deep page. Clients that
+    kept the total from page 1 can pass with_total=false; total and
+    total_pages are then returned as -1.
+
+    Full pages carry an X-Next-Cursor header; pass it back as ?after= to fetch
+    the next page with an index seek instead of OFFSET (page is then ignored).
+    Cursor pages are never counted.
     """
-    skip = (page - 1) * per_page
+    cursor = parse_cursor_param(after)
+    skip = 0 if cursor is not None else (page - 1) * per_page
 
-    # Fetch contacts and total count
-    contacts = await contact_service.list_contacts(
+    # Fetch contacts and total count (one query)
+    contacts, total = await contact_service.list_contacts(
         db,
         skip=skip,
         limit=per_page,
@@ -89,33 +114,32 @@ async def list_contacts(
         status_filter=status_filter,
         search=search,
         assigned_sdr_id=assigned_sdr_id,
-        is_duplicate=is_duplicate
+        is_duplicate=is_duplicate,
+        with_total=with_total and cursor is None,
+        after=cursor
     )
 
-    total = await contact_service.count_contacts(
-        db,
-        company_id=company_id,
-        segment_id=segment_id,
-        status_filter=status_filter,
-        search=search,
-        assigned_sdr_id=assigned_sdr_id,
-        is_duplicate=is_duplicate
-    )
-
-    total_pages = math.ceil(total / per_page) if total > 0 else 0
+    if total is None:
+        total = total_pages = -1
+    else:
+        total_pages = -(-total // per_page)
 
     logger.info(
-        f"Contact list requested by {current_user['email']} - "
-        f"Page: {page}, Per page: {per_page}, Total: {total}"
+        "Contact list requested by %s - "
+        "Page: %s, Per page: %s, Total: %s",
+        current_user['email'], page, per_page, total
     )
 
-    return ContactListResponse(
-        contacts=[ContactResponse.model_validate(contact) for contact in contacts],
-        total=total,
-        page=page,
-        per_page=per_page,
-        total_pages=total_pages
-    )
+    # Returned directly (response_model still documents the shape) to skip re-validation
+    response = ORJSONResponse({
+        "contacts": _serialize(contacts),
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": total_pages
+    })
+    set_next_cursor(response, contacts, per_page)
+    return response
 
 
 @router.post("", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
@@ -132,7 +156,7 @@ async def create_contact(
     Auto-derives segment_id from the company's segment.
     """
     try:
-        created_by = UUID(current_user["id"])
+        created_by = current_user["id"]
         contact = await contact_service.create_contact(
             db,
             data=contact_data,
@@ -140,24 +164,19 @@ async def create_contact(
         )
 
         logger.info(
-            f"Contact created: {contact.email} (ID: {contact.id}) "
-            f"for company {contact.company_id} by {current_user['email']}"
+            "Contact created: %s (ID: %s) "
+            "for company %s by %s",
+            contact.email, contact.id, contact.company_id, current_user['email']
         )
 
         return ContactResponse.model_validate(contact)
 
     except ValueError as e:
-        logger.warning(f"Failed to create contact: {str(e)} by {current_user['email']}")
+        logger.warning("Failed to create contact: %s by %s", e, current_user['email'])
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        logger.error(f"Failed to create contact: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create contact: {str(e)}"
-        )
 
 
 @router.get("/{contact_id}", response_model=ContactResponse, status_code=status.HTTP_200_OK)
@@ -169,20 +188,21 @@ async def get_contact(
     """
     Get detailed information about a specific contact.
 
-    Returns contact with company and segment information.
+    Returns the contact with the names of its creator and approver.
     """
-    contact = await contact_service.get_contact(db, contact_id)
+    contact = await contact_service.get_contact_for_response(db, contact_id)
 
-    if not contact:
-        logger.warning(f"Contact not found: {contact_id} (requested by {current_user['email']})")
+    if contact is None:
+        logger.warning("Contact not found: %s (requested by %s)", contact_id, current_user['email'])
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Contact with ID {contact_id} not found"
         )
 
-    logger.info(f"Contact detail retrieved: {contact.email} by {current_user['email']}")
+    logger.info("Contact detail retrieved: %s by %s", contact["email"], current_user['email'])
 
-    return ContactResponse.model_validate(contact)
+    # Dumped in JSON mode so datetimes are written the same way as in the list
+    return ORJSONResponse(ContactResponse.model_validate(contact).model_dump(mode="json"))
 
 
 @router.patch("/{contact_id}", response_model=ContactResponse, status_code=status.HTTP_200_OK)
@@ -201,23 +221,18 @@ async def update_contact(
         contact = await contact_service.update_contact(db, contact_id, contact_data)
 
         logger.info(
-            f"Contact updated: {contact.email} (ID: {contact_id}) by {current_user['email']}"
+            "Contact updated: %s (ID: %s) by %s",
+            contact.email, contact_id, current_user['email']
         )
 
         return ContactResponse.model_validate(contact)
 
     except ValueError as e:
-        logger.warning(f"Failed to update contact {contact_id}: {str(e)}")
+        logger.warning("Failed to update contact %s: %s", contact_id, e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
-    except Exception as e:
-        logger.error(f"Failed to update contact {contact_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update contact: {str(e)}"
-        )
 
 
 @router.post(
@@ -239,27 +254,22 @@ async def approve_contact(
     Status pipeline: uploaded -> approved
     """
     try:
-        user_id = UUID(current_user["id"])
+        user_id = current_user["id"]
         contact = await contact_service.approve_contact(db, contact_id, approval, approved_by=user_id)
 
         logger.info(
-            f"Contact approved: {contact.email} (ID: {contact_id}) by {current_user['email']}"
+            "Contact approved: %s (ID: %s) by %s",
+            contact.email, contact_id, current_user['email']
         )
 
         return ContactResponse.model_validate(contact)
 
     except ValueError as e:
-        logger.warning(f"Failed to approve contact {contact_id}: {str(e)}")
+        logger.warning("Failed to approve contact %s: %s", contact_id, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        logger.error(f"Failed to approve contact {contact_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to approve contact: {str(e)}"
-        )
 
 
 @router.post(
@@ -287,24 +297,19 @@ async def assign_contact_to_sdr(
         )
 
         logger.info(
-            f"Contact assigned: {contact.email} (ID: {contact_id}) "
-            f"to SDR {assignment.assigned_sdr_id} by {current_user['email']}"
+            "Contact assigned: %s (ID: %s) "
+            "to SDR %s by %s",
+            contact.email, contact_id, assignment.assigned_sdr_id, current_user['email']
         )
 
         return ContactResponse.model_validate(contact)
 
     except ValueError as e:
-        logger.warning(f"Failed to assign contact {contact_id}: {str(e)}")
+        logger.warning("Failed to assign contact %s: %s", contact_id, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        logger.error(f"Failed to assign contact {contact_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to assign contact: {str(e)}"
-        )
 
 
 @router.post("/bulk-assign", response_model=list[ContactResponse], status_code=status.HTTP_200_OK)
@@ -327,25 +332,63 @@ async def bulk_assign_contacts(
         )
 
         logger.info(
-            f"Bulk assignment: {len(contacts)} contacts assigned to SDR "
-            f"{request.assigned_sdr_id} by {current_user['email']}"
+            "Bulk assignment: %s contacts assigned to SDR "
+            "%s by %s",
+            len(contacts), request.assigned_sdr_id, current_user['email']
         )
 
-        return [ContactResponse.model_validate(contact) for contact in contacts]
+        return ORJSONResponse(_serialize(contacts))
 
     except ValueError as e:
-        logger.warning(f"Failed bulk assignment: {str(e)}")
+        logger.warning("Failed bulk assignment: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        logger.error(f"Failed bulk assignment: {str(e)}")
+
+
+@router.post("/bulk-assign/stream", status_code=status.HTTP_200_OK)
+async def bulk_assign_contacts_stream(
+    request: BulkAssignmentRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(require_roles("approver", "admin"))
+):
+    """
+    Bulk assign multiple contacts to an SDR, streaming the result as NDJSON.
+
+    Requires: approver or admin role.
+    All contacts must be in 'approved' status.
+
+    The assignment is validated and committed before the response starts, so
+    errors are still reported as 400. The updated contacts are then streamed
+    one ContactResponse per line (application/x-ndjson) in cursor batches,
+    instead of being serialized into a single array.
+    """
+    try:
+        contact_ids = await contact_service.assign_contact_ids_to_sdr(
+            db,
+            request.contact_ids,
+            request.assigned_sdr_id
+        )
+    except ValueError as e:
+        logger.warning("Failed bulk assignment: %s", e)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to assign contacts: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
 
+    logger.info(
+        "Bulk assignment: %s contacts assigned to SDR "
+        "%s by %s",
+        len(contact_ids), request.assigned_sdr_id, current_user['email']
+    )
+
+    async def ndjson_lines():
+        async for contacts in contact_service.stream_contacts_by_ids(contact_ids):
+            yield b"".join(orjson.dumps(contact) + b"\n" for contact in _serialize(contacts))
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
 
 @router.post(
     "/{contact_id}/meeting-scheduled",
@@ -367,24 +410,19 @@ async def mark_meeting_scheduled(
         contact = await contact_service.mark_meeting_scheduled(db, contact_id)
 
         logger.info(
-            f"Meeting scheduled for contact: {contact.email} (ID: {contact_id}) "
-            f"by {current_user['email']}"
+            "Meeting scheduled for contact: %s (ID: %s) "
+            "by %s",
+            contact.email, contact_id, current_user['email']
         )
 
         return ContactResponse.model_validate(contact)
 
     except ValueError as e:
-        logger.warning(f"Failed to mark meeting scheduled for contact {contact_id}: {str(e)}")
+        logger.warning("Failed to mark meeting scheduled for contact %s: %s", contact_id, e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        logger.error(f"Failed to mark meeting scheduled for contact {contact_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to mark meeting scheduled: {str(e)}"
-        )
 
 
 @router.post(
@@ -412,20 +450,15 @@ async def mark_contact_duplicate(
 
         action = "marked as duplicate" if request.is_duplicate else "unmarked as duplicate"
         logger.info(
-            f"Contact {action}: {contact.email} (ID: {contact_id}) by {current_user['email']}"
+            "Contact %s: %s (ID: %s) by %s",
+            action, contact.email, contact_id, current_user['email']
         )
 
         return ContactResponse.model_validate(contact)
 
     except ValueError as e:
-        logger.warning(f"Failed to mark duplicate for contact {contact_id}: {str(e)}")
+        logger.warning("Failed to mark duplicate for contact %s: %s", contact_id, e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
-    except Exception as e:
-        logger.error(f"Failed to mark duplicate for contact {contact_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to mark duplicate: {str(e)}"
-        )
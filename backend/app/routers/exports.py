@@ -2,10 +2,8 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.responses import StreamingResponse
 
-from app.core.database import get_db
 from app.core.deps import get_current_active_user, require_roles
 from app.services import export_service
 
@@ -16,7 +14,6 @@ router = APIRouter()
 async def export_companies_csv(
     segment_id: UUID | None = Query(None),
     status: str | None = Query(None),
-    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_roles("admin", "segment_owner", "researcher"))
 ):
     """
@@ -25,7 +22,6 @@ async def export_companies_csv(
     Supports filtering by segment_id and status.
     """
     return await export_service.export_companies(
-        db=db,
         segment_id=segment_id,
         status=status
     )
@@ -36,7 +32,6 @@ async def export_contacts_csv(
     company_id: UUID | None = Query(None),
     segment_id: UUID | None = Query(None),
     status: str | None = Query(None),
-    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_roles("admin", "segment_owner", "researcher"))
 ):
     """
@@ -45,7 +40,6 @@ async def export_contacts_csv(
     Supports filtering by company_id, segment_id, and status.
     """
     return await export_service.export_contacts(
-        db=db,
         company_id=company_id,
         segment_id=segment_id,
         status=status
@@ -54,10 +48,9 @@ async def export_contacts_csv(
 
 @router.get("/segments", response_class=StreamingResponse)
 async def export_segments_csv(
-    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(require_roles("admin", "segment_owner"))
 ):
     """
     Export all segments to CSV format.
     """
-    return await export_service.export_segments(db=db)
+    return await export_service.export_segments()
@@ -30,7 +30,7 @@ async def create_marketing_collateral(
     collateral = await marketing_service.create_collateral(
         db=db,
         data=data,
-        created_by=UUID(current_user["id"])
+        created_by=current_user["id"]
     )
     return collateral
 
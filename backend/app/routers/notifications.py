@@ -32,7 +32,7 @@ async def get_my_notifications(
     """
     notifications = await notification_service.get_notifications(
         db=db,
-        user_id=UUID(current_user["id"]),
+        user_id=current_user["id"],
         skip=skip,
         limit=limit,
         is_read=is_read
@@ -52,7 +52,7 @@ async def get_notification_stats(
     """
     stats = await notification_service.get_stats(
         db=db,
-        user_id=UUID(current_user["id"])
+        user_id=current_user["id"]
     )
     return stats
 
@@ -71,7 +71,7 @@ async def mark_notification_read(
     notification = await notification_service.mark_read(
         db=db,
         notification_id=notification_id,
-        user_id=UUID(current_user["id"])
+        user_id=current_user["id"]
     )
 
     if notification is None:
@@ -95,7 +95,7 @@ async def mark_all_notifications_read(
     """
     count = await notification_service.mark_all_read(
         db=db,
-        user_id=UUID(current_user["id"])
+        user_id=current_user["id"]
     )
     return {"updated_count": count}
 
@@ -115,6 +115,6 @@ async def bulk_mark_notifications_read(
     count = await notification_service.bulk_mark_read(
         db=db,
         notification_ids=data.notification_ids,
-        user_id=UUID(current_user["id"])
+        user_id=current_user["id"]
     )
     return {"updated_count": count}
@@ -7,11 +7,13 @@ Provides REST API for managing segments and offerings in the CRM.
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import after_commit, get_db
 from app.core.deps import get_current_active_user, require_roles
-from app.models.segment import SegmentStatusEnum, OfferingStatusEnum
+from app.models.segment import Segment, SegmentStatusEnum, OfferingStatusEnum
 from app.schemas.segment import (
     SegmentCreate,
     SegmentUpdate,
@@ -22,12 +24,33 @@ from app.schemas.segment import (
     OfferingResponse,
     OfferingBrief,
 )
-from app.services import segment_service
+from app.services import segment_cache, segment_service
 
 
 # Create routers
 router = APIRouter()
 
+# Built once at import; list endpoints dump to JSON-ready data in a single pass
+_SEGMENT_LIST = TypeAdapter(list[SegmentWithStats])
+_OFFERING_LIST = TypeAdapter(list[OfferingResponse])
+
+
+def _segment_with_stats(segment: Segment, stats: dict) -> SegmentWithStats:
+    """Build the response model for a segment loaded with its offerings and creator."""
+    return SegmentWithStats(
+        id=segment.id,
+        name=segment.name,
+        description=segment.description,
+        research_filter_requirements=segment.research_filter_requirements,
+        status=segment.status,
+        created_by=segment.created_by,
+        created_by_name=segment.created_by_name,
+        created_at=segment.created_at,
+        updated_at=segment.updated_at,
+        offerings=segment.offerings,
+        **stats,
+    )
+
 
 # Segment Endpoints
 
@@ -36,7 +59,7 @@ async def list_segments(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records to return"),
     status: SegmentStatusEnum | None = Query(None, description="Filter by status"),
-    search: str | None = Query(None, description="Search by segment name (case-insensitive)"),
+    search: str | None = Query(None, description="Search by segment name (case-insensitive); several words also match the description"),
     current_user: dict = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -45,35 +68,26 @@ async def list_segments(
 
     Requires authentication.
     """
-    segments = await segment_service.list_segments(
-        db=db,
-        skip=skip,
-        limit=limit,
-        status_filter=status,
-        search=search
-    )
+    key = (skip, limit, status, search)
+    page = segment_cache.get_segment_page(key)
+
+    if page is None:
+        segments = await segment_service.list_segments(
+            db=db,
+            skip=skip,
+            limit=limit,
+            status_filter=status,
+            search=search
+        )
+
+        # Stats come back with each segment (no per-segment queries)
+        page = _SEGMENT_LIST.dump_python(
+            [_segment_with_stats(segment, stats) for segment, stats in segments],
+            mode="json"
+        )
+        segment_cache.put_segment_page(key, page)
 
-    # Build response with stats for each segment
-    result = []
-    for segment in segments:
-        stats = await segment_service.get_segment_stats(db=db, segment_id=segment.id)
-        result.append(SegmentWithStats(
-            id=segment.id,
-            name=segment.name,
-            description=segment.description,
-            research_filter_requirements=segment.research_filter_requirements,
-            status=segment.status,
-            created_by=segment.created_by,
-            created_by_name=segment.created_by_name,
-            created_at=segment.created_at,
-            updated_at=segment.updated_at,
-            offerings=segment.offerings,
-            company_count=stats["company_count"],
-            contact_count=stats["contact_count"],
-            pending_company_count=stats["pending_company_count"],
-        ))
-
-    return result
+    return ORJSONResponse(page)
 
 
 @router.post("/segments/", response_model=SegmentResponse, status_code=status.HTTP_201_CREATED)
@@ -88,12 +102,13 @@ async def create_segment(
     Requires admin or segment_owner role.
     """
     try:
-        created_by = UUID(current_user["id"])
+        created_by = current_user["id"]
         segment = await segment_service.create_segment(
             db=db,
             data=segment_data,
             created_by=created_by
         )
+        after_commit(db, segment_cache.invalidate)
         return segment
     except Exception as e:
         # Handle unique constraint violations or other database errors
@@ -119,35 +134,18 @@ async def get_segment(
 
     Requires authentication.
     """
-    segment = await segment_service.get_segment(db=db, segment_id=segment_id)
+    found = await segment_service.get_segment_with_stats(db=db, segment_id=segment_id)
 
-    if not segment:
+    if found is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Segment with id {segment_id} not found"
         )
 
-    # Get segment statistics
-    stats = await segment_service.get_segment_stats(db=db, segment_id=segment_id)
-
-    # Convert to response model with stats
-    segment_dict = {
-        "id": segment.id,
-        "name": segment.name,
-        "description": segment.description,
-        "research_filter_requirements": segment.research_filter_requirements,
-        "status": segment.status,
-        "created_by": segment.created_by,
-        "created_by_name": segment.created_by_name,
-        "created_at": segment.created_at,
-        "updated_at": segment.updated_at,
-        "offerings": segment.offerings,
-        "company_count": stats["company_count"],
-        "contact_count": stats["contact_count"],
-        "pending_company_count": stats["pending_company_count"]
-    }
-
-    return segment_dict
+    segment, stats = found
+
+    # Serialized here, so the response is validated once and rendered straight by orjson
+    return ORJSONResponse(_segment_with_stats(segment, stats).model_dump(mode="json"))
 
 
 @router.patch("/segments/{segment_id}", response_model=SegmentResponse)
@@ -168,6 +166,7 @@ async def update_segment(
             segment_id=segment_id,
             data=segment_data
         )
+        after_commit(db, segment_cache.invalidate)
         return segment
     except ValueError as e:
         raise HTTPException(
@@ -199,6 +198,7 @@ async def archive_segment(
     """
     try:
         segment = await segment_service.archive_segment(db=db, segment_id=segment_id)
+        after_commit(db, segment_cache.invalidate)
         return segment
     except ValueError as e:
         raise HTTPException(
@@ -236,7 +236,7 @@ async def list_offerings(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records to return"),
     status: OfferingStatusEnum | None = Query(None, description="Filter by status"),
-    search: str | None = Query(None, description="Search by offering name (case-insensitive)"),
+    search: str | None = Query(None, description="Search by offering name (case-insensitive); several words also match the description"),
     current_user: dict = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -245,15 +245,24 @@ async def list_offerings(
 
     Requires authentication.
     """
-    offerings = await segment_service.list_offerings(
-        db=db,
-        skip=skip,
-        limit=limit,
-        status_filter=status,
-        search=search
-    )
+    key = (skip, limit, status, search)
+    page = segment_cache.get_offering_page(key)
+
+    if page is None:
+        offerings = await segment_service.list_offerings(
+            db=db,
+            skip=skip,
+            limit=limit,
+            status_filter=status,
+            search=search
+        )
+        page = _OFFERING_LIST.dump_python(
+            _OFFERING_LIST.validate_python(offerings, from_attributes=True),
+            mode="json"
+        )
+        segment_cache.put_offering_page(key, page)
 
-    return offerings
+    return ORJSONResponse(page)
 
 
 @router.post("/offerings/", response_model=OfferingResponse, status_code=status.HTTP_201_CREATED)
@@ -269,6 +278,7 @@ async def create_offering(
     """
     try:
         offering = await segment_service.create_offering(db=db, data=offering_data)
+        after_commit(db, segment_cache.invalidate)
         return offering
     except Exception as e:
         if "unique" in str(e).lower():
@@ -322,6 +332,7 @@ async def update_offering(
             offering_id=offering_id,
             data=offering_data
         )
+        after_commit(db, segment_cache.invalidate)
         return offering
     except ValueError as e:
         raise HTTPException(
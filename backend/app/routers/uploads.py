@@ -1,7 +1,9 @@
 """Upload endpoints for CSV file processing."""
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -12,14 +14,18 @@ from app.services import upload_service
 
 router = APIRouter()
 
+# Built once at import; the list endpoint dumps ORM rows to JSON-ready dicts in a single pass
+_BATCH_LIST = TypeAdapter(list[UploadBatchResponse])
+
 
 @router.post(
     "/companies",
     response_model=UploadBatchResponse,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Upload company CSV file"
 )
 async def upload_companies(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="CSV file containing company data"),
     segment_id: UUID = Form(..., description="Segment ID to assign companies to"),
     db: AsyncSession = Depends(get_db),
@@ -48,8 +54,12 @@ async def upload_companies(
     All companies are created with status=pending and require approval.
     Duplicate detection runs automatically after upload.
 
+    The file is imported in the background: the batch is returned right away
+    with status=processing, and GET /uploads/{batch_id} reports its statistics
+    once it is completed or failed.
+
     Returns:
-        Upload batch details with statistics and error information
+        Upload batch details (status=processing)
     """
     # Validate file type
     if not file.filename or not file.filename.endswith('.csv'):
@@ -58,10 +68,8 @@ async def upload_companies(
             detail="Only CSV files are supported"
         )
 
-    # Validate file size (10MB limit)
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
+    # Validate file size (10MB limit); the size is recorded while the form is parsed
+    file_size = file.size or 0
 
     if file_size > 10 * 1024 * 1024:  # 10MB
         raise HTTPException(
@@ -76,52 +84,41 @@ async def upload_companies(
         )
 
     try:
-        batch, errors = await upload_service.process_company_csv(
-            db=db,
-            file=file,
-            segment_id=segment_id,
-            created_by=UUID(current_user["id"])
-        )
-
-        # Build response with error details if any
-        response_data = {
-            "id": batch.id,
-            "upload_type": batch.upload_type,
-            "file_name": batch.file_name,
-            "file_size_bytes": batch.file_size_bytes,
-            "total_rows": batch.total_rows,
-            "valid_rows": batch.valid_rows,
-            "invalid_rows": batch.invalid_rows,
-            "status": batch.status,
-            "error_report_url": None,
-            "uploaded_by": batch.uploaded_by,
-            "created_at": batch.created_at
-        }
-
-        # Store errors in batch for retrieval
-        if errors:
-            # In production, you'd store this in object storage or a separate table
-            # For now, we'll just return it inline
-            batch.error_report_url = f"/api/v1/uploads/{batch.id}/errors"
-            await db.flush()
-            response_data["error_report_url"] = batch.error_report_url
-
-        return response_data
-
-    except Exception as e:
+        await upload_service.resolve_upload_target(db, company_id=None, segment_id=segment_id)
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error processing CSV file: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
         )
 
+    batch = await upload_service.create_batch(
+        db=db,
+        upload_type=UploadTypeEnum.COMPANY,
+        file_name=file.filename,
+        file_size_bytes=file_size,
+        uploaded_by=current_user["id"]
+    )
+    path = await upload_service.spool_upload(file)
+
+    background_tasks.add_task(
+        upload_service.run_company_upload,
+        batch.id,
+        path,
+        segment_id=segment_id,
+        created_by=current_user["id"]
+    )
+
+    return batch
+
 
 @router.post(
     "/contacts",
     response_model=UploadBatchResponse,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Upload contact CSV file"
 )
 async def upload_contacts(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="CSV file containing contact data"),
     company_id: UUID | None = Form(None, description="Company ID to assign all contacts to"),
     segment_id: UUID | None = Form(None, description="Segment ID (required if company_id not provided)"),
@@ -160,8 +157,12 @@ async def upload_contacts(
     All contacts are created with status=uploaded.
     Duplicate detection runs automatically after upload.
 
+    The file is imported in the background: the batch is returned right away
+    with status=processing, and GET /uploads/{batch_id} reports its statistics
+    once it is completed or failed.
+
     Returns:
-        Upload batch details with statistics and error information
+        Upload batch details (status=processing)
     """
     # Validate that either company_id or segment_id is provided
     if not company_id and not segment_id:
@@ -177,12 +178,10 @@ async def upload_contacts(
             detail="Only CSV files are supported"
         )
 
-    # Validate file size (10MB limit)
-    file.file.seek(0, 2)
-    file_size = file.file.tell()
-    file.file.seek(0)
+    # Validate file size (10MB limit); the size is recorded while the form is parsed
+    file_size = file.size or 0
 
-    if file_size > 10 * 1024 * 1024:
+    if file_size > 10 * 1024 * 1024:  # 10MB
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="File size exceeds 10MB limit"
@@ -195,43 +194,33 @@ async def upload_contacts(
         )
 
     try:
-        batch, errors = await upload_service.process_contact_csv(
-            db=db,
-            file=file,
-            company_id=company_id,
-            segment_id=segment_id,
-            created_by=UUID(current_user["id"])
-        )
-
-        # Build response with error details if any
-        response_data = {
-            "id": batch.id,
-            "upload_type": batch.upload_type,
-            "file_name": batch.file_name,
-            "file_size_bytes": batch.file_size_bytes,
-            "total_rows": batch.total_rows,
-            "valid_rows": batch.valid_rows,
-            "invalid_rows": batch.invalid_rows,
-            "status": batch.status,
-            "error_report_url": None,
-            "uploaded_by": batch.uploaded_by,
-            "created_at": batch.created_at
-        }
-
-        # Store errors in batch for retrieval
-        if errors:
-            batch.error_report_url = f"/api/v1/uploads/{batch.id}/errors"
-            await db.flush()
-            response_data["error_report_url"] = batch.error_report_url
-
-        return response_data
-
-    except Exception as e:
+        segment_id = await upload_service.resolve_upload_target(db, company_id=company_id, segment_id=segment_id)
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error processing CSV file: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
         )
 
+    batch = await upload_service.create_batch(
+        db=db,
+        upload_type=UploadTypeEnum.CONTACT,
+        file_name=file.filename,
+        file_size_bytes=file_size,
+        uploaded_by=current_user["id"]
+    )
+    path = await upload_service.spool_upload(file)
+
+    background_tasks.add_task(
+        upload_service.run_contact_upload,
+        batch.id,
+        path,
+        company_id=company_id,
+        segment_id=segment_id,
+        created_by=current_user["id"]
+    )
+
+    return batch
+
 
 @router.get(
     "/",
@@ -261,7 +250,7 @@ async def list_uploads(
     if limit > 100:
         limit = 100
 
-    batches = await upload_service.list_batches(
+    batches, total = await upload_service.list_batches(
         db=db,
         skip=skip,
         limit=limit,
@@ -269,21 +258,15 @@ async def list_uploads(
         status=status
     )
 
-    total = await upload_service.count_batches(
-        db=db,
-        upload_type=upload_type,
-        status=status
-    )
-
-    return {
-        "items": [
-            UploadBatchResponse.model_validate(batch)
-            for batch in batches
-        ],
+    return ORJSONResponse({
+        "items": _BATCH_LIST.dump_python(
+            _BATCH_LIST.validate_python(batches, from_attributes=True),
+            mode="json"
+        ),
         "total": total,
         "skip": skip,
         "limit": limit
-    }
+    })
 
 
 @router.get(
@@ -3,7 +3,6 @@ User management endpoints for creating, updating, and managing users.
 """
 
 import logging
-import math
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -42,15 +41,15 @@ async def list_users(
     """
     skip = (page - 1) * per_page
 
-    # Fetch users and total count
-    users = await auth_service.list_users(db, skip=skip, limit=per_page, status_filter=status_filter)
-    total = await auth_service.count_users(db, status_filter=status_filter)
+    # Fetch users and total count (one query)
+    users, total = await auth_service.list_users(db, skip=skip, limit=per_page, status_filter=status_filter)
 
-    total_pages = math.ceil(total / per_page) if total > 0 else 0
+    total_pages = -(-total // per_page)
 
     logger.info(
-        f"User list requested by {current_user['email']} - "
-        f"Page: {page}, Per page: {per_page}, Status: {status_filter or 'all'}, Total: {total}"
+        "User list requested by %s - "
+        "Page: %s, Per page: %s, Status: %s, Total: %s",
+        current_user['email'], page, per_page, status_filter or 'all', total
     )
 
     return UserListResponse(
@@ -76,13 +75,13 @@ async def get_user(
     user = await auth_service.get_user_by_id(db, user_id)
 
     if user is None:
-        logger.warning(f"User not found: {user_id} (requested by {current_user['email']})")
+        logger.warning("User not found: %s (requested by %s)", user_id, current_user['email'])
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {user_id} not found"
         )
 
-    logger.info(f"User detail retrieved: {user['email']} by {current_user['email']}")
+    logger.info("User detail retrieved: %s by %s", user['email'], current_user['email'])
 
     return UserResponse(**user)
 
@@ -102,8 +101,9 @@ async def create_user(
     existing_user = await auth_service.get_user_by_email(db, user_data.email)
     if existing_user:
         logger.warning(
-            f"Attempt to create user with existing email: {user_data.email} "
-            f"by {current_user['email']}"
+            "Attempt to create user with existing email: %s "
+            "by %s",
+            user_data.email, current_user['email']
         )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -121,14 +121,15 @@ async def create_user(
         )
 
         logger.info(
-            f"User created: {user['email']} (ID: {user['id']}) "
-            f"with roles {user['roles']} by {current_user['email']}"
+            "User created: %s (ID: %s) "
+            "with roles %s by %s",
+            user['email'], user['id'], user['roles'], current_user['email']
         )
 
         return UserResponse(**user)
 
     except Exception as e:
-        logger.error(f"Failed to create user {user_data.email}: {str(e)}")
+        logger.error("Failed to create user %s: %s", user_data.email, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create user: {str(e)}"
@@ -150,7 +151,7 @@ async def update_user(
     # Check if user exists
     user = await auth_service.get_user_by_id(db, user_id)
     if user is None:
-        logger.warning(f"Attempt to update non-existent user: {user_id} by {current_user['email']}")
+        logger.warning("Attempt to update non-existent user: %s by %s", user_id, current_user['email'])
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {user_id} not found"
@@ -161,8 +162,9 @@ async def update_user(
         existing_user = await auth_service.get_user_by_email(db, user_data.email)
         if existing_user:
             logger.warning(
-                f"Attempt to change user {user_id} email to existing email: {user_data.email} "
-                f"by {current_user['email']}"
+                "Attempt to change user %s email to existing email: %s "
+                "by %s",
+                user_id, user_data.email, current_user['email']
             )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -179,13 +181,14 @@ async def update_user(
         )
 
         logger.info(
-            f"User updated: {updated_user['email']} (ID: {user_id}) by {current_user['email']}"
+            "User updated: %s (ID: %s) by %s",
+            updated_user['email'], user_id, current_user['email']
         )
 
         return UserResponse(**updated_user)
 
     except Exception as e:
-        logger.error(f"Failed to update user {user_id}: {str(e)}")
+        logger.error("Failed to update user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update user: {str(e)}"
@@ -206,32 +209,32 @@ async def deactivate_user(
     # Check if user exists
     user = await auth_service.get_user_by_id(db, user_id)
     if user is None:
-        logger.warning(f"Attempt to deactivate non-existent user: {user_id} by {current_user['email']}")
+        logger.warning("Attempt to deactivate non-existent user: %s by %s", user_id, current_user['email'])
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {user_id} not found"
         )
 
     # Prevent self-deactivation
-    if str(user_id) == current_user["id"]:
-        logger.warning(f"User attempted to deactivate themselves: {current_user['email']}")
+    if user_id == current_user["id"]:
+        logger.warning("User attempted to deactivate themselves: %s", current_user['email'])
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You cannot deactivate your own account"
         )
 
     if user["status"] == "deactivated":
-        logger.info(f"User already deactivated: {user['email']} by {current_user['email']}")
+        logger.info("User already deactivated: %s by %s", user['email'], current_user['email'])
         return MessageResponse(message=f"User {user['email']} is already deactivated")
 
     try:
         await auth_service.deactivate_user(db, user_id)
-        logger.info(f"User deactivated: {user['email']} (ID: {user_id}) by {current_user['email']}")
+        logger.info("User deactivated: %s (ID: %s) by %s", user['email'], user_id, current_user['email'])
 
         return MessageResponse(message=f"User {user['email']} has been deactivated")
 
     except Exception as e:
-        logger.error(f"Failed to deactivate user {user_id}: {str(e)}")
+        logger.error("Failed to deactivate user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to deactivate user: {str(e)}"
@@ -252,24 +255,24 @@ async def activate_user(
     # Check if user exists
     user = await auth_service.get_user_by_id(db, user_id)
     if user is None:
-        logger.warning(f"Attempt to activate non-existent user: {user_id} by {current_user['email']}")
+        logger.warning("Attempt to activate non-existent user: %s by %s", user_id, current_user['email'])
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {user_id} not found"
         )
 
     if user["status"] == "active":
-        logger.info(f"User already active: {user['email']} by {current_user['email']}")
+        logger.info("User already active: %s by %s", user['email'], current_user['email'])
         return MessageResponse(message=f"User {user['email']} is already active")
 
     try:
         await auth_service.activate_user(db, user_id)
-        logger.info(f"User activated: {user['email']} (ID: {user_id}) by {current_user['email']}")
+        logger.info("User activated: %s (ID: %s) by %s", user['email'], user_id, current_user['email'])
 
         return MessageResponse(message=f"User {user['email']} has been activated")
 
     except Exception as e:
-        logger.error(f"Failed to activate user {user_id}: {str(e)}")
+        logger.error("Failed to activate user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to activate user: {str(e)}"
@@ -291,16 +294,17 @@ async def update_user_roles(
     # Check if user exists
     user = await auth_service.get_user_by_id(db, user_id)
     if user is None:
-        logger.warning(f"Attempt to update roles for non-existent user: {user_id} by {current_user['email']}")
+        logger.warning("Attempt to update roles for non-existent user: %s by %s", user_id, current_user['email'])
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with ID {user_id} not found"
         )
 
     # Prevent removing admin role from self
-    if str(user_id) == current_user["id"] and "admin" not in roles_data.roles:
+    if user_id == current_user["id"] and "admin" not in roles_data.roles:
         logger.warning(
-            f"User attempted to remove their own admin role: {current_user['email']}"
+            "User attempted to remove their own admin role: %s",
+            current_user['email']
         )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -311,14 +315,15 @@ async def update_user_roles(
         updated_user = await auth_service.update_user_roles(db, user_id, roles_data.roles)
 
         logger.info(
-            f"User roles updated: {updated_user['email']} (ID: {user_id}) - "
-            f"New roles: {updated_user['roles']} by {current_user['email']}"
+            "User roles updated: %s (ID: %s) - "
+            "New roles: %s by %s",
+            updated_user['email'], user_id, updated_user['roles'], current_user['email']
         )
 
         return UserResponse(**updated_user)
 
     except Exception as e:
-        logger.error(f"Failed to update roles for user {user_id}: {str(e)}")
+        logger.error("Failed to update roles for user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update user roles: {str(e)}"
@@ -340,7 +345,8 @@ async def get_user_permissions(
     user = await auth_service.get_user_by_id(db, user_id)
     if user is None:
         logger.warning(
-            f"Attempt to get permissions for non-existent user: {user_id} by {current_user['email']}"
+            "Attempt to get permissions for non-existent user: %s by %s",
+            user_id, current_user['email']
         )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -351,8 +357,9 @@ async def get_user_permissions(
         permissions = await auth_service.get_user_permissions(db, user_id)
 
         logger.info(
-            f"Permissions retrieved for user: {user['email']} (ID: {user_id}) "
-            f"by {current_user['email']} - {len(permissions)} permissions"
+            "Permissions retrieved for user: %s (ID: %s) "
+            "by %s - %s permissions",
+            user['email'], user_id, current_user['email'], len(permissions)
         )
 
         return UserPermissionsResponse(
@@ -361,7 +368,7 @@ async def get_user_permissions(
         )
 
     except Exception as e:
-        logger.error(f"Failed to get permissions for user {user_id}: {str(e)}")
+        logger.error("Failed to get permissions for user %s: %s", user_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get user permissions: {str(e)}"
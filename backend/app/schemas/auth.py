@@ -2,6 +2,8 @@
 Pydantic schemas for authentication endpoints.
 """
 
+from uuid import UUID
+
 from pydantic import BaseModel, EmailStr, Field
 
 
@@ -25,7 +27,7 @@ class AccessToken(BaseModel):
 
 class UserResponse(BaseModel):
     """User information response schema."""
-    id: str
+    id: UUID
     email: str
     name: str
     status: str
@@ -0,0 +1,80 @@
+"""
+Short-lived cache of assignment list responses.
+
+Dashboards poll the assignment list endpoints with identical parameters, so
+the serialized results are kept in-process for a few seconds. Entries are
+grouped per user and per entity so that creating or deleting an assignment
+drops every cached page that could contain it.
+"""
+
+from typing import Hashable
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from app.models.assignment import EntityTypeEnum
+
+# scope -> {query params -> JSON-ready assignment dicts}
+# scope is ("user", assigned_to) or ("entity", entity_type, entity_id)
+_cache: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+
+
+def user_scope(assigned_to: UUID) -> tuple:
+    """Cache scope for assignments received by a user."""
+    return ("user", assigned_to)
+
+
+def entity_scope(entity_type: EntityTypeEnum, entity_id: UUID) -> tuple:
+    """Cache scope for assignments on an entity."""
+    return ("entity", entity_type, entity_id)
+
+
+def get(scope: tuple, params: Hashable = None) -> list[dict] | None:
+    """
+    Return a cached assignment list, if present.
+
+    Args:
+        scope: Scope built by user_scope or entity_scope
+        params: Remaining query parameters (filters, pagination)
+
+    Returns:
+        Cached list of assignments, or None on a miss
+    """
+    entries = _cache.get(scope)
+    if entries is None:
+        return None
+    return entries.get(params)
+
+
+def put(scope: tuple, params: Hashable, assignments: list[dict]) -> None:
+    """
+    Store an assignment list.
+
+    Args:
+        scope: Scope built by user_scope or entity_scope
+        params: Remaining query parameters (filters, pagination)
+        assignments: Serialized assignments to cache
+    """
+    entries = _cache.get(scope)
+    if entries is None:
+        entries = {}
+        _cache[scope] = entries
+    entries[params] = assignments
+
+
+def invalidate(
+    entity_type: EntityTypeEnum,
+    entity_ids: list[UUID],
+    assigned_to: UUID
+) -> None:
+    """
+    Drop every cached list an assignment change could affect.
+
+    Args:
+        entity_type: Type of the assigned entities
+        entity_ids: UUIDs of the assigned entities
+        assigned_to: UUID of the assigned user
+    """
+    _cache.pop(user_scope(assigned_to), None)
+    for entity_id in entity_ids:
+        _cache.pop(entity_scope(entity_type, entity_id), None)
@@ -2,10 +2,22 @@
 from uuid import UUID
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from app.models.assignment import Assignment, EntityTypeEnum
+from app.models.company import Company
+from app.models.contact import Contact
+from app.models.segment import Segment
+from app.models.user import User
+
+# Table backing each polymorphic entity type (assignments.entity_id has no FK)
+_ENTITY_MODELS = {
+    EntityTypeEnum.SEGMENT: Segment,
+    EntityTypeEnum.COMPANY: Company,
+    EntityTypeEnum.CONTACT: Contact,
+}
 
 
 async def create_assignment(
@@ -14,10 +26,13 @@ async def create_assignment(
     entity_id: UUID,
     assigned_to: UUID,
     assigned_by: UUID
-) -> Assignment:
+) -> Assignment | None:
     """
     Create a new assignment.
 
+    Uses INSERT ... ON CONFLICT DO NOTHING, so an existing assignment costs one
+    round trip and leaves the transaction usable.
+
     Args:
         db: Database session
         entity_type: Type of entity (segment/company/contact)
@@ -26,23 +41,25 @@ async def create_assignment(
         assigned_by: UUID of user making the assignment
 
     Returns:
-        Created assignment instance
+        Created assignment instance, or None if the assignment already exists
 
     Raises:
-        IntegrityError: If assignment already exists (unique constraint violation)
+        IntegrityError: If assigned_to does not reference an existing user
     """
-    assignment = Assignment(
-        entity_type=entity_type,
-        entity_id=entity_id,
-        assigned_to=assigned_to,
-        assigned_by=assigned_by
+    stmt = (
+        pg_insert(Assignment)
+        .values(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            assigned_to=assigned_to,
+            assigned_by=assigned_by
+        )
+        .on_conflict_do_nothing(constraint="unique_assignment")
+        .returning(Assignment)
     )
+    result = await db.scalars(stmt)
 
-    db.add(assignment)
-    await db.flush()
-    await db.refresh(assignment)
-
-    return assignment
+    return result.one_or_none()
 
 
 async def create_bulk_assignments(
@@ -55,6 +72,9 @@ async def create_bulk_assignments(
     """
     Create multiple assignments at once.
 
+    Rows are written with a single batched INSERT ... ON CONFLICT DO NOTHING,
+    so existing assignments are skipped instead of aborting the transaction.
+
     Args:
         db: Database session
         entity_type: Type of entity (segment/company/contact)
@@ -63,25 +83,62 @@ async def create_bulk_assignments(
         assigned_by: UUID of user making the assignment
 
     Returns:
-        List of created assignment instances
+        List of created assignment instances (in no particular order); shorter
+        than entity_ids when some assignments already existed
+
+    Raises:
+        ValueError: If any of the entities does not exist
     """
-    assignments = []
-    for entity_id in entity_ids:
-        assignment = Assignment(
-            entity_type=entity_type,
-            entity_id=entity_id,
-            assigned_to=assigned_to,
-            assigned_by=assigned_by
+    if not entity_ids:
+        return []
+
+    missing = await find_missing_entities(db, entity_type, entity_ids)
+    if missing:
+        raise ValueError(
+            f"{entity_type.value.capitalize()} not found: {', '.join(str(entity_id) for entity_id in missing)}"
         )
-        assignments.append(assignment)
 
-    db.add_all(assignments)
-    await db.flush()
+    rows = [
+        {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "assigned_to": assigned_to,
+            "assigned_by": assigned_by,
+        }
+        for entity_id in entity_ids
+    ]
+
+    stmt = (
+        pg_insert(Assignment)
+        .on_conflict_do_nothing(constraint="unique_assignment")
+        .returning(Assignment)
+    )
+    result = await db.scalars(stmt, rows)
+
+    return list(result.all())
+
 
-    for assignment in assignments:
-        await db.refresh(assignment)
+async def find_missing_entities(
+    db: AsyncSession,
+    entity_type: EntityTypeEnum,
+    entity_ids: list[UUID]
+) -> list[UUID]:
+    """
+    Find which of the given entities do not exist, using a single query.
+
+    Args:
+        db: Database session
+        entity_type: Type of entity (segment/company/contact)
+        entity_ids: List of entity UUIDs
+
+    Returns:
+        Missing entity UUIDs, in request order
+    """
+    model = _ENTITY_MODELS[entity_type]
+    result = await db.execute(select(model.id).where(model.id.in_(entity_ids)))
+    existing = set(result.scalars().all())
 
-    return assignments
+    return [entity_id for entity_id in dict.fromkeys(entity_ids) if entity_id not in existing]
 
 
 async def delete_assignment(
@@ -205,3 +262,20 @@ async def count_assignments_for_user(
 
     result = await db.execute(query)
     return result.scalar() or 0
+
+
+async def user_has_assignments(db: AsyncSession, user_id: UUID) -> bool:
+    """
+    Read a user's has_assignments flag from the database.
+
+    The flag is maintained by trigger and served from the users covering index.
+
+    Args:
+        db: Database session
+        user_id: UUID of the user
+
+    Returns:
+        True if the user has at least one assignment
+    """
+    result = await db.execute(select(User.has_assignments).where(User.id == user_id))
+    return bool(result.scalar())
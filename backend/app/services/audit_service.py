@@ -1,9 +1,11 @@
 """Audit log service layer for business logic."""
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import before_cursor
 from app.models.audit_log import AuditLog
 from app.schemas.audit_log import AuditLogFilter
 
@@ -49,7 +51,8 @@ async def list_logs(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 50,
-    filters: AuditLogFilter | None = None
+    filters: AuditLogFilter | None = None,
+    after: tuple[datetime, UUID] | None = None
 ) -> list[AuditLog]:
     """
     List audit logs with pagination and filters.
@@ -59,32 +62,48 @@ async def list_logs(
         skip: Number of records to skip
         limit: Maximum number of records to return
         filters: Optional filter criteria
+        after: Optional keyset cursor (created_at, id) of the last log already served
 
     Returns:
         List of audit log instances
     """
-    query = select(AuditLog)
+    # Built as a lambda statement: each lambda's SQL is cached by its code location, so
+    # a request only pays for binding the filter values, not for rebuilding the query
+    query = lambda_stmt(lambda: select(AuditLog))
 
     if filters:
-        if filters.actor_id is not None:
-            query = query.where(AuditLog.actor_id == filters.actor_id)
+        actor_id = filters.actor_id
+        action = filters.action
+        entity_type = filters.entity_type
+        entity_id = filters.entity_id
+        start_date = filters.start_date
+        end_date = filters.end_date
 
-        if filters.action is not None:
-            query = query.where(AuditLog.action == filters.action)
+        if actor_id is not None:
+            query += lambda s: s.where(AuditLog.actor_id == actor_id)
 
-        if filters.entity_type is not None:
-            query = query.where(AuditLog.entity_type == filters.entity_type)
+        if action is not None:
+            query += lambda s: s.where(AuditLog.action == action)
 
-        if filters.entity_id is not None:
-            query = query.where(AuditLog.entity_id == filters.entity_id)
+        if entity_type is not None:
+            query += lambda s: s.where(AuditLog.entity_type == entity_type)
 
-        if filters.start_date is not None:
-            query = query.where(AuditLog.created_at >= filters.start_date)
+        if entity_id is not None:
+            query += lambda s: s.where(AuditLog.entity_id == entity_id)
 
-        if filters.end_date is not None:
-            query = query.where(AuditLog.created_at <= filters.end_date)
+        if start_date is not None:
+            query += lambda s: s.where(AuditLog.created_at >= start_date)
 
-    query = query.order_by(AuditLog.created_at.desc()).offset(skip).limit(limit)
+        if end_date is not None:
+            query += lambda s: s.where(AuditLog.created_at <= end_date)
+
+    if after is not None:
+        after_created_at, after_id = after
+        query += lambda s: s.where(
+            before_cursor(AuditLog.created_at, AuditLog.id, (after_created_at, after_id))
+        )
+
+    query += lambda s: s.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).offset(skip).limit(limit)
 
     result = await db.execute(query)
     return list(result.scalars().all())
@@ -129,12 +148,42 @@ async def count_logs(
     return result.scalar() or 0
 
 
+async def get_entity_history_version(
+    db: AsyncSession,
+    entity_type: str,
+    entity_id: UUID
+) -> tuple[int, datetime | None]:
+    """
+    Summarize an entity's audit history for cache validation.
+
+    Audit logs are append-only, so the count and latest created_at change
+    exactly when the history does.
+
+    Args:
+        db: Database session
+        entity_type: Type of entity
+        entity_id: UUID of the entity
+
+    Returns:
+        Tuple of (number of log entries, latest created_at or None)
+    """
+    query = select(func.count(), func.max(AuditLog.created_at)).where(
+        AuditLog.entity_type == entity_type,
+        AuditLog.entity_id == entity_id
+    )
+
+    result = await db.execute(query)
+    count, latest = result.one()
+    return count, latest
+
+
 async def get_entity_history(
     db: AsyncSession,
     entity_type: str,
     entity_id: UUID,
     skip: int = 0,
-    limit: int = 50
+    limit: int = 50,
+    after: tuple[datetime, UUID] | None = None
 ) -> list[AuditLog]:
     """
     Get audit history for a specific entity.
@@ -145,20 +194,20 @@ async def get_entity_history(
         entity_id: UUID of the entity
         skip: Number of records to skip
         limit: Maximum number of records to return
+        after: Optional keyset cursor (created_at, id) of the last log already served
 
     Returns:
         List of audit log instances for the entity
     """
-    query = (
-        select(AuditLog)
-        .where(
-            AuditLog.entity_type == entity_type,
-            AuditLog.entity_id == entity_id
-        )
-        .order_by(AuditLog.created_at.desc())
-        .offset(skip)
-        .limit(limit)
+    query = select(AuditLog).where(
+        AuditLog.entity_type == entity_type,
+        AuditLog.entity_id == entity_id
     )
 
+    if after is not None:
+        query = query.where(before_cursor(AuditLog.created_at, AuditLog.id, after))
+
+    query = query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).offset(skip).limit(limit)
+
     result = await db.execute(query)
     return list(result.scalars().all())
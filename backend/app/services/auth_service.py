@@ -4,13 +4,21 @@ Authentication and user management service layer.
 Handles business logic for user authentication, user CRUD operations, and role management.
 """
 
+import asyncio
 from uuid import UUID
 from typing import Any
 
+from cachetools import TTLCache
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password, verify_password
+from app.core import rbac, user_cache
+from app.core.database import after_commit
+from app.core.security import hash_password, password_needs_rehash, verify_password
+
+# Whether an email belongs to a user (positive and negative), keyed by normalized email.
+# Absorbs repeated unauthenticated probes (e.g. forgot-password spam) in memory.
+_email_exists_cache: TTLCache = TTLCache(maxsize=50_000, ttl=60)
 
 
 async def authenticate_user(db: AsyncSession, email: str, password: str) -> dict | None:
@@ -26,20 +34,9 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> dict
         User dictionary if authentication successful, None otherwise
     """
     query = text("""
-        SELECT
-            u.id,
-            u.email,
-            u.name,
-            u.password_hash,
-            u.status,
-            COALESCE(
-                json_agg(ur.role) FILTER (WHERE ur.role IS NOT NULL),
-                '[]'::json
-            ) as roles
-        FROM users u
-        LEFT JOIN user_roles ur ON u.id = ur.user_id
-        WHERE u.email = :email
-        GROUP BY u.id, u.email, u.name, u.password_hash, u.status
+        SELECT id, email, name, password_hash, status, roles
+        FROM users
+        WHERE lower(email) = lower(:email)
     """)
 
     result = await db.execute(query, {"email": email})
@@ -48,20 +45,27 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> dict
     if user_row is None:
         return None
 
-    # Verify password
-    if not verify_password(password, user_row[3]):
+    # Verify password (argon2 is deliberately slow; run it off the event loop)
+    if not await asyncio.to_thread(verify_password, password, user_row[3]):
         return None
 
     # Check if user is active
     if user_row[4] != "active":
         return None
 
+    # Transparently upgrade legacy (bcrypt) or outdated hashes now that we have the plain password
+    if password_needs_rehash(user_row[3]):
+        await db.execute(
+            text("UPDATE users SET password_hash = :password_hash WHERE id = :user_id"),
+            {"password_hash": await asyncio.to_thread(hash_password, password), "user_id": user_row[0]}
+        )
+
     user = {
         "id": str(user_row[0]),
         "email": user_row[1],
         "name": user_row[2],
         "status": user_row[4],
-        "roles": user_row[5] if user_row[5] else []
+        "roles": list(user_row[5]) if user_row[5] else []
     }
 
     return user
@@ -92,7 +96,7 @@ async def create_user(
     Raises:
         Exception: If email already exists or role assignment fails
     """
-    password_hash = hash_password(password)
+    password_hash = await asyncio.to_thread(hash_password, password)
 
     # Insert user
     insert_user_query = text("""
@@ -137,6 +141,7 @@ async def create_user(
     await db.execute(insert_prefs_query, {"user_id": user_id})
 
     await db.flush()
+    after_commit(db, _email_exists_cache.pop, _normalize_email(email), None)
 
     return {
         "id": str(user_id),
@@ -188,7 +193,7 @@ async def update_user(
 
     if password is not None:
         update_parts.append("password_hash = :password_hash")
-        params["password_hash"] = hash_password(password)
+        params["password_hash"] = await asyncio.to_thread(hash_password, password)
 
     if status is not None:
         update_parts.append("status = :status")
@@ -202,7 +207,7 @@ async def update_user(
         UPDATE users
         SET {', '.join(update_parts)}
         WHERE id = :user_id
-        RETURNING id, email, name, status, created_at, updated_at
+        RETURNING id, email, name, status, created_at, updated_at, roles
     """)
 
     result = await db.execute(update_query, params)
@@ -212,16 +217,16 @@ async def update_user(
         raise ValueError(f"User with id {user_id} not found")
 
     await db.flush()
-
-    # Fetch roles
-    roles = await _get_user_roles(db, user_id)
+    after_commit(db, user_cache.invalidate_user, user_id)
+    if email is not None:
+        after_commit(db, _email_exists_cache.pop, _normalize_email(email), None)
 
     return {
         "id": str(user_row[0]),
         "email": user_row[1],
         "name": user_row[2],
         "status": user_row[3],
-        "roles": roles,
+        "roles": list(user_row[6]) if user_row[6] else [],
         "created_at": user_row[4].isoformat(),
         "updated_at": user_row[5].isoformat()
     }
@@ -252,6 +257,7 @@ async def deactivate_user(db: AsyncSession, user_id: UUID) -> None:
         raise ValueError(f"User with id {user_id} not found")
 
     await db.flush()
+    after_commit(db, user_cache.invalidate_user, user_id)
 
 
 async def activate_user(db: AsyncSession, user_id: UUID) -> None:
@@ -279,6 +285,7 @@ async def activate_user(db: AsyncSession, user_id: UUID) -> None:
         raise ValueError(f"User with id {user_id} not found")
 
     await db.flush()
+    after_commit(db, user_cache.invalidate_user, user_id)
 
 
 async def get_user_by_id(db: AsyncSession, user_id: UUID) -> dict | None:
@@ -293,21 +300,9 @@ async def get_user_by_id(db: AsyncSession, user_id: UUID) -> dict | None:
         User dictionary if found, None otherwise
     """
     query = text("""
-        SELECT
-            u.id,
-            u.email,
-            u.name,
-            u.status,
-            u.created_at,
-            u.updated_at,
-            COALESCE(
-                json_agg(ur.role) FILTER (WHERE ur.role IS NOT NULL),
-                '[]'::json
-            ) as roles
-        FROM users u
-        LEFT JOIN user_roles ur ON u.id = ur.user_id
-        WHERE u.id = :user_id
-        GROUP BY u.id, u.email, u.name, u.status, u.created_at, u.updated_at
+        SELECT id, email, name, status, created_at, updated_at, roles
+        FROM users
+        WHERE id = :user_id
     """)
 
     result = await db.execute(query, {"user_id": user_id})
@@ -323,7 +318,7 @@ async def get_user_by_id(db: AsyncSession, user_id: UUID) -> dict | None:
         "status": user_row[3],
         "created_at": user_row[4].isoformat(),
         "updated_at": user_row[5].isoformat(),
-        "roles": user_row[6] if user_row[6] else []
+        "roles": list(user_row[6]) if user_row[6] else []
     }
 
 
@@ -339,21 +334,9 @@ async def get_user_by_email(db: AsyncSession, email: str) -> dict | None:
         User dictionary if found, None otherwise
     """
     query = text("""
-        SELECT
-            u.id,
-            u.email,
-            u.name,
-            u.status,
-            u.created_at,
-            u.updated_at,
-            COALESCE(
-                json_agg(ur.role) FILTER (WHERE ur.role IS NOT NULL),
-                '[]'::json
-            ) as roles
-        FROM users u
-        LEFT JOIN user_roles ur ON u.id = ur.user_id
-        WHERE u.email = :email
-        GROUP BY u.id, u.email, u.name, u.status, u.created_at, u.updated_at
+        SELECT id, email, name, status, created_at, updated_at, roles
+        FROM users
+        WHERE lower(email) = lower(:email)
     """)
 
     result = await db.execute(query, {"email": email})
@@ -369,18 +352,57 @@ async def get_user_by_email(db: AsyncSession, email: str) -> dict | None:
         "status": user_row[3],
         "created_at": user_row[4].isoformat(),
         "updated_at": user_row[5].isoformat(),
-        "roles": user_row[6] if user_row[6] else []
+        "roles": list(user_row[6]) if user_row[6] else []
     }
 
 
+def _normalize_email(email: str) -> str:
+    """Normalize an email the way lookups compare it (case-insensitive, trimmed)."""
+    return email.strip().lower()
+
+
+async def user_email_exists(db: AsyncSession, email: str) -> bool:
+    """
+    Check whether a user with the given email exists, serving from cache when possible.
+
+    Both hits and misses are cached for up to a minute. Creating a user or
+    changing a user's email drops the entry for the new address; a renamed
+    user's old address may still report True until its entry expires.
+
+    Args:
+        db: Database session (only used on a cache miss)
+        email: Email address to check
+
+    Returns:
+        True if a user has this email, False otherwise
+    """
+    key = _normalize_email(email)
+
+    exists = _email_exists_cache.get(key)
+    if exists is not None:
+        return exists
+
+    result = await db.execute(
+        text("SELECT 1 FROM users WHERE lower(email) = :email"),
+        {"email": key}
+    )
+    exists = result.first() is not None
+    _email_exists_cache[key] = exists
+
+    return exists
+
+
 async def list_users(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 50,
     status_filter: str | None = None
-) -> list[dict]:
+) -> tuple[list[dict], int]:
     """
-    List users with pagination and optional status filter.
+    List users with pagination and optional status filter, along with the total match count.
+
+    The total is attached to every row with COUNT(*) OVER (), so only a page
+    past the end (which has no rows to carry it) needs a separate count.
 
     Args:
         db: Database session
@@ -389,27 +411,15 @@ async def list_users(
         status_filter: Optional status filter ('active' or 'deactivated')
 
     Returns:
-        List of user dictionaries
+        Tuple of (user dictionaries, total count of matching users)
     """
-    status_condition = "WHERE u.status = :status_filter" if status_filter else ""
+    status_condition = "WHERE status = :status_filter" if status_filter else ""
 
     query = text(f"""
-        SELECT
-            u.id,
-            u.email,
-            u.name,
-            u.status,
-            u.created_at,
-            u.updated_at,
-            COALESCE(
-                json_agg(ur.role) FILTER (WHERE ur.role IS NOT NULL),
-                '[]'::json
-            ) as roles
-        FROM users u
-        LEFT JOIN user_roles ur ON u.id = ur.user_id
+        SELECT id, email, name, status, created_at, updated_at, roles, COUNT(*) OVER () AS total
+        FROM users
         {status_condition}
-        GROUP BY u.id, u.email, u.name, u.status, u.created_at, u.updated_at
-        ORDER BY u.created_at DESC
+        ORDER BY created_at DESC
         LIMIT :limit OFFSET :skip
     """)
 
@@ -429,10 +439,16 @@ async def list_users(
             "status": row[3],
             "created_at": row[4].isoformat(),
             "updated_at": row[5].isoformat(),
-            "roles": row[6] if row[6] else []
+            "roles": list(row[6]) if row[6] else []
         })
 
-    return users
+    if rows:
+        return users, rows[0][7]
+
+    if skip == 0:
+        return users, 0
+
+    return users, await count_users(db, status_filter=status_filter)
 
 
 async def count_users(db: AsyncSession, status_filter: str | None = None) -> int:
@@ -502,6 +518,7 @@ async def update_user_roles(db: AsyncSession, user_id: UUID, roles: list[str]) -
                 assigned_roles.append(role_row[0])
 
     await db.flush()
+    after_commit(db, user_cache.invalidate_user, user_id)
 
     # Fetch updated user
     user = await get_user_by_id(db, user_id)
@@ -522,42 +539,11 @@ async def get_user_permissions(db: AsyncSession, user_id: UUID) -> list[str]:
     Returns:
         List of permission action strings that the user has access to
     """
-    query = text("""
-        SELECT DISTINCT rg.action
-        FROM user_roles ur
-        JOIN role_grants rg ON ur.role = rg.role
-        WHERE ur.user_id = :user_id
-        AND rg.granted = true
-        ORDER BY rg.action
-    """)
-
-    result = await db.execute(query, {"user_id": user_id})
-    rows = result.fetchall()
-
-    return [row[0] for row in rows]
-
-
-# Internal helper functions
-
-async def _get_user_roles(db: AsyncSession, user_id: UUID) -> list[str]:
-    """
-    Internal helper to fetch user roles.
-
-    Args:
-        db: Database session
-        user_id: User UUID
-
-    Returns:
-        List of role names
-    """
-    query = text("""
-        SELECT role
-        FROM user_roles
-        WHERE user_id = :user_id
-        ORDER BY role
-    """)
+    # Roles come from the cached user lookup, grants from the in-process grants map
+    user = await user_cache.get_user(db, user_id)
+    if user is None:
+        return []
 
-    result = await db.execute(query, {"user_id": user_id})
-    rows = result.fetchall()
+    permissions = await rbac.permissions_for_roles(db, user["roles"])
 
-    return [row[0] for row in rows]
+    return sorted(permissions)
@@ -0,0 +1,45 @@
+"""
+Short-lived cache of the pending-companies approval queue.
+
+Approver dashboards poll /companies/pending/list with the same pagination,
+while the queue itself changes slowly. Serialized pages are kept in-process
+for a few seconds and dropped whenever a company is created, edited,
+approved/rejected, or imported.
+"""
+
+from cachetools import TTLCache
+
+# (skip, limit) -> (ETag, JSON-ready page body)
+_pending_pages: TTLCache = TTLCache(maxsize=1_000, ttl=10)
+
+
+def get_pending_page(skip: int, limit: int) -> tuple[str, dict] | None:
+    """
+    Return a cached pending-companies page, if present.
+
+    Args:
+        skip: Number of records skipped
+        limit: Maximum number of records in the page
+
+    Returns:
+        Tuple of (ETag, page body), or None on a miss
+    """
+    return _pending_pages.get((skip, limit))
+
+
+def put_pending_page(skip: int, limit: int, etag: str, page: dict) -> None:
+    """
+    Store a pending-companies page.
+
+    Args:
+        skip: Number of records skipped
+        limit: Maximum number of records in the page
+        etag: ETag of the page
+        page: Serialized page body
+    """
+    _pending_pages[(skip, limit)] = (etag, page)
+
+
+def invalidate_pending() -> None:
+    """Drop every cached pending-companies page."""
+    _pending_pages.clear()
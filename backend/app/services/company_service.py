@@ -2,10 +2,11 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import paginate_with_total
 from app.models.company import Company, CompanyStatusEnum
 from app.models.contact import Contact
 from app.schemas.company import CompanyApproval, CompanyCreate, CompanyUpdate
@@ -79,79 +80,99 @@ async def get_company(
     return result.scalar_one_or_none()
 
 
-async def list_companies(
+async def get_company_with_contact_count(
     db: AsyncSession,
-    skip: int = 0,
-    limit: int = 50,
-    segment_id: UUID | None = None,
-    status_filter: str | None = None,
-    search: str | None = None,
-    is_duplicate: bool | None = None
-) -> list[Company]:
+    company_id: UUID
+) -> tuple[Company, int] | None:
     """
-    List companies with pagination and filters.
+    Get a company by ID together with its number of contacts, in one query.
 
     Args:
         db: Database session
-        skip: Number of records to skip
-        limit: Maximum number of records to return
-        segment_id: Optional segment filter
-        status_filter: Optional status filter
-        search: Optional case-insensitive company name search
-        is_duplicate: Optional duplicate flag filter
+        company_id: Company UUID
 
     Returns:
-        List of company instances
+        Tuple of (company instance, contact count) or None if not found
     """
-    query = select(Company).options(selectinload(Company.segment), selectinload(Company.created_by_user), selectinload(Company.approved_by_user))
+    contact_count = (
+        select(func.count(Contact.id))
+        .where(Contact.company_id == Company.id)
+        .scalar_subquery()
+    )
+    query = (
+        select(Company, contact_count.label("contact_count"))
+        .where(Company.id == company_id)
+        .options(selectinload(Company.segment), selectinload(Company.created_by_user), selectinload(Company.approved_by_user))
+    )
 
-    # Apply filters
-    if segment_id is not None:
-        query = query.where(Company.segment_id == segment_id)
+    result = await db.execute(query)
+    row = result.one_or_none()
 
-    if status_filter is not None:
-        try:
-            status_enum = CompanyStatusEnum(status_filter)
-            query = query.where(Company.status == status_enum)
-        except ValueError:
-            # Invalid status filter, return empty list
-            return []
+    if row is None:
+        return None
 
-    if search is not None and search.strip():
-        escaped = search.replace("%", "\\%").replace("_", "\\_")
-        query = query.where(Company.company_name.ilike(f"%{escaped}%"))
+    return row[0], row[1]
 
-    if is_duplicate is not None:
-        query = query.where(Company.is_duplicate == is_duplicate)
 
-    # Apply pagination and ordering
-    query = query.order_by(Company.created_at.desc()).offset(skip).limit(limit)
+async def _paginate_with_total(
+    db: AsyncSession,
+    query: Select,
+    skip: int,
+    limit: int
+) -> tuple[list[Company], int, datetime | None]:
+    """
+    Fetch one page of companies with the total match count and the list's version.
 
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    The latest updated_at across all matches (used for the list's ETag) comes
+    back in the same query as the page and the count.
+
+    Args:
+        db: Database session
+        query: Filtered and ordered company query, without pagination
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        Tuple of (company instances, total count, latest updated_at or None)
+    """
+    companies, total, (last_updated,) = await paginate_with_total(
+        db, query, skip, limit,
+        func.max(Company.updated_at),
+        options=(
+            selectinload(Company.segment),
+            selectinload(Company.created_by_user),
+            selectinload(Company.approved_by_user)
+        )
+    )
+    return companies, total, last_updated
 
 
-async def count_companies(
+async def list_companies(
     db: AsyncSession,
+    skip: int = 0,
+    limit: int = 50,
     segment_id: UUID | None = None,
     status_filter: str | None = None,
     search: str | None = None,
     is_duplicate: bool | None = None
-) -> int:
+) -> tuple[list[Company], int]:
     """
-    Count companies matching filters.
+    List companies with pagination and filters, along with the total match count.
 
     Args:
         db: Database session
+        skip: Number of records to skip
+        limit: Maximum number of records to return
         segment_id: Optional segment filter
         status_filter: Optional status filter
         search: Optional case-insensitive company name search
         is_duplicate: Optional duplicate flag filter
 
     Returns:
-        Count of matching companies
+        Tuple of (company instances, total count of matching companies,
+        latest updated_at among them or None)
     """
-    query = select(func.count(Company.id))
+    query = select(Company)
 
     # Apply filters
     if segment_id is not None:
@@ -162,8 +183,8 @@ async def count_companies(
             status_enum = CompanyStatusEnum(status_filter)
             query = query.where(Company.status == status_enum)
         except ValueError:
-            # Invalid status filter, return 0
-            return 0
+            # Invalid status filter, return empty list
+            return [], 0, None
 
     if search is not None and search.strip():
         escaped = search.replace("%", "\\%").replace("_", "\\_")
@@ -172,8 +193,9 @@ async def count_companies(
     if is_duplicate is not None:
         query = query.where(Company.is_duplicate == is_duplicate)
 
-    result = await db.execute(query)
-    return result.scalar_one()
+    query = query.order_by(Company.created_at.desc())
+
+    return await _paginate_with_total(db, query, skip, limit)
 
 
 async def update_company(
@@ -261,9 +283,9 @@ async def get_pending_companies(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 50
-) -> list[Company]:
+) -> tuple[list[Company], int]:
     """
-    Get companies awaiting approval.
+    Get companies awaiting approval, along with the total pending count.
 
     Args:
         db: Database session
@@ -271,37 +293,16 @@ async def get_pending_companies(
         limit: Maximum number of records to return
 
     Returns:
-        List of pending companies
+        Tuple of (pending companies, total count of pending companies,
+        latest updated_at among them or None)
     """
     query = (
         select(Company)
         .where(Company.status == CompanyStatusEnum.PENDING)
-        .options(selectinload(Company.segment), selectinload(Company.created_by_user), selectinload(Company.approved_by_user))
         .order_by(Company.created_at.asc())
-        .offset(skip)
-        .limit(limit)
     )
 
-    result = await db.execute(query)
-    return list(result.scalars().all())
-
-
-async def count_pending_companies(db: AsyncSession) -> int:
-    """
-    Count companies awaiting approval.
-
-    Args:
-        db: Database session
-
-    Returns:
-        Count of pending companies
-    """
-    query = select(func.count(Company.id)).where(
-        Company.status == CompanyStatusEnum.PENDING
-    )
-
-    result = await db.execute(query)
-    return result.scalar_one()
+    return await _paginate_with_total(db, query, skip, limit)
 
 
 async def mark_duplicate(
@@ -365,23 +366,3 @@ async def get_companies_by_segment(
 
     result = await db.execute(query)
     return list(result.scalars().all())
-
-
-async def get_company_contact_count(
-    db: AsyncSession,
-    company_id: UUID
-) -> int:
-    """
-    Get the count of contacts for a specific company.
-
-    Args:
-        db: Database session
-        company_id: Company UUID
-
-    Returns:
-        Count of contacts
-    """
-    query = select(func.count(Contact.id)).where(Contact.company_id == company_id)
-
-    result = await db.execute(query)
-    return result.scalar_one()
@@ -6,16 +6,34 @@ status pipeline (uploaded -> approved -> assigned_to_sdr -> meeting_scheduled),
 SDR assignment, and duplicate flagging.
 """
 
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import select, func, or_
+from sqlalchemy import ARRAY, Select, any_, bindparam, select, or_, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, joinedload, selectinload
 
+from app.core.database import AsyncSessionLocal
+from app.core.pagination import before_cursor, paginate_with_total
 from app.models.contact import Contact, ContactStatusEnum
 from app.models.company import Company
-from app.schemas.contact import ContactCreate, ContactUpdate, ContactApproval
+from app.models.user import User
+from app.schemas.contact import ContactCreate, ContactUpdate, ContactApproval, ContactResponse
+
+_Creator = aliased(User)
+_Approver = aliased(User)
+
+# Every ContactResponse field as a plain column: contact columns plus the creator/approver names
+_CONTACT_RESPONSE_COLUMNS = [
+    getattr(Contact, field)
+    for field in ContactResponse.model_fields
+    if field not in ("created_by_name", "approved_by_name")
+] + [
+    _Creator.name.label("created_by_name"),
+    _Approver.name.label("approved_by_name"),
+]
 
 
 async def create_contact(
@@ -75,14 +93,14 @@ async def create_contact(
 
     db.add(contact)
     await db.flush()
-    await db.refresh(contact, ["company", "segment", "created_by_user"])
+    await db.refresh(contact, ["created_by_user"])
 
     return contact
 
 
 async def get_contact(db: AsyncSession, contact_id: UUID) -> Contact | None:
     """
-    Get a contact by ID with eager-loaded company and segment.
+    Get a contact by ID with its creator and approver joined in.
 
     Args:
         db: Database session
@@ -93,12 +111,36 @@ async def get_contact(db: AsyncSession, contact_id: UUID) -> Contact | None:
     """
     result = await db.execute(
         select(Contact)
-        .options(selectinload(Contact.company), selectinload(Contact.segment), selectinload(Contact.created_by_user), selectinload(Contact.approved_by_user))
+        .options(joinedload(Contact.created_by_user), joinedload(Contact.approved_by_user))
         .where(Contact.id == contact_id)
     )
     return result.scalar_one_or_none()
 
 
+async def get_contact_for_response(db: AsyncSession, contact_id: UUID) -> dict | None:
+    """
+    Get a contact by ID as a dict of ContactResponse fields.
+
+    Selects exactly the response columns in one query, joining the creator's
+    and approver's names, so no ORM objects are built for read-only detail views.
+
+    Args:
+        db: Database session
+        contact_id: UUID of contact to retrieve
+
+    Returns:
+        Dict with the ContactResponse fields, or None if not found
+    """
+    result = await db.execute(
+        select(*_CONTACT_RESPONSE_COLUMNS)
+        .outerjoin(_Creator, _Creator.id == Contact.created_by)
+        .outerjoin(_Approver, _Approver.id == Contact.approved_by)
+        .where(Contact.id == contact_id)
+    )
+    row = result.mappings().one_or_none()
+    return dict(row) if row is not None else None
+
+
 async def list_contacts(
     db: AsyncSession,
     skip: int = 0,
@@ -108,10 +150,17 @@ async def list_contacts(
     status_filter: str | None = None,
     search: str | None = None,
     assigned_sdr_id: UUID | None = None,
-    is_duplicate: bool | None = None
-) -> list[Contact]:
+    is_duplicate: bool | None = None,
+    with_total: bool = True,
+    after: tuple[datetime, UUID] | None = None
+) -> tuple[list[Contact], int | None]:
     """
-    List contacts with pagination and filters.
+    List contacts with pagination and filters, along with the total match count.
+
+    The page and the total come back in one query (see paginate_with_total).
+    The window count makes Postgres visit every matching row, so callers that
+    already know the total can pass with_total=False and let the scan stop
+    after the requested page.
 
     Args:
         db: Database session
@@ -123,16 +172,15 @@ async def list_contacts(
         search: Search term for first_name, last_name, or email (case-insensitive)
         assigned_sdr_id: Filter by assigned SDR
         is_duplicate: Filter by duplicate flag
+        with_total: Whether to count all matching contacts
+        after: Optional keyset cursor (created_at, id) of the last contact already served;
+            the total then counts only the contacts after it
 
     Returns:
-        List of Contact instances
+        Tuple of (Contact instances, total count of matching contacts or None
+        when with_total is False)
     """
-    query = select(Contact).options(
-        selectinload(Contact.company),
-        selectinload(Contact.segment),
-        selectinload(Contact.created_by_user),
-        selectinload(Contact.approved_by_user)
-    )
+    query = select(Contact)
 
     # Apply filters
     if company_id:
@@ -165,72 +213,21 @@ async def list_contacts(
             )
         )
 
-    # Apply pagination and ordering
-    query = query.order_by(Contact.created_at.desc()).offset(skip).limit(limit)
-
-    result = await db.execute(query)
-    return list(result.scalars().all())
-
-
-async def count_contacts(
-    db: AsyncSession,
-    company_id: UUID | None = None,
-    segment_id: UUID | None = None,
-    status_filter: str | None = None,
-    search: str | None = None,
-    assigned_sdr_id: UUID | None = None,
-    is_duplicate: bool | None = None
-) -> int:
-    """
-    Count contacts matching the given filters.
-
-    Args:
-        db: Database session
-        company_id: Filter by company ID
-        segment_id: Filter by segment ID
-        status_filter: Filter by contact status
-        search: Search term for first_name, last_name, or email
-        assigned_sdr_id: Filter by assigned SDR
-        is_duplicate: Filter by duplicate flag
-
-    Returns:
-        Count of matching contacts
-    """
-    query = select(func.count(Contact.id))
-
-    # Apply same filters as list_contacts
-    if company_id:
-        query = query.where(Contact.company_id == company_id)
+    if after is not None:
+        query = query.where(before_cursor(Contact.created_at, Contact.id, after))
 
-    if segment_id:
-        query = query.where(Contact.segment_id == segment_id)
-
-    if status_filter:
-        try:
-            status_enum = ContactStatusEnum(status_filter)
-            query = query.where(Contact.status == status_enum)
-        except ValueError:
-            pass
-
-    if assigned_sdr_id:
-        query = query.where(Contact.assigned_sdr_id == assigned_sdr_id)
-
-    if is_duplicate is not None:
-        query = query.where(Contact.is_duplicate == is_duplicate)
+    query = query.order_by(Contact.created_at.desc(), Contact.id.desc())
+    options = (
+        selectinload(Contact.created_by_user),
+        selectinload(Contact.approved_by_user)
+    )
 
-    if search:
-        escaped = search.replace("%", "\\%").replace("_", "\\_")
-        search_pattern = f"%{escaped}%"
-        query = query.where(
-            or_(
-                Contact.first_name.ilike(search_pattern),
-                Contact.last_name.ilike(search_pattern),
-                Contact.email.ilike(search_pattern)
-            )
-        )
+    if with_total:
+        contacts, total, _ = await paginate_with_total(db, query, skip, limit, options=options)
+        return contacts, total
 
-    result = await db.execute(query)
-    return result.scalar() or 0
+    result = await db.execute(query.options(*options).offset(skip).limit(limit))
+    return list(result.scalars().all()), None
 
 
 async def update_contact(
@@ -265,7 +262,6 @@ async def update_contact(
             setattr(contact, field, value)
 
     await db.flush()
-    await db.refresh(contact, ["company", "segment", "created_by_user"])
 
     return contact
 
@@ -312,7 +308,7 @@ async def approve_contact(
         contact.approved_at = datetime.now(timezone.utc)
 
     await db.flush()
-    await db.refresh(contact, ["company", "segment", "created_by_user", "approved_by_user"])
+    await db.refresh(contact, ["approved_by_user"])
 
     return contact
 
@@ -352,20 +348,27 @@ async def assign_to_sdr(
     contact.status = ContactStatusEnum.ASSIGNED_TO_SDR
 
     await db.flush()
-    await db.refresh(contact, ["company", "segment", "created_by_user"])
 
     return contact
 
 
-async def bulk_assign_to_sdr(
+def _ids_param(contact_ids: list[UUID]):
+    """Bind contact ids as one uuid[] parameter, so the statement is the same for any batch size."""
+    return bindparam("contact_ids", contact_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+
+
+async def assign_contact_ids_to_sdr(
     db: AsyncSession,
     contact_ids: list[UUID],
     sdr_id: UUID
-) -> list[Contact]:
+) -> list[UUID]:
     """
-    Bulk assign multiple contacts to an SDR (atomic).
+    Bulk assign multiple contacts to an SDR (atomic), without loading them.
 
-    Validates all contacts first before making any changes.
+    Every approved contact is moved in one UPDATE ... WHERE id = ANY(:ids).
+    If fewer rows come back than were requested, the offending contact is
+    looked up for the error and the caller's transaction is rolled back, so
+    no contact is left half-assigned.
 
     Args:
         db: Database session
@@ -373,35 +376,112 @@ async def bulk_assign_to_sdr(
         sdr_id: UUID of SDR to assign contacts to
 
     Returns:
-        List of updated Contact instances
+        Assigned contact UUIDs, in request order without duplicates
 
     Raises:
         ValueError: If any contact not found or has invalid status
     """
-    # Phase 1: Validate all contacts exist and have correct status
-    contacts = []
-    for contact_id in contact_ids:
-        contact = await get_contact(db, contact_id)
-        if contact is None:
-            raise ValueError(f"Contact {contact_id} not found")
-        if contact.status != ContactStatusEnum.APPROVED:
+    requested = list(dict.fromkeys(contact_ids))
+
+    stmt = (
+        update(Contact)
+        .where(
+            Contact.id == any_(_ids_param(requested)),
+            Contact.status == ContactStatusEnum.APPROVED
+        )
+        .values(
+            assigned_sdr_id=sdr_id,
+            status=ContactStatusEnum.ASSIGNED_TO_SDR
+        )
+        .returning(Contact.id)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    updated_ids = set(result.scalars().all())
+
+    if len(updated_ids) != len(requested):
+        missing = [contact_id for contact_id in requested if contact_id not in updated_ids]
+        found = await db.execute(
+            select(Contact.id, Contact.status).where(Contact.id.in_(missing))
+        )
+        statuses = dict(found.all())
+        for contact_id in missing:
+            if contact_id not in statuses:
+                raise ValueError(f"Contact {contact_id} not found")
+            contact_status = ContactStatusEnum(statuses[contact_id])
             raise ValueError(
-                f"Contact {contact_id} has status '{contact.status.value}', "
+                f"Contact {contact_id} has status '{contact_status.value}', "
                 f"must be 'approved' for assignment."
             )
-        contacts.append(contact)
 
-    # Phase 2: Apply all assignments (only reached if all validations pass)
-    for contact in contacts:
-        contact.assigned_sdr_id = sdr_id
-        contact.status = ContactStatusEnum.ASSIGNED_TO_SDR
+    return requested
 
-    await db.flush()
 
-    for contact in contacts:
-        await db.refresh(contact, ["company", "segment", "created_by_user"])
+def _contacts_by_ids(contact_ids: list[UUID]) -> Select:
+    """Select contacts by id with the relationships ContactResponse reads."""
+    return (
+        select(Contact)
+        .where(Contact.id == any_(_ids_param(contact_ids)))
+        .options(
+            selectinload(Contact.created_by_user),
+            selectinload(Contact.approved_by_user)
+        )
+    )
 
-    return contacts
+
+async def bulk_assign_to_sdr(
+    db: AsyncSession,
+    contact_ids: list[UUID],
+    sdr_id: UUID
+) -> list[Contact]:
+    """
+    Bulk assign multiple contacts to an SDR (atomic).
+
+    Args:
+        db: Database session
+        contact_ids: List of contact UUIDs to assign
+        sdr_id: UUID of SDR to assign contacts to
+
+    Returns:
+        List of updated Contact instances, in request order
+
+    Raises:
+        ValueError: If any contact not found or has invalid status
+    """
+    assigned_ids = await assign_contact_ids_to_sdr(db, contact_ids, sdr_id)
+
+    result = await db.execute(
+        _contacts_by_ids(assigned_ids).execution_options(populate_existing=True)
+    )
+    contacts = {contact.id: contact for contact in result.scalars().all()}
+
+    return [contacts[contact_id] for contact_id in assigned_ids]
+
+
+async def stream_contacts_by_ids(
+    contact_ids: list[UUID],
+    batch_size: int = 500
+) -> AsyncIterator[list[Contact]]:
+    """
+    Stream contacts by id in batches from a server-side cursor.
+
+    Opens its own session, since StreamingResponse bodies are sent after the
+    request's session has been committed and closed. Reads the primary so
+    rows written by that request are visible.
+
+    Args:
+        contact_ids: Contact UUIDs to load
+        batch_size: Contacts fetched per batch
+
+    Yields:
+        Lists of Contact instances (relationships for ContactResponse loaded)
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            _contacts_by_ids(contact_ids).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.scalars().partitions():
+            yield list(partition)
 
 
 async def mark_meeting_scheduled(
@@ -436,7 +516,6 @@ async def mark_meeting_scheduled(
     contact.status = ContactStatusEnum.MEETING_SCHEDULED
 
     await db.flush()
-    await db.refresh(contact, ["company", "segment", "created_by_user"])
 
     return contact
 
@@ -468,7 +547,6 @@ async def mark_duplicate(
     contact.is_duplicate = is_duplicate
 
     await db.flush()
-    await db.refresh(contact, ["company", "segment", "created_by_user"])
 
     return contact
 
@@ -491,12 +569,13 @@ async def get_contacts_by_company(
     Returns:
         List of Contact instances
     """
-    return await list_contacts(
+    contacts, _ = await list_contacts(
         db,
         skip=skip,
         limit=limit,
         company_id=company_id
     )
+    return contacts
 
 
 async def get_contacts_by_sdr(
@@ -517,9 +596,10 @@ async def get_contacts_by_sdr(
     Returns:
         List of Contact instances
     """
-    return await list_contacts(
+    contacts, _ = await list_contacts(
         db,
         skip=skip,
         limit=limit,
         assigned_sdr_id=sdr_id
     )
+    return contacts
@@ -1,19 +1,147 @@
-"""CSV export service for generating data exports."""
+"""CSV export service for generating data exports.
+
+Exports are streamed: rows are read through a server-side cursor in batches
+and each batch is written out as a CSV chunk while the query is still
+running, so memory stays bounded by the batch size rather than the table.
+Fields are rendered to text by the query itself, leaving the C csv writer
+as the only per-row work in Python.
+
+FastAPI closes request-scoped sessions before a StreamingResponse body is
+sent, so the row generator opens its own read session.
+"""
 import csv
 import io
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import ColumnElement, Select, Text, cast, func, select
 from fastapi.responses import StreamingResponse
 
+from app.core.database import ReadSessionLocal
 from app.models.company import Company, CompanyStatusEnum
 from app.models.contact import Contact
 from app.models.segment import Segment
 
+# Rows fetched from the cursor (and written as one CSV chunk) at a time
+EXPORT_BATCH_SIZE = 1000
+
+COMPANY_HEADER = [
+    "ID",
+    "Company Name",
+    "Website",
+    "Phone",
+    "Industry",
+    "Sub-Industry",
+    "Street",
+    "City",
+    "State/Province",
+    "Country/Region",
+    "ZIP/Postal Code",
+    "Founded Year",
+    "Revenue Range",
+    "Employee Size Range",
+    "Status",
+    "Segment ID",
+    "Created By",
+    "Created At",
+    "Updated At"
+]
+
+CONTACT_HEADER = [
+    "ID",
+    "First Name",
+    "Last Name",
+    "Email",
+    "Mobile Phone",
+    "Job Title",
+    "Direct Phone",
+    "LinkedIn URL",
+    "Status",
+    "Company ID",
+    "Segment ID",
+    "Created By",
+    "Created At",
+    "Updated At"
+]
+
+SEGMENT_HEADER = [
+    "ID",
+    "Name",
+    "Description",
+    "Created By",
+    "Created At",
+    "Updated At"
+]
+
+
+def _text(column: ColumnElement) -> ColumnElement[str]:
+    """Render a column as CSV-ready text in SQL, with NULL as an empty field."""
+    return func.coalesce(cast(column, Text), "")
+
+
+def _timestamp(column: ColumnElement) -> ColumnElement[str]:
+    """Render a timestamptz column in SQL as the ISO 8601 text datetime.isoformat() gives."""
+    # isoformat() omits the fraction when microseconds are 0; .US always writes six digits
+    return func.replace(
+        func.to_char(column.op("AT TIME ZONE")("UTC"), 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'),
+        ".000000+",
+        "+"
+    )
+
+
+async def _csv_chunks(query: Select, header: Sequence[str]) -> AsyncIterator[str]:
+    """
+    Yield a CSV export chunk by chunk as rows arrive from the database.
+
+    The query selects every field already rendered as text, so each batch
+    goes straight into csv.writer.writerows without per-row Python code.
+
+    Args:
+        query: SELECT producing the export rows as text columns
+        header: CSV header row
+
+    Yields:
+        CSV text, one chunk per batch of rows
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(header)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+
+    async with ReadSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for partition in result.partitions():
+            writer.writerows(partition)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+
+def _csv_response(query: Select, header: Sequence[str], filename: str) -> StreamingResponse:
+    """
+    Build a streaming CSV download for a query.
+
+    Args:
+        query: SELECT producing the export rows as text columns
+        header: CSV header row
+        filename: Download filename
+
+    Returns:
+        StreamingResponse with CSV content
+    """
+    return StreamingResponse(
+        _csv_chunks(query, header),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}"
+        }
+    )
+
 
 async def export_companies(
-    db: AsyncSession,
     segment_id: UUID | None = None,
     status: str | None = None
 ) -> StreamingResponse:
@@ -21,14 +149,33 @@ async def export_companies(
     Export companies to CSV format.
 
     Args:
-        db: Database session
         segment_id: Optional segment filter
         status: Optional status filter
 
     Returns:
         StreamingResponse with CSV content
     """
-    query = select(Company)
+    query = select(
+        _text(Company.id),
+        Company.company_name,
+        _text(Company.company_website),
+        _text(Company.company_phone),
+        _text(Company.company_industry),
+        _text(Company.company_sub_industry),
+        _text(Company.street),
+        _text(Company.city),
+        _text(Company.state_province),
+        _text(Company.country_region),
+        _text(Company.zip_postal_code),
+        _text(Company.founded_year),
+        _text(Company.revenue_range),
+        _text(Company.employee_size_range),
+        _text(Company.status),
+        _text(Company.segment_id),
+        _text(Company.created_by),
+        _timestamp(Company.created_at),
+        _timestamp(Company.updated_at)
+    )
 
     if segment_id is not None:
         query = query.where(Company.segment_id == segment_id)
@@ -42,70 +189,10 @@ async def export_companies(
 
     query = query.order_by(Company.created_at.desc())
 
-    result = await db.execute(query)
-    companies = result.scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow([
-        "ID",
-        "Company Name",
-        "Website",
-        "Phone",
-        "Industry",
-        "Sub-Industry",
-        "Street",
-        "City",
-        "State/Province",
-        "Country/Region",
-        "ZIP/Postal Code",
-        "Founded Year",
-        "Revenue Range",
-        "Employee Size Range",
-        "Status",
-        "Segment ID",
-        "Created By",
-        "Created At",
-        "Updated At"
-    ])
-
-    for company in companies:
-        writer.writerow([
-            str(company.id),
-            company.company_name,
-            company.company_website or "",
-            company.company_phone or "",
-            company.company_industry or "",
-            company.company_sub_industry or "",
-            company.street or "",
-            company.city or "",
-            company.state_province or "",
-            company.country_region or "",
-            company.zip_postal_code or "",
-            company.founded_year or "",
-            company.revenue_range or "",
-            company.employee_size_range or "",
-            company.status.value,
-            str(company.segment_id) if company.segment_id else "",
-            str(company.created_by),
-            company.created_at.isoformat(),
-            company.updated_at.isoformat()
-        ])
-
-    output.seek(0)
-
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=companies_export.csv"
-        }
-    )
+    return _csv_response(query, COMPANY_HEADER, "companies_export.csv")
 
 
 async def export_contacts(
-    db: AsyncSession,
     company_id: UUID | None = None,
     segment_id: UUID | None = None,
     status: str | None = None
@@ -114,7 +201,6 @@ async def export_contacts(
     Export contacts to CSV format.
 
     Args:
-        db: Database session
         company_id: Optional company filter
         segment_id: Optional segment filter
         status: Optional status filter
@@ -122,7 +208,22 @@ async def export_contacts(
     Returns:
         StreamingResponse with CSV content
     """
-    query = select(Contact)
+    query = select(
+        _text(Contact.id),
+        Contact.first_name,
+        Contact.last_name,
+        Contact.email,
+        _text(Contact.mobile_phone),
+        _text(Contact.job_title),
+        _text(Contact.direct_phone_number),
+        _text(Contact.contact_linkedin_url),
+        _text(Contact.status),
+        _text(Contact.company_id),
+        _text(Contact.segment_id),
+        _text(Contact.created_by),
+        _timestamp(Contact.created_at),
+        _timestamp(Contact.updated_at)
+    )
 
     if company_id is not None:
         query = query.where(Contact.company_id == company_id)
@@ -135,103 +236,23 @@ async def export_contacts(
 
     query = query.order_by(Contact.created_at.desc())
 
-    result = await db.execute(query)
-    contacts = result.scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow([
-        "ID",
-        "First Name",
-        "Last Name",
-        "Email",
-        "Mobile Phone",
-        "Job Title",
-        "Direct Phone",
-        "LinkedIn URL",
-        "Status",
-        "Company ID",
-        "Segment ID",
-        "Created By",
-        "Created At",
-        "Updated At"
-    ])
-
-    for contact in contacts:
-        writer.writerow([
-            str(contact.id),
-            contact.first_name,
-            contact.last_name,
-            contact.email,
-            contact.mobile_phone or "",
-            contact.job_title or "",
-            contact.direct_phone_number or "",
-            contact.contact_linkedin_url or "",
-            contact.status.value,
-            str(contact.company_id) if contact.company_id else "",
-            str(contact.segment_id) if contact.segment_id else "",
-            str(contact.created_by),
-            contact.created_at.isoformat(),
-            contact.updated_at.isoformat()
-        ])
-
-    output.seek(0)
-
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=contacts_export.csv"
-        }
-    )
+    return _csv_response(query, CONTACT_HEADER, "contacts_export.csv")
 
 
-async def export_segments(
-    db: AsyncSession
-) -> StreamingResponse:
+async def export_segments() -> StreamingResponse:
     """
     Export segments to CSV format.
 
-    Args:
-        db: Database session
-
     Returns:
         StreamingResponse with CSV content
     """
-    query = select(Segment).order_by(Segment.created_at.desc())
-
-    result = await db.execute(query)
-    segments = result.scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow([
-        "ID",
-        "Name",
-        "Description",
-        "Created By",
-        "Created At",
-        "Updated At"
-    ])
-
-    for segment in segments:
-        writer.writerow([
-            str(segment.id),
-            segment.name,
-            segment.description or "",
-            str(segment.created_by),
-            segment.created_at.isoformat(),
-            segment.updated_at.isoformat()
-        ])
-
-    output.seek(0)
-
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=segments_export.csv"
-        }
-    )
+    query = select(
+        _text(Segment.id),
+        Segment.name,
+        _text(Segment.description),
+        _text(Segment.created_by),
+        _timestamp(Segment.created_at),
+        _timestamp(Segment.updated_at)
+    ).order_by(Segment.created_at.desc())
+
+    return _csv_response(query, SEGMENT_HEADER, "segments_export.csv")
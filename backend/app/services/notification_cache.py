@@ -0,0 +1,51 @@
+"""
+Short-lived cache of per-user notification stats.
+
+Every open tab polls /notifications/stats for the unread badge, while a
+user's notifications change rarely. Stats are kept in-process for a few
+seconds and dropped whenever a notification is created for the user or
+marked read.
+"""
+
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from app.schemas.notification import NotificationStats
+
+# user_id -> stats
+_stats: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+
+
+def get_stats(user_id: UUID) -> NotificationStats | None:
+    """
+    Return cached notification stats for a user, if present.
+
+    Args:
+        user_id: UUID of user
+
+    Returns:
+        Cached NotificationStats, or None on a miss
+    """
+    return _stats.get(user_id)
+
+
+def put_stats(user_id: UUID, stats: NotificationStats) -> None:
+    """
+    Store notification stats for a user.
+
+    Args:
+        user_id: UUID of user
+        stats: Stats to cache
+    """
+    _stats[user_id] = stats
+
+
+def invalidate(user_id: UUID) -> None:
+    """
+    Drop a user's cached notification stats.
+
+    Args:
+        user_id: UUID of user
+    """
+    _stats.pop(user_id, None)
@@ -1,11 +1,14 @@
 """Notification service layer for business logic."""
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import ARRAY, any_, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import after_commit
 from app.models.notification import Notification, NotificationTypeEnum
 from app.schemas.notification import NotificationStats
+from app.services import notification_cache
 
 
 async def create_notification(
@@ -50,6 +53,7 @@ async def create_notification(
     db.add(notification)
     await db.flush()
     await db.refresh(notification)
+    after_commit(db, notification_cache.invalidate, user_id)
 
     return notification
 
@@ -85,33 +89,6 @@ async def get_notifications(
     return list(result.scalars().all())
 
 
-async def count_notifications(
-    db: AsyncSession,
-    user_id: UUID,
-    is_read: bool | None = None
-) -> int:
-    """
-    Count total notifications for a user.
-
-    Args:
-        db: Database session
-        user_id: UUID of user
-        is_read: Optional filter by read status
-
-    Returns:
-        Total count of notifications
-    """
-    query = select(func.count()).select_from(Notification).where(
-        Notification.user_id == user_id
-    )
-
-    if is_read is not None:
-        query = query.where(Notification.is_read == is_read)
-
-    result = await db.execute(query)
-    return result.scalar() or 0
-
-
 async def mark_read(
     db: AsyncSession,
     notification_id: UUID,
@@ -142,6 +119,7 @@ async def mark_read(
     notification.is_read = True
     await db.flush()
     await db.refresh(notification)
+    after_commit(db, notification_cache.invalidate, user_id)
 
     return notification
 
@@ -171,6 +149,7 @@ async def mark_all_read(
 
     result = await db.execute(stmt)
     await db.flush()
+    after_commit(db, notification_cache.invalidate, user_id)
 
     return result.rowcount or 0
 
@@ -191,10 +170,13 @@ async def bulk_mark_read(
     Returns:
         Number of notifications updated
     """
+    # One array parameter keeps the statement identical for any batch size
+    ids_param = bindparam("notification_ids", notification_ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+
     stmt = (
         update(Notification)
         .where(
-            Notification.id.in_(notification_ids),
+            Notification.id == any_(ids_param),
             Notification.user_id == user_id
         )
         .values(is_read=True)
@@ -202,6 +184,7 @@ async def bulk_mark_read(
 
     result = await db.execute(stmt)
     await db.flush()
+    after_commit(db, notification_cache.invalidate, user_id)
 
     return result.rowcount or 0
 
@@ -213,6 +196,9 @@ async def get_stats(
     """
     Get notification statistics for a user.
 
+    Served from a short-lived per-user cache (see notification_cache), which
+    every write in this module invalidates.
+
     Args:
         db: Database session
         user_id: UUID of user
@@ -220,7 +206,19 @@ async def get_stats(
     Returns:
         NotificationStats with total and unread counts
     """
-    total = await count_notifications(db, user_id)
-    unread = await count_notifications(db, user_id, is_read=False)
+    stats = notification_cache.get_stats(user_id)
+    if stats is not None:
+        return stats
+
+    # Both counts from one scan of the user's notifications
+    query = select(
+        func.count(),
+        func.count().filter(Notification.is_read == False)
+    ).where(Notification.user_id == user_id)
+
+    result = await db.execute(query)
+    total, unread = result.one()
 
-    return NotificationStats(total=total, unread=unread)
+    stats = NotificationStats(total=total, unread=unread)
+    notification_cache.put_stats(user_id, stats)
+    return stats
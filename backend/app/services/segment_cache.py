@@ -0,0 +1,69 @@
+"""
+Short-lived cache of the segment and offering list pages.
+
+Every screen with a segment or offering picker requests these lists, while
+the catalogs themselves change rarely. Serialized pages are kept in-process
+for a short while and dropped whenever a segment or offering is created,
+edited, or archived. Segment statistics (company/contact counts) are not
+tracked by the invalidation and may lag by up to the TTL.
+"""
+
+from cachetools import TTLCache
+
+# (skip, limit, status, search) -> JSON-ready page body
+_segment_pages: TTLCache = TTLCache(maxsize=1_000, ttl=30)
+_offering_pages: TTLCache = TTLCache(maxsize=1_000, ttl=30)
+
+
+def get_segment_page(key: tuple) -> list[dict] | None:
+    """
+    Return a cached segment list page, if present.
+
+    Args:
+        key: (skip, limit, status, search) of the request
+
+    Returns:
+        Serialized page, or None on a miss
+    """
+    return _segment_pages.get(key)
+
+
+def put_segment_page(key: tuple, page: list[dict]) -> None:
+    """
+    Store a segment list page.
+
+    Args:
+        key: (skip, limit, status, search) of the request
+        page: Serialized page
+    """
+    _segment_pages[key] = page
+
+
+def get_offering_page(key: tuple) -> list[dict] | None:
+    """
+    Return a cached offering list page, if present.
+
+    Args:
+        key: (skip, limit, status, search) of the request
+
+    Returns:
+        Serialized page, or None on a miss
+    """
+    return _offering_pages.get(key)
+
+
+def put_offering_page(key: tuple, page: list[dict]) -> None:
+    """
+    Store an offering list page.
+
+    Args:
+        key: (skip, limit, status, search) of the request
+        page: Serialized page
+    """
+    _offering_pages[key] = page
+
+
+def invalidate() -> None:
+    """Drop every cached segment and offering page."""
+    _segment_pages.clear()
+    _offering_pages.clear()
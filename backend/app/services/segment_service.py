@@ -4,11 +4,12 @@ Segment and Offering service layer.
 Handles business logic for segment and offering CRUD operations.
 """
 
+import re
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import ColumnElement, literal_column, select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.models.company import Company, CompanyStatusEnum
 from app.models.contact import Contact
@@ -18,6 +19,78 @@ from app.schemas.segment import SegmentCreate, SegmentUpdate, OfferingCreate, Of
 
 # Segment Service Functions
 
+# Per-segment counts as correlated scalar subqueries, so they come back as extra
+# columns of the segment query itself (one round trip for any number of segments)
+_SEGMENT_STATS_COLUMNS = (
+    select(func.count())
+    .where(Company.segment_id == Segment.id)
+    .correlate(Segment)
+    .scalar_subquery()
+    .label("company_count"),
+    select(func.count())
+    .where(Contact.segment_id == Segment.id)
+    .correlate(Segment)
+    .scalar_subquery()
+    .label("contact_count"),
+    select(func.count())
+    .where(Company.segment_id == Segment.id, Company.status == CompanyStatusEnum.PENDING)
+    .correlate(Segment)
+    .scalar_subquery()
+    .label("pending_company_count"),
+)
+
+# Everything a segment response needs, loaded up front; any other relationship
+# access raises instead of lazy loading during serialization
+_SEGMENT_LOADER_OPTIONS = (
+    selectinload(Segment.offerings),
+    selectinload(Segment.created_by_user),
+    raiseload("*"),
+)
+
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def _search_condition(model: type[Segment] | type[Offering], search: str) -> ColumnElement[bool]:
+    """
+    Build the search filter for segments or offerings.
+
+    Every search is a substring match on name (served by the trigram index).
+    Several words additionally match word prefixes of name and description in
+    any order (served by the search_vector index), so partially typed words
+    still match: "health car" finds "Healthcare Cardiology".
+
+    Args:
+        model: Segment or Offering
+        search: Search string from the request
+
+    Returns:
+        SQL boolean expression
+    """
+    escaped = search.strip().replace("%", "\\%").replace("_", "\\_")
+    name_match = model.name.ilike(f"%{escaped}%")
+
+    # Split the way the 'simple' parser does; the words are then safe to use as tsquery lexemes
+    words = _WORD_PATTERN.findall(search)
+    if len(words) > 1:
+        prefix_query = " & ".join(f"{word}:*" for word in words)
+        return or_(
+            name_match,
+            model.search_vector.op("@@")(func.to_tsquery(literal_column("'simple'"), prefix_query))
+        )
+
+    return name_match
+
+
+def _stats(row) -> dict:
+    """Extract the stats columns of a segment row into a dict."""
+    return {
+        "company_count": row.company_count,
+        "contact_count": row.contact_count,
+        "pending_company_count": row.pending_company_count
+    }
+
+
 async def create_segment(
     db: AsyncSession,
     data: SegmentCreate,
@@ -75,42 +148,73 @@ async def get_segment(db: AsyncSession, segment_id: UUID) -> Segment | None:
     stmt = (
         select(Segment)
         .where(Segment.id == segment_id)
-        .options(selectinload(Segment.offerings), selectinload(Segment.created_by_user))
+        .options(*_SEGMENT_LOADER_OPTIONS)
     )
 
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
+async def get_segment_with_stats(db: AsyncSession, segment_id: UUID) -> tuple[Segment, dict] | None:
+    """
+    Get segment by ID with eager-loaded offerings and its statistics, in one query.
+
+    Args:
+        db: Database session
+        segment_id: Segment UUID
+
+    Returns:
+        Tuple of (Segment, dict with company_count, contact_count,
+        pending_company_count), or None if not found
+    """
+    stmt = (
+        select(Segment, *_SEGMENT_STATS_COLUMNS)
+        .where(Segment.id == segment_id)
+        .options(*_SEGMENT_LOADER_OPTIONS)
+    )
+
+    result = await db.execute(stmt)
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    return row.Segment, _stats(row)
+
+
 async def list_segments(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 50,
     status_filter: SegmentStatusEnum | None = None,
     search: str | None = None
-) -> list[Segment]:
+) -> list[tuple[Segment, dict]]:
     """
-    List segments with pagination and optional filters.
+    List segments with pagination, optional filters, and per-segment statistics.
+
+    The statistics are computed by correlated subqueries in the same query.
 
     Args:
         db: Database session
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
         status_filter: Optional status filter
-        search: Optional case-insensitive search on name
+        search: Optional search (name substring, or words in name and description)
 
     Returns:
-        List of Segment instances with offerings loaded
+        List of (Segment with offerings loaded, dict with company_count,
+        contact_count, pending_company_count) tuples
     """
-    stmt = select(Segment).options(selectinload(Segment.offerings), selectinload(Segment.created_by_user))
+    stmt = (
+        select(Segment, *_SEGMENT_STATS_COLUMNS)
+        .options(*_SEGMENT_LOADER_OPTIONS)
+    )
 
     # Apply filters
     conditions = []
     if status_filter:
         conditions.append(Segment.status == status_filter)
     if search:
-        escaped = search.replace("%", "\\%").replace("_", "\\_")
-        conditions.append(Segment.name.ilike(f"%{escaped}%"))
+        conditions.append(_search_condition(Segment, search))
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
@@ -119,7 +223,7 @@ async def list_segments(
     stmt = stmt.order_by(Segment.created_at.desc()).offset(skip).limit(limit)
 
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return [(row.Segment, _stats(row)) for row in result.all()]
 
 
 async def count_segments(
@@ -133,7 +237,7 @@ async def count_segments(
     Args:
         db: Database session
         status_filter: Optional status filter
-        search: Optional case-insensitive search on name
+        search: Optional search (name substring, or words in name and description)
 
     Returns:
         Total count of matching segments
@@ -145,8 +249,7 @@ async def count_segments(
     if status_filter:
         conditions.append(Segment.status == status_filter)
     if search:
-        escaped = search.replace("%", "\\%").replace("_", "\\_")
-        conditions.append(Segment.name.ilike(f"%{escaped}%"))
+        conditions.append(_search_condition(Segment, search))
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
@@ -229,50 +332,12 @@ async def archive_segment(db: AsyncSession, segment_id: UUID) -> Segment:
 
     segment.status = SegmentStatusEnum.ARCHIVED
 
+    # Offerings and creator are already loaded by get_segment
     await db.flush()
-    await db.refresh(segment)
 
     return segment
 
 
-async def get_segment_stats(db: AsyncSession, segment_id: UUID) -> dict:
-    """
-    Get statistics for a segment (company count, contact count, pending companies).
-
-    Args:
-        db: Database session
-        segment_id: Segment UUID
-
-    Returns:
-        Dictionary with company_count, contact_count, pending_company_count
-    """
-    # Count total companies in segment
-    company_count_stmt = select(func.count(Company.id)).where(Company.segment_id == segment_id)
-    company_result = await db.execute(company_count_stmt)
-    company_count = company_result.scalar() or 0
-
-    # Count pending companies in segment
-    pending_company_count_stmt = select(func.count(Company.id)).where(
-        and_(
-            Company.segment_id == segment_id,
-            Company.status == CompanyStatusEnum.PENDING
-        )
-    )
-    pending_result = await db.execute(pending_company_count_stmt)
-    pending_company_count = pending_result.scalar() or 0
-
-    # Count total contacts in segment
-    contact_count_stmt = select(func.count(Contact.id)).where(Contact.segment_id == segment_id)
-    contact_result = await db.execute(contact_count_stmt)
-    contact_count = contact_result.scalar() or 0
-
-    return {
-        "company_count": company_count,
-        "contact_count": contact_count,
-        "pending_company_count": pending_company_count
-    }
-
-
 # Offering Service Functions
 
 async def create_offering(db: AsyncSession, data: OfferingCreate) -> Offering:
@@ -330,7 +395,7 @@ async def list_offerings(
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
         status_filter: Optional status filter
-        search: Optional search string (case-insensitive name match)
+        search: Optional search (name substring, or words in name and description)
 
     Returns:
         List of Offering instances
@@ -343,7 +408,7 @@ async def list_offerings(
 
     # Apply search filter
     if search:
-        stmt = stmt.where(Offering.name.ilike(f"%{search}%"))
+        stmt = stmt.where(_search_condition(Offering, search))
 
     # Apply ordering and pagination
     stmt = stmt.order_by(Offering.created_at.desc()).offset(skip).limit(limit)
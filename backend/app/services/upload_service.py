@@ -1,23 +1,38 @@
 """Upload service for CSV file processing and duplicate detection."""
 import csv
 import io
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from functools import partial
+from typing import BinaryIO
 from uuid import UUID
 
 from fastapi import UploadFile
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, func, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-
-from app.models.company import Company, CompanyStatusEnum
-from app.models.contact import Contact, ContactStatusEnum
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import AsyncSessionLocal
+from app.core.pagination import paginate_with_total
+from app.models.base import uuid7_sequence
+from app.models.company import Company
+from app.models.contact import Contact
+from app.models.segment import Segment
 from app.models.upload_batch import (
     BatchStatusEnum,
     UploadBatch,
     UploadTypeEnum,
 )
-from app.schemas.company import CompanyCreate
-from app.schemas.contact import ContactCreate
-from pydantic import ValidationError
+from app.schemas.company import CompanyBase
+from app.schemas.contact import ContactBase
+from app.services import company_cache
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
 
 
 class UploadError:
@@ -36,6 +51,44 @@ class UploadError:
         }
 
 
+def _csv_rows(file: BinaryIO, fields: Iterable[str]) -> Iterator[dict[str, str | None]]:
+    """
+    Read the wanted columns of an uploaded CSV file row by row.
+
+    The file is decoded incrementally as rows are consumed, so it is never
+    held in memory as a whole, as bytes or as text. The header
+    is resolved to column positions once; each row then only touches the
+    wanted columns, stripped and with empty values as None.
+
+    Args:
+        file: CSV file opened in binary mode
+        fields: Column names to keep (others are ignored)
+
+    Yields:
+        One dict per data row with the wanted columns present in the header
+    """
+    text_stream = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    try:
+        reader = csv.reader(text_stream)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        wanted = set(fields)
+        columns = [(index, name) for index, name in enumerate(header) if name in wanted]
+
+        for row in reader:
+            if not row:
+                continue
+            yield {
+                name: (row[index].strip() or None) if index < len(row) else None
+                for index, name in columns
+            }
+    finally:
+        # Leave the caller's file open
+        text_stream.detach()
+
+
 async def create_batch(
     db: AsyncSession,
     upload_type: UploadTypeEnum,
@@ -101,9 +154,11 @@ async def list_batches(
     limit: int = 50,
     upload_type: UploadTypeEnum | None = None,
     status: BatchStatusEnum | None = None
-) -> list[UploadBatch]:
+) -> tuple[list[UploadBatch], int]:
     """
-    List upload batches with pagination and filters.
+    List upload batches with pagination and filters, along with the total match count.
+
+    The page and the total come back in one query (see paginate_with_total).
 
     Args:
         db: Database session
@@ -113,9 +168,9 @@ async def list_batches(
         status: Optional filter by batch status
 
     Returns:
-        List of UploadBatch instances
+        Tuple of (UploadBatch instances, total count of matching batches)
     """
-    query = select(UploadBatch).options(selectinload(UploadBatch.uploaded_by_user))
+    query = select(UploadBatch)
 
     if upload_type is not None:
         query = query.where(UploadBatch.upload_type == upload_type)
@@ -123,183 +178,200 @@ async def list_batches(
     if status is not None:
         query = query.where(UploadBatch.status == status)
 
-    query = query.order_by(UploadBatch.created_at.desc()).offset(skip).limit(limit)
-
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    batches, total, _ = await paginate_with_total(
+        db,
+        query.order_by(UploadBatch.created_at.desc()),
+        skip,
+        limit,
+        options=(selectinload(UploadBatch.uploaded_by_user),)
+    )
+    return batches, total
 
 
-async def count_batches(
-    db: AsyncSession,
-    upload_type: UploadTypeEnum | None = None,
-    status: BatchStatusEnum | None = None
-) -> int:
+def _parse_csv(
+    file: BinaryIO,
+    schema: type[BaseModel],
+    fields: tuple[str, ...],
+    extra_fields: tuple[str, ...] = ()
+) -> tuple[int, list[tuple[int, BaseModel, tuple]], list[UploadError]]:
     """
-    Count upload batches matching filters.
+    Read an uploaded CSV file and validate each row against a schema.
+
+    CPU-bound and free of database access, so it is run in a worker thread
+    before the import checks out a connection.
 
     Args:
-        db: Database session
-        upload_type: Optional filter by upload type
-        status: Optional filter by batch status
+        file: CSV file opened in binary mode
+        schema: Schema validating the row's fields
+        fields: Columns validated by the schema
+        extra_fields: Columns returned alongside the validated row instead
 
     Returns:
-        Count of matching batches
+        Tuple of (total rows read, (row number, validated row, extra values)
+        per valid row, UploadError list for invalid rows)
     """
-    query = select(func.count(UploadBatch.id))
+    total_rows = 0
+    parsed: list[tuple[int, BaseModel, tuple]] = []
+    errors: list[UploadError] = []
 
-    if upload_type is not None:
-        query = query.where(UploadBatch.upload_type == upload_type)
+    for row_number, row in enumerate(_csv_rows(file, fields + extra_fields), start=2):  # Start at 2 (header is row 1)
+        total_rows += 1
+        extras = tuple(row.pop(field, None) for field in extra_fields)
 
-    if status is not None:
-        query = query.where(UploadBatch.status == status)
+        try:
+            parsed.append((row_number, schema(**row), extras))
 
-    result = await db.execute(query)
-    return result.scalar_one()
+        except ValidationError as e:
+            # Collect all validation errors for this row
+            for error in e.errors():
+                field = error['loc'][0] if error['loc'] else 'unknown'
+                message = error['msg']
+                errors.append(UploadError(row_number, str(field), message))
+
+        except Exception as e:
+            errors.append(UploadError(row_number, 'general', str(e)))
+
+    return total_rows, parsed, errors
+
+
+async def resolve_upload_target(
+    db: AsyncSession,
+    company_id: UUID | None,
+    segment_id: UUID | None
+) -> UUID | None:
+    """
+    Check that the company and segment an upload is imported into exist.
+
+    Called by the upload endpoints, so a bad target is rejected before the
+    file is accepted for background import.
+
+    Args:
+        db: Database session
+        company_id: Optional company to assign all rows to
+        segment_id: Optional segment to import into
+
+    Returns:
+        Segment ID to import into (the company's segment when only company_id is given)
+
+    Raises:
+        ValueError: If the company or segment does not exist
+    """
+    if segment_id is not None:
+        found = await db.scalar(select(Segment.id).where(Segment.id == segment_id))
+        if found is None:
+            raise ValueError(f"Segment with id {segment_id} not found")
+
+    if company_id is not None:
+        company_segment_id = await db.scalar(select(Company.segment_id).where(Company.id == company_id))
+        if company_segment_id is None:
+            raise ValueError(f"Company with id {company_id} not found")
+        if segment_id is None:
+            segment_id = company_segment_id
+
+    return segment_id
+
+
+def _record_batch_result(
+    batch: UploadBatch,
+    total_rows: int,
+    valid_rows: int,
+    errors: list[UploadError]
+) -> None:
+    """Record an import's statistics and final status on its batch."""
+    batch.total_rows = total_rows
+    batch.valid_rows = valid_rows
+    batch.invalid_rows = total_rows - valid_rows
+    batch.status = BatchStatusEnum.COMPLETED if batch.invalid_rows == 0 else BatchStatusEnum.FAILED
+    if errors:
+        batch.error_report_url = f"/api/v1/uploads/{batch.id}/errors"
 
 
 async def process_company_csv(
     db: AsyncSession,
-    file: UploadFile,
+    batch_id: UUID,
+    file: BinaryIO,
     segment_id: UUID,
     created_by: UUID
-) -> tuple[UploadBatch, list[UploadError]]:
+) -> list[UploadError]:
     """
-    Process a company CSV upload.
+    Process a company CSV upload into its batch.
+
+    The file is parsed and validated in a worker thread first; the session
+    is only used afterwards, for the bulk insert and duplicate detection.
 
     Args:
         db: Database session
-        file: Uploaded CSV file
-        segment_id: Segment to assign companies to
+        batch_id: Upload batch to import into and record statistics on
+        file: CSV file opened in binary mode
+        segment_id: Segment to assign companies to (checked by resolve_upload_target)
         created_by: UUID of user uploading the file
 
     Returns:
-        Tuple of (UploadBatch, list of UploadError)
+        List of UploadError
     """
-    # Read file content
-    content = await file.read()
-    file_size_bytes = len(content)
-
-    # Create batch record
-    batch = await create_batch(
-        db=db,
-        upload_type=UploadTypeEnum.COMPANY,
-        file_name=file.filename or "unknown.csv",
-        file_size_bytes=file_size_bytes,
-        uploaded_by=created_by
+    total_rows, parsed, errors = await run_in_threadpool(
+        _parse_csv, file, CompanyBase, _COMPANY_DATA_FIELDS
     )
 
-    # Parse CSV
-    text_content = content.decode('utf-8')
-    csv_reader = csv.DictReader(io.StringIO(text_content))
+    # Stage the valid rows for the bulk COPY; status takes its 'pending' default
+    records = [
+        tuple(getattr(company_data, field) for field in _COMPANY_DATA_FIELDS)
+        + (segment_id, batch_id, created_by, row_number)
+        for row_number, company_data, _ in parsed
+    ]
 
-    errors: list[UploadError] = []
-    total_rows = 0
+    # Insert all valid rows at once; rows that already exist in the segment are skipped
     valid_rows = 0
-    invalid_rows = 0
-
-    # Schema field mapping (CSV header -> schema field)
-    schema_fields = {
-        'company_name', 'company_website', 'company_phone', 'company_description',
-        'company_linkedin_url', 'company_industry', 'company_sub_industry',
-        'street', 'city', 'state_province', 'country_region', 'zip_postal_code',
-        'founded_year', 'revenue_range', 'employee_size_range'
-    }
-
-    for row_number, row in enumerate(csv_reader, start=2):  # Start at 2 (header is row 1)
-        total_rows += 1
-
-        # Filter row to only include schema fields
-        filtered_row = {
-            key: value.strip() if isinstance(value, str) else value
-            for key, value in row.items()
-            if key in schema_fields
-        }
-
-        # Convert empty strings to None
-        for key in filtered_row:
-            if filtered_row[key] == '':
-                filtered_row[key] = None
-
-        # Add required segment_id
-        filtered_row['segment_id'] = str(segment_id)
-
-        # Validate against schema
-        try:
-            company_data = CompanyCreate(**filtered_row)
-
-            # Create company record
-            company = Company(
-                company_name=company_data.company_name,
-                company_website=company_data.company_website,
-                company_phone=company_data.company_phone,
-                company_description=company_data.company_description,
-                company_linkedin_url=company_data.company_linkedin_url,
-                company_industry=company_data.company_industry,
-                company_sub_industry=company_data.company_sub_industry,
-                street=company_data.street,
-                city=company_data.city,
-                state_province=company_data.state_province,
-                country_region=company_data.country_region,
-                zip_postal_code=company_data.zip_postal_code,
-                founded_year=company_data.founded_year,
-                revenue_range=company_data.revenue_range,
-                employee_size_range=company_data.employee_size_range,
-                segment_id=segment_id,
-                status=CompanyStatusEnum.PENDING,
-                batch_id=batch.id,
-                created_by=created_by
-            )
-
-            db.add(company)
-            valid_rows += 1
-
-        except ValidationError as e:
-            invalid_rows += 1
-            # Collect all validation errors for this row
-            for error in e.errors():
-                field = error['loc'][0] if error['loc'] else 'unknown'
-                message = error['msg']
-                errors.append(UploadError(row_number, str(field), message))
-
-        except Exception as e:
-            invalid_rows += 1
-            errors.append(UploadError(row_number, 'general', str(e)))
-
-    # Update batch statistics
-    batch.total_rows = total_rows
-    batch.valid_rows = valid_rows
-    batch.invalid_rows = invalid_rows
-    batch.status = BatchStatusEnum.COMPLETED if invalid_rows == 0 else BatchStatusEnum.FAILED
-
+    if records:
+        inserted = await _copy_rows(
+            db, 'companies', _COMPANY_COPY_COLUMNS, records,
+            conflict_constraint='unique_company_per_segment'
+        )
+        valid_rows, conflicts = _tally_inserted(
+            records,
+            inserted,
+            'company_name',
+            "Company with this name and website already exists in the segment"
+        )
+        errors.extend(conflicts)
+
+    batch = await db.get(UploadBatch, batch_id)
+    _record_batch_result(batch, total_rows, valid_rows, errors)
     await db.flush()
-    await db.refresh(batch)
 
     # Run duplicate detection if there were valid uploads
     if valid_rows > 0:
         await detect_company_duplicates(db, segment_id)
 
-    return batch, errors
+    return errors
 
 
 async def process_contact_csv(
     db: AsyncSession,
-    file: UploadFile,
+    batch_id: UUID,
+    file: BinaryIO,
     company_id: UUID | None,
     segment_id: UUID | None,
     created_by: UUID
-) -> tuple[UploadBatch, list[UploadError]]:
+) -> list[UploadError]:
     """
-    Process a contact CSV upload.
+    Process a contact CSV upload into its batch.
+
+    The file is parsed and validated in a worker thread first; the session
+    is only used afterwards, to match company names, bulk insert and run
+    duplicate detection.
 
     Args:
         db: Database session
-        file: Uploaded CSV file
+        batch_id: Upload batch to import into and record statistics on
+        file: CSV file opened in binary mode
         company_id: Optional company ID to assign all contacts to
-        segment_id: Optional segment ID (used if company_id not provided)
+        segment_id: Segment of company_id, or the segment to match company
+            names in (as returned by resolve_upload_target)
         created_by: UUID of user uploading the file
 
     Returns:
-        Tuple of (UploadBatch, list of UploadError)
+        List of UploadError
 
     Note:
         Either company_id or segment_id must be provided.
@@ -307,95 +379,29 @@ async def process_contact_csv(
         If segment_id is provided, contacts must have a company_name field
         to match against existing companies in that segment.
     """
-    # Read file content
-    content = await file.read()
-    file_size_bytes = len(content)
-
-    # Create batch record
-    batch = await create_batch(
-        db=db,
-        upload_type=UploadTypeEnum.CONTACT,
-        file_name=file.filename or "unknown.csv",
-        file_size_bytes=file_size_bytes,
-        uploaded_by=created_by
+    total_rows, parsed, errors = await run_in_threadpool(
+        _parse_csv, file, ContactBase, _CONTACT_DATA_FIELDS, ('company_name',)
     )
 
-    # Parse CSV
-    text_content = content.decode('utf-8')
-    csv_reader = csv.DictReader(io.StringIO(text_content))
-
-    errors: list[UploadError] = []
-    total_rows = 0
-    valid_rows = 0
-    invalid_rows = 0
-
-    # Schema field mapping
-    schema_fields = {
-        'first_name', 'last_name', 'email', 'mobile_phone', 'job_title',
-        'direct_phone_number', 'email_address_2', 'email_active_status',
-        'lead_source_global', 'management_level', 'street', 'city',
-        'state_province', 'country_region', 'zip_postal_code', 'primary_time_zone',
-        'contact_linkedin_url', 'linkedin_summary', 'data_requester_details'
-    }
-
-    # If company_id provided, look up its segment_id
-    if company_id and not segment_id:
-        company_obj = await db.execute(select(Company).where(Company.id == company_id))
-        company_row = company_obj.scalar_one_or_none()
-        if company_row:
-            segment_id = company_row.segment_id
-
-    # Build company name lookup if segment_id provided
+    # Build company name lookup if contacts are matched by company_name
     company_lookup = {}
-    if segment_id and not company_id:
-        query = select(Company).where(Company.segment_id == segment_id)
-        result = await db.execute(query)
-        companies = result.scalars().all()
+    if parsed and not company_id:
+        result = await db.execute(
+            select(Company.company_name, Company.id).where(Company.segment_id == segment_id)
+        )
         company_lookup = {
-            company.company_name.lower().strip(): company
-            for company in companies
+            company_name.lower().strip(): matched_id
+            for company_name, matched_id in result.all()
         }
 
-    for row_number, row in enumerate(csv_reader, start=2):
-        total_rows += 1
-
-        # Filter row to only include schema fields
-        filtered_row = {
-            key: value.strip() if isinstance(value, str) else value
-            for key, value in row.items()
-            if key in schema_fields
-        }
-
-        # Convert empty strings to None
-        for key in filtered_row:
-            if filtered_row[key] == '':
-                filtered_row[key] = None
-
-        # Determine company_id and segment_id for this contact
+    records: list[tuple] = []
+    for row_number, contact_data, (company_name_raw,) in parsed:
+        # Determine company_id for this contact
         contact_company_id = company_id
-        contact_segment_id = segment_id
 
         if not contact_company_id:
             # Try to match by company_name from CSV
-            company_name_raw = row.get('company_name', '').strip()
-            if company_name_raw:
-                company_name_key = company_name_raw.lower()
-                matched_company = company_lookup.get(company_name_key)
-                if matched_company:
-                    contact_company_id = matched_company.id
-                    contact_segment_id = matched_company.segment_id
-                else:
-                    invalid_rows += 1
-                    errors.append(
-                        UploadError(
-                            row_number,
-                            'company_name',
-                            f"Company '{company_name_raw}' not found in segment"
-                        )
-                    )
-                    continue
-            else:
-                invalid_rows += 1
+            if not company_name_raw:
                 errors.append(
                     UploadError(
                         row_number,
@@ -405,69 +411,266 @@ async def process_contact_csv(
                 )
                 continue
 
-        # Add required company_id
-        filtered_row['company_id'] = str(contact_company_id)
+            contact_company_id = company_lookup.get(company_name_raw.lower())
+            if contact_company_id is None:
+                errors.append(
+                    UploadError(
+                        row_number,
+                        'company_name',
+                        f"Company '{company_name_raw}' not found in segment"
+                    )
+                )
+                continue
 
-        # Validate against schema
-        try:
-            contact_data = ContactCreate(**filtered_row)
-
-            # Create contact record
-            contact = Contact(
-                first_name=contact_data.first_name,
-                last_name=contact_data.last_name,
-                email=contact_data.email,
-                mobile_phone=contact_data.mobile_phone,
-                job_title=contact_data.job_title,
-                direct_phone_number=contact_data.direct_phone_number,
-                email_address_2=contact_data.email_address_2,
-                email_active_status=contact_data.email_active_status,
-                lead_source_global=contact_data.lead_source_global,
-                management_level=contact_data.management_level,
-                street=contact_data.street,
-                city=contact_data.city,
-                state_province=contact_data.state_province,
-                country_region=contact_data.country_region,
-                zip_postal_code=contact_data.zip_postal_code,
-                primary_time_zone=contact_data.primary_time_zone,
-                contact_linkedin_url=contact_data.contact_linkedin_url,
-                linkedin_summary=contact_data.linkedin_summary,
-                data_requester_details=contact_data.data_requester_details,
-                company_id=contact_company_id,
-                segment_id=contact_segment_id,
-                status=ContactStatusEnum.UPLOADED,
-                batch_id=batch.id,
-                created_by=created_by
+        # Stage the row for the bulk COPY below
+        records.append(
+            tuple(getattr(contact_data, field) for field in _CONTACT_DATA_FIELDS)
+            + (contact_company_id, segment_id, batch_id, created_by, row_number)
+        )
+
+    # Insert all valid rows at once; rows that already exist for their company are skipped
+    valid_rows = 0
+    if records:
+        inserted = await _copy_rows(
+            db, 'contacts', _CONTACT_COPY_COLUMNS, records,
+            conflict_constraint='unique_contact_per_company'
+        )
+        valid_rows, conflicts = _tally_inserted(
+            records,
+            inserted,
+            'email',
+            "Contact with this email already exists for the company"
+        )
+        errors.extend(conflicts)
+
+    batch = await db.get(UploadBatch, batch_id)
+    _record_batch_result(batch, total_rows, valid_rows, errors)
+    await db.flush()
+
+    # Run duplicate detection if there were valid uploads
+    if valid_rows > 0 and contact_company_id:
+        await detect_contact_duplicates(db, contact_company_id)
+
+    return errors
+
+
+async def spool_upload(file: UploadFile) -> str:
+    """
+    Copy an uploaded file to a temporary file that outlives the request.
+
+    Args:
+        file: Uploaded CSV file
+
+    Returns:
+        Path of the temporary file; the background import deletes it
+    """
+    def copy() -> str:
+        with tempfile.NamedTemporaryFile(prefix="upload-", suffix=".csv", delete=False) as spooled:
+            shutil.copyfileobj(file.file, spooled)
+            return spooled.name
+
+    await file.seek(0)
+    return await run_in_threadpool(copy)
+
+
+async def _run_upload(
+    batch_id: UUID,
+    path: str,
+    process: Callable[[AsyncSession, UUID, BinaryIO], Awaitable[list[UploadError]]]
+) -> None:
+    """
+    Import a spooled CSV into its batch in a session of its own.
+
+    Any unexpected error marks the batch failed; the spooled file is always
+    removed.
+
+    Args:
+        batch_id: Upload batch created by the upload request
+        path: Spooled CSV file from spool_upload
+        process: process_*_csv with its upload-specific arguments bound
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            with open(path, "rb") as file:
+                errors = await process(db, batch_id, file)
+            await db.commit()
+
+        logger.info("Upload batch %s processed: %d errors", batch_id, len(errors))
+    except Exception:
+        logger.exception("Upload batch %s failed", batch_id)
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(UploadBatch)
+                .where(UploadBatch.id == batch_id)
+                .values(status=BatchStatusEnum.FAILED)
             )
+            await db.commit()
+    finally:
+        os.unlink(path)
 
-            db.add(contact)
-            valid_rows += 1
 
-        except ValidationError as e:
-            invalid_rows += 1
-            for error in e.errors():
-                field = error['loc'][0] if error['loc'] else 'unknown'
-                message = error['msg']
-                errors.append(UploadError(row_number, str(field), message))
+async def run_company_upload(
+    batch_id: UUID,
+    path: str,
+    segment_id: UUID,
+    created_by: UUID
+) -> None:
+    """
+    Background task importing a spooled company CSV.
 
-        except Exception as e:
-            invalid_rows += 1
-            errors.append(UploadError(row_number, 'general', str(e)))
+    Args:
+        batch_id: Upload batch created by the upload request
+        path: Spooled CSV file from spool_upload
+        segment_id: Segment to assign companies to
+        created_by: UUID of user uploading the file
+    """
+    await _run_upload(
+        batch_id,
+        path,
+        partial(process_company_csv, segment_id=segment_id, created_by=created_by)
+    )
+    # Imported companies enter the approval queue
+    company_cache.invalidate_pending()
 
-    # Update batch statistics
-    batch.total_rows = total_rows
-    batch.valid_rows = valid_rows
-    batch.invalid_rows = invalid_rows
-    batch.status = BatchStatusEnum.COMPLETED if invalid_rows == 0 else BatchStatusEnum.FAILED
 
-    await db.flush()
-    await db.refresh(batch)
+async def run_contact_upload(
+    batch_id: UUID,
+    path: str,
+    company_id: UUID | None,
+    segment_id: UUID | None,
+    created_by: UUID
+) -> None:
+    """
+    Background task importing a spooled contact CSV.
 
-    # Run duplicate detection if there were valid uploads
-    if valid_rows > 0 and contact_company_id:
-        await detect_contact_duplicates(db, contact_company_id)
+    Args:
+        batch_id: Upload batch created by the upload request
+        path: Spooled CSV file from spool_upload
+        company_id: Optional company ID to assign all contacts to
+        segment_id: Segment to import into, as returned by resolve_upload_target
+        created_by: UUID of user uploading the file
+    """
+    await _run_upload(
+        batch_id,
+        path,
+        partial(process_contact_csv, company_id=company_id, segment_id=segment_id, created_by=created_by)
+    )
+
+
+# Company columns taken from the validated CSV row, in COPY column order
+_COMPANY_DATA_FIELDS = (
+    'company_name', 'company_website', 'company_phone', 'company_description',
+    'company_linkedin_url', 'company_industry', 'company_sub_industry',
+    'street', 'city', 'state_province', 'country_region', 'zip_postal_code',
+    'founded_year', 'revenue_range', 'employee_size_range'
+)
+_COMPANY_COPY_COLUMNS = _COMPANY_DATA_FIELDS + ('segment_id', 'batch_id', 'created_by')
+
+# Contact columns taken from the validated CSV row, in COPY column order
+_CONTACT_DATA_FIELDS = (
+    'first_name', 'last_name', 'email', 'mobile_phone', 'job_title',
+    'direct_phone_number', 'email_address_2', 'email_active_status',
+    'lead_source_global', 'management_level', 'street', 'city',
+    'state_province', 'country_region', 'zip_postal_code', 'primary_time_zone',
+    'contact_linkedin_url', 'linkedin_summary', 'data_requester_details'
+)
+_CONTACT_COPY_COLUMNS = _CONTACT_DATA_FIELDS + ('company_id', 'segment_id', 'batch_id', 'created_by')
+
+
+async def _copy_rows(
+    db: AsyncSession,
+    table: str,
+    columns: tuple[str, ...],
+    records: list[tuple],
+    conflict_constraint: str
+) -> set[int]:
+    """
+    Bulk insert upload rows through a COPY into a staging table.
+
+    Rows are streamed with asyncpg's binary COPY into a temporary table, then
+    moved into the target table with ON CONFLICT DO NOTHING, so rows that hit
+    the table's dedup key are skipped instead of failing the whole upload.
+    Rows get ids that increase in CSV row order: they all share the
+    transaction's created_at, so the id is what keeps the file's first row
+    of a duplicate group the one left unflagged by _mark_duplicates.
+    Inserted rows are reported by CSV row number, through their id, so rows
+    with equal business keys (e.g. a NULL website, which never conflicts)
+    are told apart. Runs inside the session's transaction.
+
+    Args:
+        db: Database session (must be backed by asyncpg)
+        table: Target table
+        columns: Target columns, in record order
+        records: Tuples of column values followed by the CSV row number
+        conflict_constraint: Unique constraint whose conflicts are skipped
+
+    Returns:
+        Set of CSV row numbers that were inserted
+    """
+    staging = f"{table}_upload_staging"
+    column_list = ', '.join(columns)
+
+    await db.execute(text(f"""
+        CREATE TEMP TABLE {staging}
+        (LIKE {table} INCLUDING DEFAULTS, row_number INTEGER NOT NULL)
+        ON COMMIT DROP
+    """))
+
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        staging,
+        records=[
+            (row_id,) + record
+            for row_id, record in zip(uuid7_sequence(len(records)), records)
+        ],
+        columns=('id',) + columns + ('row_number',)
+    )
+
+    result = await db.execute(text(f"""
+        WITH inserted AS (
+            INSERT INTO {table} (id, {column_list})
+            SELECT id, {column_list}
+            FROM {staging}
+            ORDER BY row_number
+            ON CONFLICT ON CONSTRAINT {conflict_constraint} DO NOTHING
+            RETURNING id
+        )
+        SELECT {staging}.row_number
+        FROM {staging}
+        JOIN inserted USING (id)
+    """))
+    inserted = set(result.scalars().all())
+
+    await db.execute(text(f"DROP TABLE {staging}"))
+
+    return inserted
+
+
+def _tally_inserted(
+    records: list[tuple],
+    inserted: set[int],
+    field: str,
+    message: str
+) -> tuple[int, list[UploadError]]:
+    """
+    Split staged records into inserted rows and rows skipped as conflicts.
 
-    return batch, errors
+    Args:
+        records: Staged tuples, each ending with its CSV row number
+        inserted: CSV row numbers reported by _copy_rows
+        field: Field to report a skipped row against
+        message: Error message for a skipped row
+
+    Returns:
+        Tuple of (number of inserted rows, UploadError per skipped row)
+    """
+    errors = [
+        UploadError(record[-1], field, message)
+        for record in records
+        if record[-1] not in inserted
+    ]
+    return len(records) - len(errors), errors
 
 
 async def detect_company_duplicates(
@@ -478,7 +681,9 @@ async def detect_company_duplicates(
     Detect and mark duplicate companies within a segment.
 
     Uses case-insensitive exact match on company_name and company_website.
-    Marks all duplicates except the first one (by created_at) as is_duplicate=True.
+    Marks all duplicates except the first one (by created_at, then id) as
+    is_duplicate=True, in a single UPDATE that only touches rows whose flag
+    changes.
 
     Args:
         db: Database session
@@ -487,41 +692,14 @@ async def detect_company_duplicates(
     Returns:
         Number of companies marked as duplicates
     """
-    # Query all companies in the segment
-    query = (
-        select(Company)
-        .where(Company.segment_id == segment_id)
-        .order_by(Company.created_at.asc())
+    return await _mark_duplicates(
+        db,
+        Company,
+        Company.segment_id == segment_id,
+        (func.lower(func.trim(Company.company_name)),
+         func.lower(func.trim(func.coalesce(Company.company_website, ''))))
     )
 
-    result = await db.execute(query)
-    companies = list(result.scalars().all())
-
-    # Track seen companies by normalized key
-    seen: dict[str, Company] = {}
-    duplicates_marked = 0
-
-    for company in companies:
-        # Create normalized key (case-insensitive, handle None values)
-        name_key = company.company_name.lower().strip() if company.company_name else ''
-        website_key = company.company_website.lower().strip() if company.company_website else ''
-        key = f"{name_key}||{website_key}"
-
-        if key in seen:
-            # This is a duplicate - mark it
-            if not company.is_duplicate:
-                company.is_duplicate = True
-                duplicates_marked += 1
-        else:
-            # First occurrence - ensure it's not marked as duplicate
-            seen[key] = company
-            if company.is_duplicate:
-                company.is_duplicate = False
-
-    await db.flush()
-
-    return duplicates_marked
-
 
 async def detect_contact_duplicates(
     db: AsyncSession,
@@ -531,7 +709,9 @@ async def detect_contact_duplicates(
     Detect and mark duplicate contacts within a company.
 
     Uses case-insensitive exact match on email.
-    Marks all duplicates except the first one (by created_at) as is_duplicate=True.
+    Marks all duplicates except the first one (by created_at, then id) as
+    is_duplicate=True, in a single UPDATE that only touches rows whose flag
+    changes.
 
     Args:
         db: Database session
@@ -540,35 +720,54 @@ async def detect_contact_duplicates(
     Returns:
         Number of contacts marked as duplicates
     """
-    # Query all contacts for the company
-    query = (
-        select(Contact)
-        .where(Contact.company_id == company_id)
-        .order_by(Contact.created_at.asc())
+    return await _mark_duplicates(
+        db,
+        Contact,
+        Contact.company_id == company_id,
+        (func.lower(func.trim(func.coalesce(Contact.email, ''))),)
     )
 
-    result = await db.execute(query)
-    contacts = list(result.scalars().all())
-
-    # Track seen contacts by normalized email
-    seen: dict[str, Contact] = {}
-    duplicates_marked = 0
-
-    for contact in contacts:
-        # Create normalized email key
-        email_key = contact.email.lower().strip() if contact.email else ''
-
-        if email_key in seen:
-            # This is a duplicate - mark it
-            if not contact.is_duplicate:
-                contact.is_duplicate = True
-                duplicates_marked += 1
-        else:
-            # First occurrence - ensure it's not marked as duplicate
-            seen[email_key] = contact
-            if contact.is_duplicate:
-                contact.is_duplicate = False
 
-    await db.flush()
+async def _mark_duplicates(
+    db: AsyncSession,
+    model: type[Company] | type[Contact],
+    scope: ColumnElement[bool],
+    key: tuple[ColumnElement, ...]
+) -> int:
+    """
+    Flag every row but the earliest of each duplicate group, in one statement.
 
-    return duplicates_marked
+    Rows are ranked by (created_at, id); rows of one upload share created_at
+    and were given ids in CSV row order by _copy_rows.
+
+    Args:
+        db: Database session
+        model: Company or Contact
+        scope: Condition selecting the rows to compare with each other
+        key: Normalized expressions that make two rows duplicates
+
+    Returns:
+        Number of rows newly marked as duplicates
+    """
+    ranked = (
+        select(
+            model.id,
+            (
+                func.row_number().over(
+                    partition_by=key,
+                    order_by=(model.created_at, model.id)
+                ) > 1
+            ).label("duplicate")
+        )
+        .where(scope)
+        .subquery()
+    )
+
+    result = await db.execute(
+        update(model)
+        .where(model.id == ranked.c.id, model.is_duplicate.is_distinct_from(ranked.c.duplicate))
+        .values(is_duplicate=ranked.c.duplicate)
+        .returning(model.is_duplicate),
+        execution_options={"synchronize_session": False}
+    )
+    return sum(1 for (is_duplicate,) in result if is_duplicate)
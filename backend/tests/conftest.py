@@ -22,7 +22,7 @@ os.environ["SECRET_KEY"] = "test-secret-key-for-testing-only-not-for-production"
 os.environ["ENVIRONMENT"] = "test"
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_db_read
 from app.core.security import create_access_token, hash_password
 
 
@@ -79,12 +79,13 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """
     Create an async HTTP client for testing API endpoints.
-    Overrides the get_db dependency to use the test database.
+    Overrides the get_db and get_db_read dependencies to use the test database.
     """
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_read] = override_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
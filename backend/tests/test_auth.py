@@ -2,11 +2,17 @@
 Tests for authentication endpoints (login, refresh, me).
 """
 
+from uuid import uuid4
+
 import pytest
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import create_refresh_token
+from app.core import user_cache
+from app.core.database import get_db_read
+from app.core.security import create_access_token, create_refresh_token
+from app.main import app
 
 
 @pytest.mark.asyncio
@@ -198,3 +204,40 @@ class TestAuthEndpoints:
         response = await client.get("/api/v1/segments")
 
         assert response.status_code == 401
+
+
+class TestCurrentUserFromCache:
+    """Test /auth/me when the user is served from the user cache."""
+
+    def test_me_with_cached_user(self):
+        """Test that a cached user (id held as UUID) is returned by /auth/me."""
+        user_id = uuid4()
+        user_cache._user_cache[user_id] = {
+            "id": user_id,
+            "email": "cached@example.com",
+            "name": "Cached User",
+            "status": "active",
+            "roles": ["researcher"],
+            "has_assignments": False
+        }
+
+        async def no_db():
+            # A cache hit must not touch the database (the session has no bind)
+            yield AsyncSession()
+
+        app.dependency_overrides[get_db_read] = no_db
+        try:
+            token = create_access_token(data={"sub": str(user_id)})
+            response = TestClient(app).get(
+                "/api/v1/auth/me",
+                headers={"Authorization": f"Bearer {token}"}
+            )
+        finally:
+            app.dependency_overrides.clear()
+            user_cache.invalidate_user(user_id)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == str(user_id)
+        assert data["email"] == "cached@example.com"
+        assert data["roles"] == ["researcher"]
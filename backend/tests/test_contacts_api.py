@@ -2,10 +2,22 @@
 Integration tests for contacts API endpoints.
 """
 
+from datetime import datetime, timezone
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import user_cache
+from app.core.database import get_db, get_db_read
+from app.core.security import create_access_token
+from app.main import app
+from app.models.contact import ContactStatusEnum
+from app.schemas.contact import ContactResponse
+from app.services import contact_service
 
 
 @pytest.mark.asyncio
@@ -324,3 +336,75 @@ class TestContactsAPI:
 
         # May return 200 or 404 depending on implementation
         assert response.status_code in [200, 404, 405]
+
+
+@pytest.fixture
+def stubbed_contacts(monkeypatch):
+    """
+    Client for a cached researcher, with the contact service serving one contact.
+
+    Yields the client, the auth headers and the contact's id.
+    """
+    user_id = uuid4()
+    now = datetime(2026, 10, 16, 9, 30, tzinfo=timezone.utc)
+    fields = dict.fromkeys(ContactResponse.model_fields)
+    fields.update(
+        id=uuid4(),
+        company_id=uuid4(),
+        segment_id=uuid4(),
+        first_name="Jane",
+        last_name="Smith",
+        email="jane.smith@example.com",
+        status=ContactStatusEnum.APPROVED,
+        is_duplicate=False,
+        created_by=user_id,
+        created_by_name="Researcher",
+        approved_by_name="Approver",
+        approved_at=now,
+        created_at=now,
+        updated_at=now
+    )
+
+    async def get_contact_for_response(db, contact_id):
+        # The service returns plain column values, as a row mapping would
+        return dict(fields)
+
+    async def list_contacts(db, **filters):
+        return [SimpleNamespace(**fields)], 1
+
+    async def no_db():
+        yield AsyncSession()
+
+    user_cache._user_cache[user_id] = {
+        "id": user_id,
+        "email": "researcher@example.com",
+        "name": "Researcher",
+        "status": "active",
+        "roles": ["researcher"],
+        "has_assignments": False
+    }
+    monkeypatch.setattr(contact_service, "get_contact_for_response", get_contact_for_response)
+    monkeypatch.setattr(contact_service, "list_contacts", list_contacts)
+    app.dependency_overrides[get_db] = no_db
+    app.dependency_overrides[get_db_read] = no_db
+
+    token = create_access_token(data={"sub": str(user_id)})
+    yield TestClient(app), {"Authorization": f"Bearer {token}"}, fields["id"]
+
+    app.dependency_overrides.clear()
+    user_cache.invalidate_user(user_id)
+
+
+class TestContactSerialization:
+    """Test that contact detail and list responses serialize alike."""
+
+    def test_detail_matches_list_entry(self, stubbed_contacts):
+        """Test that the detail body equals the contact's list entry, datetimes included."""
+        client, headers, contact_id = stubbed_contacts
+
+        detail = client.get(f"/api/v1/contacts/{contact_id}", headers=headers)
+        listed = client.get("/api/v1/contacts", headers=headers)
+
+        assert detail.status_code == 200
+        assert detail.json() == listed.json()["contacts"][0]
+        assert detail.json()["created_at"] == "2026-10-16T09:30:00Z"
@@ -0,0 +1,72 @@
+"""
+Tests for HTTP conditional GET helpers (ETag / If-None-Match).
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from starlette.requests import Request
+
+from app.core.etag import etag_matches, make_etag, not_modified
+from app.routers.companies import _page_etag
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+class TestETag:
+    """Test ETag generation and If-None-Match matching."""
+
+    def test_make_etag_is_quoted_and_stable(self):
+        """Test that the same parts always produce the same quoted ETag."""
+        etag = make_etag(3, "2026-10-15T00:00:00+00:00")
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag(3, "2026-10-15T00:00:00+00:00")
+        assert etag != make_etag(4, "2026-10-15T00:00:00+00:00")
+
+    def test_etag_matches(self):
+        """Test exact, listed, weak, and wildcard If-None-Match values."""
+        etag = make_etag("company", 1)
+        assert etag_matches(_request(etag), etag)
+        assert etag_matches(_request(f'"other", {etag}'), etag)
+        assert etag_matches(_request(f"W/{etag}"), etag)
+        assert etag_matches(_request("*"), etag)
+
+    def test_etag_does_not_match(self):
+        """Test that a missing or stale If-None-Match does not match."""
+        etag = make_etag("company", 1)
+        assert not etag_matches(_request(), etag)
+        assert not etag_matches(_request(make_etag("company", 2)), etag)
+
+    def test_not_modified_has_no_body(self):
+        """Test that the 304 response carries the ETag and no body."""
+        etag = make_etag("company", 1)
+        response = not_modified(etag)
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.body == b""
+
+    def test_not_modified_repeats_cache_headers(self):
+        """Test that extra headers are carried on the 304 alongside the ETag."""
+        etag = make_etag("history", 1)
+        response = not_modified(etag, {"Cache-Control": "private, max-age=60"})
+        assert response.headers["Cache-Control"] == "private, max-age=60"
+        assert response.headers["ETag"] == etag
+
+
+class TestCompanyListETag:
+    """Test the company list page validator."""
+
+    def test_renamed_creator_changes_etag(self):
+        """Test that a joined display name change is not answered with a stale 304."""
+        company_id = uuid4()
+        last_updated = datetime(2026, 10, 15, tzinfo=timezone.utc)
+
+        def page(created_by_name):
+            return [SimpleNamespace(id=company_id, created_by_name=created_by_name, approved_by_name=None)]
+
+        assert _page_etag(page("Ann"), 1, last_updated) == _page_etag(page("Ann"), 1, last_updated)
+        assert _page_etag(page("Ann"), 1, last_updated) != _page_etag(page("Ann Lee"), 1, last_updated)
@@ -0,0 +1,63 @@
+"""
+Tests for model-level helpers (primary key generation, enum types).
+"""
+
+import time
+
+from app.models.base import enum_check, pg_enum, text_enum, uuid7
+from app.models.user import UserStatusEnum
+
+
+class TestUUID7:
+    """Test time-ordered primary key generation."""
+
+    def test_uuid7_version_and_variant(self):
+        """Test that uuid7 produces RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_uuid7_embeds_current_timestamp(self):
+        """Test that the leading 48 bits hold the Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_uuid7_is_time_ordered(self):
+        """Test that ids generated in later milliseconds sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
+
+    def test_uuid7_is_unique(self):
+        """Test that ids generated within the same millisecond differ."""
+        values = {uuid7() for _ in range(1000)}
+        assert len(values) == 1000
+
+
+class TestPgEnum:
+    """Test the PostgreSQL enum column type helper."""
+
+    def test_pg_enum_uses_member_values(self):
+        """Test that the column type persists enum values, not names."""
+        column_type = pg_enum(UserStatusEnum, "user_status")
+        assert column_type.name == "user_status"
+        assert column_type.enums == ["active", "deactivated"]
+
+
+class TestTextEnum:
+    """Test the CHECK-constrained TEXT enum helpers."""
+
+    def test_text_enum_is_not_native(self):
+        """Test that the column type does not reference a PostgreSQL enum type."""
+        column_type = text_enum(UserStatusEnum)
+        assert column_type.native_enum is False
+        assert column_type.enums == ["active", "deactivated"]
+
+    def test_enum_check_lists_member_values(self):
+        """Test that the CHECK constraint allows exactly the enum values."""
+        constraint = enum_check("status", UserStatusEnum, "user_status_check")
+        assert constraint.name == "user_status_check"
+        assert str(constraint.sqltext) == "status IN ('active', 'deactivated')"
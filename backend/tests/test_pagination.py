@@ -0,0 +1,137 @@
+"""
+Tests for keyset (cursor) pagination helpers.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    paginate_with_total,
+    parse_cursor_param,
+    set_next_cursor,
+)
+from app.models.company import Company
+
+
+class TestCursor:
+    """Test cursor encoding and decoding."""
+
+    def test_cursor_round_trip(self):
+        """Test that a decoded cursor returns the original position."""
+        created_at = datetime(2026, 10, 15, 12, 30, 45, 123456, tzinfo=timezone.utc)
+        row_id = uuid4()
+
+        cursor = encode_cursor(created_at, row_id)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, row_id)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "bm9waXBl", "!!!"])
+    def test_decode_rejects_malformed_cursor(self, cursor):
+        """Test that malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestCursorParam:
+    """Test the ?after= parameter and X-Next-Cursor header helpers."""
+
+    def test_parse_cursor_param_rejects_malformed_cursor_with_400(self):
+        """Test that a malformed ?after= value becomes a 400."""
+        assert parse_cursor_param(None) is None
+
+        with pytest.raises(HTTPException) as exc_info:
+            parse_cursor_param("not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+
+    def test_set_next_cursor_only_on_full_pages(self):
+        """Test that the next cursor points at the last row of a full page."""
+        rows = [
+            SimpleNamespace(created_at=datetime(2026, 10, 15, tzinfo=timezone.utc), id=uuid4())
+            for _ in range(2)
+        ]
+
+        partial = Response()
+        set_next_cursor(partial, rows, limit=3)
+        assert NEXT_CURSOR_HEADER not in partial.headers
+
+        full = Response()
+        set_next_cursor(full, rows, limit=2)
+        assert decode_cursor(full.headers[NEXT_CURSOR_HEADER]) == (rows[-1].created_at, rows[-1].id)
+
+
+def _paginate_companies(count: int, skip: int, limit: int):
+    """Page through count companies in an in-memory SQLite table."""
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Company.__table__.create)
+
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+            segment_id = uuid4()
+            db.add_all(
+                Company(
+                    id=uuid4(),
+                    company_name=f"Company {index}",
+                    segment_id=segment_id,
+                    created_by=uuid4(),
+                    created_at=start + timedelta(days=index),
+                    updated_at=start + timedelta(days=index)
+                )
+                for index in range(count)
+            )
+            await db.flush()
+
+            companies, total, (last_updated,) = await paginate_with_total(
+                db,
+                select(Company).order_by(Company.created_at),
+                skip,
+                limit,
+                func.max(Company.updated_at)
+            )
+
+        await engine.dispose()
+        return [company.company_name for company in companies], total, last_updated
+
+    # A private loop, so the default loop pytest-asyncio tests rely on is left set
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+class TestPaginateWithTotal:
+    """Test fetching an OFFSET page together with the total count."""
+
+    def test_page_carries_total_and_aggregates(self):
+        """Test that a page comes back with the count and aggregates over all matches."""
+        names, total, last_updated = _paginate_companies(3, skip=1, limit=1)
+
+        assert names == ["Company 1"]
+        assert total == 3
+        assert last_updated.replace(tzinfo=timezone.utc) == datetime(2026, 10, 3, tzinfo=timezone.utc)
+
+    def test_page_past_the_end_still_counts(self):
+        """Test that a page past the end falls back to a separate aggregate query."""
+        names, total, last_updated = _paginate_companies(3, skip=5, limit=2)
+
+        assert names == []
+        assert total == 3
+        assert last_updated is not None
+
+    def test_no_matches(self):
+        """Test that an empty first page reports zero and no aggregate values."""
+        assert _paginate_companies(0, skip=0, limit=2) == ([], 0, None)
@@ -5,7 +5,8 @@ Tests for security utilities (password hashing, JWT tokens).
 from datetime import timedelta
 
 import pytest
-from jose import JWTError
+from jwt.exceptions import InvalidTokenError as JWTError
+from passlib.hash import bcrypt
 
 from app.core.security import (
     hash_password,
@@ -13,6 +14,10 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
+    decode_token_cached,
+    decode_token_cached_async,
+    drop_cached_token,
+    password_needs_rehash,
 )
 
 
@@ -20,13 +25,23 @@ class TestPasswordHashing:
     """Test password hashing and verification."""
 
     def test_hash_password_creates_hash(self):
-        """Test that hash_password creates a bcrypt hash."""
+        """Test that hash_password creates an argon2id hash."""
         password = "testpassword123"
         hashed = hash_password(password)
 
         assert hashed is not None
         assert hashed != password
-        assert hashed.startswith("$2b$")  # bcrypt prefix
+        assert hashed.startswith("$argon2id$")  # argon2id prefix
+        assert password_needs_rehash(hashed) is False
+
+    def test_verify_legacy_bcrypt_hash(self):
+        """Test that existing bcrypt hashes still verify and are flagged for rehash."""
+        password = "testpassword123"
+        hashed = bcrypt.hash(password)
+
+        assert verify_password(password, hashed) is True
+        assert verify_password("wrongpassword", hashed) is False
+        assert password_needs_rehash(hashed) is True
 
     def test_verify_password_correct(self):
         """Test password verification with correct password."""
@@ -153,3 +168,56 @@ class TestJWTTokens:
         assert payload["sub"] == user_id
         assert payload["email"] == "test@example.com"
         assert payload["role"] == "admin"
+
+
+class TestTokenCache:
+    """Test cached JWT decoding."""
+
+    def test_cached_decode_matches_decode(self):
+        """Test that cached decoding returns the same payload as a fresh decode."""
+        user_id = "123e4567-e89b-12d3-a456-426614174000"
+        token = create_access_token(data={"sub": user_id})
+
+        assert decode_token_cached(token) == decode_token(token)
+        assert decode_token_cached(token)["sub"] == user_id
+
+    def test_cached_decode_rejects_invalid_token(self):
+        """Test that invalid tokens are not cached and still raise JWTError."""
+        with pytest.raises(JWTError):
+            decode_token_cached("invalid.token.here")
+
+        with pytest.raises(JWTError):
+            decode_token_cached("invalid.token.here")
+
+    def test_cached_decode_rejects_expired_token(self):
+        """Test that expired tokens raise JWTError through the cache."""
+        user_id = "123e4567-e89b-12d3-a456-426614174000"
+        token = create_access_token(
+            data={"sub": user_id},
+            expires_delta=timedelta(seconds=-1)
+        )
+
+        with pytest.raises(JWTError):
+            decode_token_cached(token)
+
+    def test_drop_cached_token(self):
+        """Test that dropping a token evicts it and allows re-verification."""
+        user_id = "123e4567-e89b-12d3-a456-426614174000"
+        token = create_access_token(data={"sub": user_id})
+
+        decode_token_cached(token)
+        drop_cached_token(token)
+        drop_cached_token(token)  # Dropping an absent token is a no-op
+
+        assert decode_token_cached(token)["sub"] == user_id
+
+    @pytest.mark.asyncio
+    async def test_cached_decode_async_matches_decode(self):
+        """Test that the async cached decode returns the same payload and still rejects bad tokens."""
+        user_id = "123e4567-e89b-12d3-a456-426614174000"
+        token = create_access_token(data={"sub": user_id})
+
+        assert await decode_token_cached_async(token) == decode_token(token)
+
+        with pytest.raises(JWTError):
+            await decode_token_cached_async("invalid.token.here")
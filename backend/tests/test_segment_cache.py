@@ -0,0 +1,127 @@
+"""
+Tests for the segment and offering list page cache.
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import user_cache
+from app.core.database import get_db, get_db_read
+from app.core.security import create_access_token
+from app.main import app
+from app.models.segment import Offering, OfferingStatusEnum
+from app.services import segment_cache, segment_service
+
+
+def _offering(name: str) -> Offering:
+    """Build an active offering without a database."""
+    now = datetime.now(timezone.utc)
+    return Offering(
+        id=uuid4(),
+        name=name,
+        description=None,
+        status=OfferingStatusEnum.ACTIVE,
+        created_at=now,
+        updated_at=now
+    )
+
+
+@pytest.fixture
+def admin_client(monkeypatch):
+    """
+    Client for an admin served from the user cache, with a database-less session.
+
+    The offering service is stubbed; yields the client, the auth headers and
+    a log of service calls and commits.
+    """
+    user_id = uuid4()
+    offerings = [_offering("Payments")]
+    calls = []
+
+    async def list_offerings(db, skip, limit, status_filter, search):
+        calls.append("list")
+        return list(offerings)
+
+    async def create_offering(db, data):
+        calls.append("create")
+        offering = _offering(data.name)
+        offerings.append(offering)
+        return offering
+
+    async def override_get_db():
+        session = AsyncSession()
+        yield session
+        # Record how many pages are still cached when the transaction commits
+        calls.append(("commit", len(segment_cache._offering_pages)))
+        await session.commit()
+
+    async def no_db():
+        yield AsyncSession()
+
+    user_cache._user_cache[user_id] = {
+        "id": user_id,
+        "email": "admin@example.com",
+        "name": "Admin",
+        "status": "active",
+        "roles": ["admin"],
+        "has_assignments": False
+    }
+    monkeypatch.setattr(segment_service, "list_offerings", list_offerings)
+    monkeypatch.setattr(segment_service, "create_offering", create_offering)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_read] = no_db
+    segment_cache.invalidate()
+
+    token = create_access_token(data={"sub": str(user_id)})
+    yield TestClient(app), {"Authorization": f"Bearer {token}"}, calls
+
+    app.dependency_overrides.clear()
+    user_cache.invalidate_user(user_id)
+    segment_cache.invalidate()
+
+
+class TestOfferingListCache:
+    """Test caching of GET /offerings/ pages."""
+
+    def test_repeat_request_served_from_cache(self, admin_client):
+        """Test that the first request fills the cache and the second is a hit."""
+        client, headers, calls = admin_client
+
+        first = client.get("/api/v1/offerings/", headers=headers)
+        second = client.get("/api/v1/offerings/", headers=headers)
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        assert calls.count("list") == 1
+
+    def test_different_page_is_a_miss(self, admin_client):
+        """Test that pages are cached per query parameters."""
+        client, headers, calls = admin_client
+
+        client.get("/api/v1/offerings/", headers=headers)
+        client.get("/api/v1/offerings/?status=active", headers=headers)
+
+        assert calls.count("list") == 2
+
+    def test_create_invalidates_after_commit(self, admin_client):
+        """Test that creating an offering drops cached pages once it is committed."""
+        client, headers, calls = admin_client
+        key = (0, 50, None, None)
+
+        client.get("/api/v1/offerings/", headers=headers)
+        assert segment_cache.get_offering_page(key) is not None
+
+        response = client.post("/api/v1/offerings/", headers=headers, json={"name": "Lending"})
+
+        assert response.status_code == 201
+        assert segment_cache.get_offering_page(key) is None
+        # The page was still cached at commit time and dropped only afterwards
+        assert calls[-2:] == ["create", ("commit", 1)]
+
+        names = [offering["name"] for offering in client.get("/api/v1/offerings/", headers=headers).json()]
+        assert names == ["Payments", "Lending"]
+        assert calls.count("list") == 2
@@ -0,0 +1,44 @@
+"""
+Tests for segment service helpers.
+"""
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.segment import Offering, Segment
+from app.services.segment_service import _search_condition
+
+
+def _sql(condition) -> str:
+    """Render a condition as Postgres SQL with its parameters inlined."""
+    return str(condition.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class TestSearchCondition:
+    """Test the segment and offering search filter."""
+
+    def test_single_word_is_name_substring(self):
+        """Test that one word is only a case-insensitive substring match on name."""
+        sql = _sql(_search_condition(Segment, " health "))
+
+        assert sql == "segments.name ILIKE '%%health%%'"
+
+    def test_like_wildcards_escaped(self):
+        """Test that % and _ in the search are matched literally."""
+        condition = _search_condition(Offering, "100%_")
+
+        assert condition.right.value == "%100\\%\\_%"
+
+    def test_several_words_add_prefix_full_text_match(self):
+        """Test that several words match word prefixes in any order, or the name substring."""
+        sql = _sql(_search_condition(Segment, "health car"))
+
+        assert sql == (
+            "segments.name ILIKE '%%health car%%' "
+            "OR (segments.search_vector @@ to_tsquery('simple', 'health:* & car:*'))"
+        )
+
+    def test_tsquery_syntax_stripped_from_words(self):
+        """Test that tsquery operators and quotes in the search never reach to_tsquery."""
+        sql = _sql(_search_condition(Offering, "acme's & (corp|inc):"))
+
+        assert "to_tsquery('simple', 'acme:* & s:* & corp:* & inc:*')" in sql
@@ -0,0 +1,187 @@
+"""
+Tests for upload service helpers.
+"""
+
+import asyncio
+import io
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.base import uuid7_sequence
+from app.models.company import Company
+from app.services.upload_service import _csv_rows, _tally_inserted, detect_company_duplicates
+
+SEGMENT_ID = uuid4()
+CREATED_AT = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+class TestCsvRows:
+    """Test reading the wanted columns of an uploaded CSV."""
+
+    FIELDS = ('company_name', 'company_website', 'city')
+
+    def _rows(self, content: bytes) -> list[dict]:
+        """Read the test fields from CSV bytes."""
+        return list(_csv_rows(io.BytesIO(content), self.FIELDS))
+
+    def test_short_rows_padded_with_none(self):
+        """Test that columns missing from a short row come back as None."""
+        rows = self._rows(b"company_name,company_website,city\nAcme\nGlobex,globex.com\n")
+
+        assert rows == [
+            {'company_name': 'Acme', 'company_website': None, 'city': None},
+            {'company_name': 'Globex', 'company_website': 'globex.com', 'city': None},
+        ]
+
+    def test_blank_lines_skipped(self):
+        """Test that blank lines do not produce rows."""
+        rows = self._rows(b"company_name,city\n\nAcme,Berlin\n\n\nGlobex,Paris\n\n")
+
+        assert [row['company_name'] for row in rows] == ['Acme', 'Globex']
+
+    def test_extra_columns_ignored(self):
+        """Test that unwanted header columns and cells past the header are dropped."""
+        rows = self._rows(b"notes,company_name,city\nhello,Acme,Berlin,surplus,cells\n")
+
+        assert rows == [{'company_name': 'Acme', 'city': 'Berlin'}]
+
+    def test_whitespace_values_become_none(self):
+        """Test that values are stripped and whitespace-only values become None."""
+        rows = self._rows(b"company_name,company_website,city\n  Acme  ,   ,\t\n")
+
+        assert rows == [{'company_name': 'Acme', 'company_website': None, 'city': None}]
+
+    def test_empty_file(self):
+        """Test that a file without a header yields no rows."""
+        assert self._rows(b"") == []
+
+    def test_file_left_open(self):
+        """Test that reading the rows does not close the caller's file."""
+        file = io.BytesIO(b"company_name\nAcme\n")
+
+        list(_csv_rows(file, self.FIELDS))
+
+        assert not file.closed
+
+
+class TestTallyInserted:
+    """Test matching inserted upload rows back to the CSV."""
+
+    def test_rows_matched_by_row_number(self):
+        """Test that rows with equal business keys are reported per row."""
+        # Same name and a NULL website never conflict, so both rows insert
+        records = [
+            ("Acme", None, 2),
+            ("Acme", None, 3),
+        ]
+
+        valid_rows, errors = _tally_inserted(records, {2, 3}, 'company_name', "exists")
+
+        assert valid_rows == 2
+        assert errors == []
+
+    def test_skipped_rows_reported_as_conflicts(self):
+        """Test that rows missing from the inserted set become errors."""
+        records = [
+            ("Acme", "acme.com", 2),
+            ("Acme", "acme.com", 3),
+            ("Globex", None, 4),
+        ]
+
+        valid_rows, errors = _tally_inserted(records, {2, 4}, 'company_name', "exists")
+
+        assert valid_rows == 2
+        assert [e.to_dict() for e in errors] == [
+            {"row_number": 3, "field": "company_name", "error": "exists"}
+        ]
+
+
+def _company(row_id, name, website=None, is_duplicate=False):
+    """Build a company in the test segment, created at CREATED_AT."""
+    return Company(
+        id=row_id,
+        company_name=name,
+        company_website=website,
+        segment_id=SEGMENT_ID,
+        created_by=uuid4(),
+        is_duplicate=is_duplicate,
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT
+    )
+
+
+def _run_mark_duplicates(companies):
+    """Insert companies into an in-memory SQLite table and run company duplicate detection twice."""
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Company.__table__.create)
+
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            db.add_all(companies)
+            await db.flush()
+            first = await detect_company_duplicates(db, SEGMENT_ID)
+            db.expire_all()
+            result = await db.execute(select(Company).order_by(Company.id))
+            rows = [(company.id, company.is_duplicate, company.updated_at) for company in result.scalars()]
+            second = await detect_company_duplicates(db, SEGMENT_ID)
+
+        await engine.dispose()
+        return first, rows, second
+
+    return asyncio.run(run())
+
+
+class TestMarkDuplicates:
+    """Test set-based duplicate flagging."""
+
+    def test_upload_ids_keep_row_order(self):
+        """Test that ids generated for one upload sort in row order."""
+        ids = uuid7_sequence(1000)
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 1000
+        assert all(row_id.version == 7 for row_id in ids)
+
+    def test_earliest_row_of_each_group_kept(self):
+        """Test that rows sharing created_at are ranked by id, i.e. upload row order."""
+        first_id, second_id, third_id, other_id = uuid7_sequence(4)
+        companies = [
+            _company(third_id, "acme ", "ACME.com"),
+            _company(first_id, "Acme", "acme.com"),
+            _company(other_id, "Globex"),
+            _company(second_id, "ACME", "acme.com"),
+        ]
+
+        marked, rows, _ = _run_mark_duplicates(companies)
+
+        assert marked == 2
+        assert [(row_id, is_duplicate) for row_id, is_duplicate, _ in rows] == [
+            (first_id, False),
+            (second_id, True),
+            (third_id, True),
+            (other_id, False),
+        ]
+
+    def test_unchanged_rows_not_updated(self):
+        """Test that only rows whose flag changes are written."""
+        first_id, second_id, other_id = uuid7_sequence(3)
+        companies = [
+            # Wrongly flagged earliest row is cleared; the correctly flagged one is left alone
+            _company(first_id, "Acme", is_duplicate=True),
+            _company(second_id, "Acme", is_duplicate=True),
+            _company(other_id, "Globex"),
+        ]
+
+        marked, rows, marked_again = _run_mark_duplicates(companies)
+
+        assert marked == 0
+        assert [is_duplicate for _, is_duplicate, _ in rows] == [False, True, False]
+        # Only the cleared row was touched (its updated_at moved)
+        assert [updated_at.replace(tzinfo=timezone.utc) == CREATED_AT for _, _, updated_at in rows] == [
+            False, True, True
+        ]
+        assert marked_again == 0
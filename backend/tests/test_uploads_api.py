@@ -0,0 +1,203 @@
+"""
+Tests for CSV upload endpoints and the background import.
+"""
+
+import asyncio
+import os
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, DefaultClause, MetaData, Table, Uuid, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core import user_cache
+from app.core.database import get_db, get_db_read
+from app.core.security import create_access_token
+from app.main import app
+from app.models.company import Company
+from app.models.upload_batch import BatchStatusEnum, UploadBatch
+from app.services import upload_service
+
+COMPANY_CSV = (
+    b"company_name,company_website,founded_year\n"
+    b"Acme,acme.com,1999\n"
+    b"Globex,globex.com,not-a-year\n"
+    b"Initech,initech.com,\n"
+)
+
+
+def _create_sqlite_tables(conn):
+    """
+    Create the tables the upload flow touches on SQLite.
+
+    users and segments only get the id the upload flow references (the full
+    segments table has a Postgres-only search_vector column), and now() server
+    defaults are spelled the SQLite way.
+    """
+    metadata = MetaData()
+    Table("users", metadata, Column("id", Uuid, primary_key=True))
+    Table("segments", metadata, Column("id", Uuid, primary_key=True))
+    for table in (Company.__table__, UploadBatch.__table__):
+        sqlite_table = table.to_metadata(metadata)
+        for column in sqlite_table.columns:
+            if column.server_default is not None and column.server_default.arg == "now()":
+                column.server_default = DefaultClause(text("CURRENT_TIMESTAMP"))
+    metadata.create_all(conn)
+
+
+@pytest.fixture
+def upload_env(monkeypatch):
+    """
+    Run the upload endpoints against an in-memory SQLite database.
+
+    The background import's own sessions use the same database. Yields the
+    session factory, the auth headers of a cached researcher and a segment id.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    user_id = uuid4()
+    segment_id = uuid4()
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(_create_sqlite_tables)
+            await conn.execute(
+                text("INSERT INTO segments (id) VALUES (:id)"),
+                {"id": segment_id.hex}
+            )
+
+    asyncio.run(setup())
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+            await session.commit()
+
+    async def no_db():
+        yield AsyncSession()
+
+    user_cache._user_cache[user_id] = {
+        "id": user_id,
+        "email": "researcher@example.com",
+        "name": "Researcher",
+        "status": "active",
+        "roles": ["researcher"],
+        "has_assignments": False
+    }
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_read] = no_db
+    monkeypatch.setattr(upload_service, "AsyncSessionLocal", session_factory)
+
+    token = create_access_token(data={"sub": str(user_id)})
+    yield session_factory, {"Authorization": f"Bearer {token}"}, segment_id
+
+    app.dependency_overrides.clear()
+    user_cache.invalidate_user(user_id)
+
+
+def _get_batch(session_factory, batch_id):
+    async def get():
+        async with session_factory() as db:
+            return await db.get(UploadBatch, batch_id)
+
+    return asyncio.run(get())
+
+
+class TestCompanyUpload:
+    """Test POST /uploads/companies and its background import."""
+
+    def test_upload_accepted_and_imported(self, upload_env, monkeypatch):
+        """Test that the upload returns 202 and the import records its statistics."""
+        session_factory, headers, segment_id = upload_env
+        staged = []
+
+        async def copy_rows(db, table, columns, records, conflict_constraint):
+            # COPY needs Postgres; report every staged row as inserted
+            staged.extend(records)
+            return {record[-1] for record in records}
+
+        monkeypatch.setattr(upload_service, "_copy_rows", copy_rows)
+
+        response = TestClient(app).post(
+            "/api/v1/uploads/companies",
+            headers=headers,
+            data={"segment_id": str(segment_id)},
+            files={"file": ("companies.csv", COMPANY_CSV, "text/csv")}
+        )
+
+        assert response.status_code == 202
+        assert response.json()["status"] == "processing"
+
+        # The background task has run by the time TestClient returns
+        batch = _get_batch(session_factory, UUID(response.json()["id"]))
+        assert [record[0] for record in staged] == ["Acme", "Initech"]
+        assert [record[-1] for record in staged] == [2, 4]
+        assert batch.total_rows == 3
+        assert batch.valid_rows == 2
+        assert batch.invalid_rows == 1
+        assert batch.status == BatchStatusEnum.FAILED
+
+    def test_failed_import_marks_batch_failed(self, upload_env, monkeypatch):
+        """Test that an unexpected import error marks the batch failed and removes the file."""
+        session_factory, headers, segment_id = upload_env
+        spooled = []
+        spool_upload = upload_service.spool_upload
+
+        async def record_spool(file):
+            path = await spool_upload(file)
+            spooled.append(path)
+            return path
+
+        async def copy_rows(db, table, columns, records, conflict_constraint):
+            raise RuntimeError("copy failed")
+
+        monkeypatch.setattr(upload_service, "spool_upload", record_spool)
+        monkeypatch.setattr(upload_service, "_copy_rows", copy_rows)
+
+        response = TestClient(app).post(
+            "/api/v1/uploads/companies",
+            headers=headers,
+            data={"segment_id": str(segment_id)},
+            files={"file": ("companies.csv", COMPANY_CSV, "text/csv")}
+        )
+
+        assert response.status_code == 202
+        batch = _get_batch(session_factory, UUID(response.json()["id"]))
+        assert batch.status == BatchStatusEnum.FAILED
+        assert not os.path.exists(spooled[0])
+
+    def test_unknown_segment_rejected(self, upload_env):
+        """Test that an upload into a missing segment is rejected before it is accepted."""
+        _, headers, _ = upload_env
+
+        response = TestClient(app).post(
+            "/api/v1/uploads/companies",
+            headers=headers,
+            data={"segment_id": str(uuid4())},
+            files={"file": ("companies.csv", COMPANY_CSV, "text/csv")}
+        )
+
+        assert response.status_code == 404
+
+
+class TestContactUpload:
+    """Test POST /uploads/contacts target validation."""
+
+    def test_unknown_company_rejected(self, upload_env):
+        """Test that an upload for a missing company is rejected before it is accepted."""
+        _, headers, _ = upload_env
+
+        response = TestClient(app).post(
+            "/api/v1/uploads/contacts",
+            headers=headers,
+            data={"company_id": str(uuid4())},
+            files={"file": ("contacts.csv", b"first_name,last_name,email\nA,B,a@b.com\n", "text/csv")}
+        )
+
+        assert response.status_code == 404
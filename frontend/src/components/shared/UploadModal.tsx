@@ -1,7 +1,7 @@
-import { useState, useCallback, useRef } from 'react';
+import { useState, useCallback, useRef, useEffect } from 'react';
 import { X, Upload, CheckCircle, AlertCircle, FileText } from 'lucide-react';
-import { useQuery } from '@tanstack/react-query';
-import { useUploadCompanies, useUploadContacts } from '../../hooks/useUploads';
+import { useQuery, useQueryClient } from '@tanstack/react-query';
+import { useUploadBatch, useUploadCompanies, useUploadContacts } from '../../hooks/useUploads';
 import { useSegments } from '../../hooks/useSegments';
 import { api } from '../../lib/api';
 import { UploadBatch } from '../../types';
@@ -18,8 +18,21 @@ export function UploadModal({ isOpen, onClose, uploadType, segmentId }: UploadMo
   const [selectedSegment, setSelectedSegment] = useState(segmentId || '');
   const [selectedCompany, setSelectedCompany] = useState('');
   const [isDragging, setIsDragging] = useState(false);
-  const [uploadResult, setUploadResult] = useState<UploadBatch | null>(null);
+  const [uploadedBatch, setUploadedBatch] = useState<UploadBatch | null>(null);
   const fileInputRef = useRef<HTMLInputElement>(null);
+  const queryClient = useQueryClient();
+
+  // The upload response is the batch while it is still processing; poll it until it settles
+  const { data: polledBatch } = useUploadBatch(uploadedBatch?.id ?? '');
+  const uploadResult = polledBatch ?? uploadedBatch;
+  const uploadStatus = uploadResult?.status;
+
+  useEffect(() => {
+    if (uploadStatus && uploadStatus !== 'processing') {
+      queryClient.invalidateQueries({ queryKey: ['upload-batches'] });
+      queryClient.invalidateQueries({ queryKey: [uploadType === 'company' ? 'companies' : 'contacts'] });
+    }
+  }, [uploadStatus, uploadType, queryClient]);
 
   const { data: segmentsData } = useSegments({ limit: 100 });
   const { data: companiesData, isLoading: isLoadingCompanies } = useQuery({
@@ -89,7 +102,7 @@ export function UploadModal({ isOpen, onClose, uploadType, segmentId }: UploadMo
       } else {
         result = await uploadContacts.mutateAsync(formData);
       }
-      setUploadResult(result);
+      setUploadedBatch(result);
     } catch (error) {
       // Error is handled by the mutation hook
       console.error('Upload failed:', error);
@@ -100,7 +113,7 @@ export function UploadModal({ isOpen, onClose, uploadType, segmentId }: UploadMo
     setFile(null);
     setSelectedSegment(segmentId || '');
     setSelectedCompany('');
-    setUploadResult(null);
+    setUploadedBatch(null);
     onClose();
   };
 
@@ -39,6 +39,8 @@ export function useUploadBatch(id: string) {
       return response.data;
     },
     enabled: !!id,
+    // Uploads are imported in the background; poll until the batch settles
+    refetchInterval: (query) => (query.state.data?.status === 'processing' ? 2000 : false),
   });
 }
 